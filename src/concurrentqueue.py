@@ -0,0 +1,494 @@
+"""
+Bounded multi-producer, multi-consumer queues for threads and for asyncio coroutines.
+
+Both queues wrap the ring buffer `queue.Queue` and use its `max_length` as the bound. A
+producer that finds the queue full waits for space, which pushes back on producers that run
+ahead of their consumers. `get_many` hands a consumer every waiting item, up to a limit, each
+time it wakes. Both queues count the high-water mark of their length and the time producers
+and consumers spend waiting, the numbers needed to size the bound.
+
+The standard library `queue` module, and its `Full` and `Empty` exceptions, are shadowed by
+`queue.py` in this directory, so this module defines its own.
+"""
+import asyncio
+import threading
+import time
+from typing import Any
+
+from queue import Queue
+
+
+class Full(Exception):
+    """
+    Raised when an item cannot be put on a full queue in time.
+    """
+
+
+class Empty(Exception):
+    """
+    Raised when no item can be taken from an empty queue in time.
+    """
+
+
+class QueueCounters:
+    """
+    The ring buffer and load counters shared by BoundedQueue and AsyncBoundedQueue.
+
+    Methods
+    -------
+    stats()
+        Return a snapshot of the counters.
+
+    Attributes
+    ----------
+    items : Queue
+        The ring buffer holding the items
+    high_water_mark : int
+        The largest number of items the queue has held
+    put_waits : int
+        The number of puts that had to wait for space
+    put_wait_seconds : float
+        The total time puts spent waiting for space
+    get_waits : int
+        The number of gets that had to wait for an item
+    get_wait_seconds : float
+        The total time gets spent waiting for an item
+    """
+    def __init__(self, max_length: int = -1) -> None:
+        """
+        Initialize an empty queue, bounded unless max_length is -1.
+
+        Parameters
+        ----------
+        max_length : int = -1
+            The maximum number of items, or -1 for an unbounded queue
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the provided max_length is less than -1
+        """
+        self.items = Queue(max_length)
+        self.high_water_mark = 0
+        self.put_waits = 0
+        self.put_wait_seconds = 0.0
+        self.get_waits = 0
+        self.get_wait_seconds = 0.0
+
+    @property
+    def max_length(self) -> int:
+        """
+        The maximum number of items, or -1 for an unbounded queue.
+
+        Returns
+        -------
+        int
+        """
+        return self.items.max_length
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the queue.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.items)
+
+    def is_full(self) -> bool:
+        """
+        Check if the queue holds max_length items.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self.items) == self.items.max_length
+
+    def add(self, item: Any) -> None:
+        """
+        Enqueue an item on a queue that has space and update the high-water mark.
+
+        Parameters
+        ----------
+        item : Any
+
+        Returns
+        -------
+        None
+        """
+        self.items.enqueue(item)
+        self.high_water_mark = max(self.high_water_mark, len(self.items))
+
+    def stats(self) -> dict:
+        """
+        Return a snapshot of the counters.
+
+        Returns
+        -------
+        dict
+            The keys "length", "max_length", "high_water_mark", "put_waits",
+            "put_wait_seconds", "get_waits" and "get_wait_seconds"
+        """
+        return {
+            "length": len(self.items),
+            "max_length": self.items.max_length,
+            "high_water_mark": self.high_water_mark,
+            "put_waits": self.put_waits,
+            "put_wait_seconds": self.put_wait_seconds,
+            "get_waits": self.get_waits,
+            "get_wait_seconds": self.get_wait_seconds,
+        }
+
+
+class BoundedQueue(QueueCounters):
+    """
+    A bounded queue that threads can share.
+
+    One lock guards the ring buffer. Producers wait on the `not_full` condition and consumers on
+    `not_empty`, so a put only wakes a consumer and a get only wakes producers.
+
+    Methods
+    -------
+    put(item, block=True, timeout=None)
+        Add an item, waiting for space if the queue is full.
+    get(block=True, timeout=None)
+        Remove and return the front item, waiting for one if the queue is empty.
+    get_many(max_items, timeout=None)
+        Remove and return up to max_items items, waiting only for the first one.
+    stats()
+        Return a snapshot of the counters.
+    """
+    def __init__(self, max_length: int = -1) -> None:
+        """
+        Initialize an empty queue, bounded unless max_length is -1.
+
+        Parameters
+        ----------
+        max_length : int = -1
+            The maximum number of items, or -1 for an unbounded queue
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the provided max_length is less than -1
+        """
+        super().__init__(max_length)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def wait(self, condition: threading.Condition, ready, block: bool, timeout: float | None) -> float | None:
+        """
+        Wait on a condition until ready() is true, with the lock held.
+
+        Parameters
+        ----------
+        condition : threading.Condition
+        ready : Callable[[], bool]
+        block : bool
+        timeout : float | None
+            The longest time to wait in seconds, or None to wait as long as it takes
+
+        Returns
+        -------
+        float | None
+            The seconds spent waiting, or None if ready() was already true
+
+        Raises
+        ------
+        TimeoutError
+            If ready() is still false when the timeout expires, or at once if `block` is false
+        """
+        if ready():
+            return None
+        if not block:
+            raise TimeoutError
+        start = time.monotonic()
+        if not condition.wait_for(ready, timeout):
+            raise TimeoutError
+        return time.monotonic() - start
+
+    def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        """
+        Add an item, waiting for space if the queue is full.
+
+        Parameters
+        ----------
+        item : Any
+        block : bool = True
+            Wait for space, otherwise raise Full at once if the queue is full
+        timeout : float | None = None
+            The longest time to wait in seconds, or None to wait as long as it takes
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        Full
+            If the queue is still full when the timeout expires
+        """
+        with self.lock:
+            try:
+                waited = self.wait(self.not_full, lambda: not self.is_full(), block, timeout)
+            except TimeoutError:
+                raise Full("put to a full queue") from None
+            if waited is not None:
+                self.put_waits += 1
+                self.put_wait_seconds += waited
+            self.add(item)
+            self.not_empty.notify()
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """
+        Remove and return the front item, waiting for one if the queue is empty.
+
+        Parameters
+        ----------
+        block : bool = True
+            Wait for an item, otherwise raise Empty at once if the queue is empty
+        timeout : float | None = None
+            The longest time to wait in seconds, or None to wait as long as it takes
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        Empty
+            If the queue is still empty when the timeout expires
+        """
+        with self.lock:
+            try:
+                waited = self.wait(self.not_empty, lambda: len(self.items) > 0, block, timeout)
+            except TimeoutError:
+                raise Empty("get from an empty queue") from None
+            if waited is not None:
+                self.get_waits += 1
+                self.get_wait_seconds += waited
+            item = self.items.dequeue()
+            self.not_full.notify()
+            return item
+
+    def get_many(self, max_items: int, timeout: float | None = None) -> list:
+        """
+        Remove and return up to max_items items, waiting only for the first one.
+
+        A consumer takes every waiting item, up to max_items, in one call and one wake-up.
+
+        Parameters
+        ----------
+        max_items : int
+        timeout : float | None = None
+            The longest time to wait for the first item in seconds, or None to wait as long
+            as it takes
+
+        Returns
+        -------
+        list
+            The items in queue order, empty if the timeout expired first
+
+        Raises
+        ------
+        ValueError
+            If max_items is less than one
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        with self.lock:
+            try:
+                waited = self.wait(self.not_empty, lambda: len(self.items) > 0, True, timeout)
+            except TimeoutError:
+                return []
+            if waited is not None:
+                self.get_waits += 1
+                self.get_wait_seconds += waited
+            items = self.items.dequeue_many(max_items)
+            self.not_full.notify(len(items))
+            return items
+
+
+class AsyncBoundedQueue(QueueCounters):
+    """
+    A bounded queue that asyncio coroutines can share, with the API of BoundedQueue.
+
+    Every method that can wait is a coroutine. The queue must be used from a single event loop.
+
+    Methods
+    -------
+    put(item, block=True, timeout=None)
+        Add an item, waiting for space if the queue is full.
+    get(block=True, timeout=None)
+        Remove and return the front item, waiting for one if the queue is empty.
+    get_many(max_items, timeout=None)
+        Remove and return up to max_items items, waiting only for the first one.
+    stats()
+        Return a snapshot of the counters.
+    """
+    def __init__(self, max_length: int = -1) -> None:
+        """
+        Initialize an empty queue, bounded unless max_length is -1.
+
+        Parameters
+        ----------
+        max_length : int = -1
+            The maximum number of items, or -1 for an unbounded queue
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the provided max_length is less than -1
+        """
+        super().__init__(max_length)
+        self.lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(self.lock)
+        self.not_full = asyncio.Condition(self.lock)
+
+    async def wait(self, condition: asyncio.Condition, ready, block: bool, timeout: float | None) -> float | None:
+        """
+        Wait on a condition until ready() is true, with the lock held.
+
+        Parameters
+        ----------
+        condition : asyncio.Condition
+        ready : Callable[[], bool]
+        block : bool
+        timeout : float | None
+            The longest time to wait in seconds, or None to wait as long as it takes
+
+        Returns
+        -------
+        float | None
+            The seconds spent waiting, or None if ready() was already true
+
+        Raises
+        ------
+        TimeoutError
+            If ready() is still false when the timeout expires, or at once if `block` is false
+        """
+        if ready():
+            return None
+        if not block:
+            raise TimeoutError
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(condition.wait_for(ready), timeout)
+        except asyncio.TimeoutError:
+            # asyncio.TimeoutError is only an alias of TimeoutError from Python 3.11
+            raise TimeoutError from None
+        return time.monotonic() - start
+
+    async def put(self, item: Any, block: bool = True, timeout: float | None = None) -> None:
+        """
+        Add an item, waiting for space if the queue is full.
+
+        Parameters
+        ----------
+        item : Any
+        block : bool = True
+            Wait for space, otherwise raise Full at once if the queue is full
+        timeout : float | None = None
+            The longest time to wait in seconds, or None to wait as long as it takes
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        Full
+            If the queue is still full when the timeout expires
+        """
+        async with self.lock:
+            try:
+                waited = await self.wait(self.not_full, lambda: not self.is_full(), block, timeout)
+            except TimeoutError:
+                raise Full("put to a full queue") from None
+            if waited is not None:
+                self.put_waits += 1
+                self.put_wait_seconds += waited
+            self.add(item)
+            self.not_empty.notify()
+
+    async def get(self, block: bool = True, timeout: float | None = None) -> Any:
+        """
+        Remove and return the front item, waiting for one if the queue is empty.
+
+        Parameters
+        ----------
+        block : bool = True
+            Wait for an item, otherwise raise Empty at once if the queue is empty
+        timeout : float | None = None
+            The longest time to wait in seconds, or None to wait as long as it takes
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        Empty
+            If the queue is still empty when the timeout expires
+        """
+        async with self.lock:
+            try:
+                waited = await self.wait(self.not_empty, lambda: len(self.items) > 0, block, timeout)
+            except TimeoutError:
+                raise Empty("get from an empty queue") from None
+            if waited is not None:
+                self.get_waits += 1
+                self.get_wait_seconds += waited
+            item = self.items.dequeue()
+            self.not_full.notify()
+            return item
+
+    async def get_many(self, max_items: int, timeout: float | None = None) -> list:
+        """
+        Remove and return up to max_items items, waiting only for the first one.
+
+        Parameters
+        ----------
+        max_items : int
+        timeout : float | None = None
+            The longest time to wait for the first item in seconds, or None to wait as long
+            as it takes
+
+        Returns
+        -------
+        list
+            The items in queue order, empty if the timeout expired first
+
+        Raises
+        ------
+        ValueError
+            If max_items is less than one
+        """
+        if max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        async with self.lock:
+            try:
+                waited = await self.wait(self.not_empty, lambda: len(self.items) > 0, True, timeout)
+            except TimeoutError:
+                return []
+            if waited is not None:
+                self.get_waits += 1
+                self.get_wait_seconds += waited
+            items = self.items.dequeue_many(max_items)
+            self.not_full.notify(len(items))
+            return items
@@ -0,0 +1,346 @@
+"""
+Memory and throughput of the sequence containers, compared on the same push and pop workload.
+
+`benchmark_containers` fills each container at the back with the same pre-built integers, then
+empties it from the back. `doublylinkedlist.LinkedList` needs one `Node` object per item, while
+`deque.Deque` stores BLOCK_SIZE items per block, like `collections.deque`. `benchmark_stacks`
+runs the same workload on the stacks, `stack_array.Stack`, `stack_linkedlist.Stack` and the
+typed `stack_array.NumericStack`, one item at a time and in slices.
+
+Usage
+-----
+python container_benchmark.py --sizes 100000 10000000
+"""
+import argparse
+import collections
+import time
+import tracemalloc
+
+from deque import Deque
+from doublylinkedlist import LinkedList, Node
+from stack_array import NumericStack, Stack
+import stack_linkedlist
+
+DEFAULT_SIZES = (10_000, 1_000_000, 10_000_000)
+# Items per push_many and pop_many call in the bulk stack workload
+STACK_CHUNK = 1024
+
+
+def fill_linked_list(values: list[int]) -> LinkedList:
+    """
+    Return a doubly linked list of the values, one Node per value, built with `append`.
+
+    Parameters
+    ----------
+    values : list[int]
+
+    Returns
+    -------
+    LinkedList
+    """
+    linked_list = LinkedList()
+    for value in values:
+        linked_list.append(Node(value))
+    return linked_list
+
+
+def pop_linked_list(linked_list: LinkedList) -> int:
+    """
+    Remove the tail node of a doubly linked list and return its data.
+
+    Parameters
+    ----------
+    linked_list : LinkedList
+
+    Returns
+    -------
+    int
+    """
+    node = linked_list.tail
+    linked_list.remove(node)
+    return node.data
+
+
+def fill_deque(values: list[int]) -> Deque:
+    """
+    Return a Deque of the values, built with `push_back`.
+
+    Parameters
+    ----------
+    values : list[int]
+
+    Returns
+    -------
+    Deque
+    """
+    deque = Deque()
+    for value in values:
+        deque.push_back(value)
+    return deque
+
+
+def fill_collections_deque(values: list[int]) -> collections.deque:
+    """
+    Return a `collections.deque` of the values, built with `append`.
+
+    Parameters
+    ----------
+    values : list[int]
+
+    Returns
+    -------
+    collections.deque
+    """
+    deque = collections.deque()
+    for value in values:
+        deque.append(value)
+    return deque
+
+
+def fill_list(values: list[int]) -> list:
+    """
+    Return a list of the values, built with `append`.
+
+    Parameters
+    ----------
+    values : list[int]
+
+    Returns
+    -------
+    list
+    """
+    items = []
+    for value in values:
+        items.append(value)
+    return items
+
+
+def pop_each(pop):
+    """
+    Return a function that empties a container of `size` items with one `pop` call per item.
+
+    Parameters
+    ----------
+    pop : Callable
+        Removes one item from the container
+
+    Returns
+    -------
+    Callable
+    """
+    def empty(container, size: int) -> None:
+        for _ in range(size):
+            pop(container)
+    return empty
+
+
+def fill_stack(stack, values: list[int]):
+    """
+    Push the values onto a stack one at a time and return it.
+
+    Parameters
+    ----------
+    stack : Stack | stack_linkedlist.Stack | NumericStack
+    values : list[int]
+
+    Returns
+    -------
+    Stack | stack_linkedlist.Stack | NumericStack
+    """
+    push = stack.push
+    for value in values:
+        push(value)
+    return stack
+
+
+def fill_numeric_stack_in_chunks(values: list[int]) -> NumericStack:
+    """
+    Return an unbounded NumericStack of the values, pushed STACK_CHUNK at a time with `push_many`.
+
+    Parameters
+    ----------
+    values : list[int]
+
+    Returns
+    -------
+    NumericStack
+    """
+    stack = NumericStack("q")
+    for start in range(0, len(values), STACK_CHUNK):
+        stack.push_many(values[start:start + STACK_CHUNK])
+    return stack
+
+
+def empty_numeric_stack_in_chunks(stack: NumericStack, size: int) -> None:
+    """
+    Pop every item of a NumericStack, STACK_CHUNK at a time with `pop_many`.
+
+    Parameters
+    ----------
+    stack : NumericStack
+    size : int
+
+    Returns
+    -------
+    None
+    """
+    while size > 0:
+        count = min(STACK_CHUNK, size)
+        stack.pop_many(count)
+        size -= count
+
+
+def benchmark_containers(sizes: tuple[int, ...] = DEFAULT_SIZES, containers: dict | None = None) -> list[dict]:
+    """
+    Measure the memory held by each container once filled, and the time to fill and empty it.
+
+    The integers are built before tracing starts, so memory is measured with `tracemalloc` as
+    the bytes the container itself adds: its nodes, blocks or arrays, but not the items.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] = DEFAULT_SIZES
+        The numbers of items
+    containers : dict | None = None
+        The containers to compare, each name mapped to a function that fills a container with
+        the values and a function that empties a container of a given size, CONTAINERS if None
+
+    Returns
+    -------
+    list[dict]
+        One entry per size and container with the keys "size", "container", "bytes_per_item",
+        "push_ns" and "pop_ns"
+    """
+    if containers is None:
+        containers = CONTAINERS
+    report = []
+    for size in sizes:
+        values = list(range(size))
+        for name, (fill, empty) in containers.items():
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            container = fill(values)
+            held = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del container
+
+            start = time.perf_counter()
+            container = fill(values)
+            push_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            empty(container, size)
+            pop_seconds = time.perf_counter() - start
+            del container
+            report.append({
+                "size": size,
+                "container": name,
+                "bytes_per_item": held / size,
+                "push_ns": push_seconds / size * 1e9,
+                "pop_ns": pop_seconds / size * 1e9,
+            })
+    return report
+
+
+
+def benchmark_stacks(sizes: tuple[int, ...] = DEFAULT_SIZES) -> list[dict]:
+    """
+    Measure the memory and push and pop time of each stack, as `benchmark_containers` does.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] = DEFAULT_SIZES
+
+    Returns
+    -------
+    list[dict]
+        One entry per size and stack, with the keys of `benchmark_containers`
+    """
+    return benchmark_containers(sizes, STACKS)
+
+
+def benchmark_stack_churn(rounds: int = 10_000, depth: int = 100) -> list[dict]:
+    """
+    Time a push and pop heavy workload, like a depth-first search that keeps a shallow stack.
+
+    Every round pushes `depth` items onto the same stack and pops them all again.
+
+    Parameters
+    ----------
+    rounds : int = 10_000
+    depth : int = 100
+
+    Returns
+    -------
+    list[dict]
+        One entry per stack with the keys "stack", "seconds" and "ops_per_second", counting
+        each push and each pop as one operation
+    """
+    values = list(range(depth))
+    report = []
+    for name, make in CHURN_STACKS.items():
+        stack = make()
+        push = stack.push
+        pop = stack.pop
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for value in values:
+                push(value)
+            for _ in values:
+                pop()
+        seconds = time.perf_counter() - start
+        report.append({
+            "stack": name,
+            "seconds": seconds,
+            "ops_per_second": 2 * rounds * depth / seconds,
+        })
+    return report
+
+
+# Each entry: fill a container with values, empty a container of a given size
+CONTAINERS = {
+    "LinkedList": (fill_linked_list, pop_each(pop_linked_list)),
+    "Deque": (fill_deque, pop_each(Deque.pop_back)),
+    "collections.deque": (fill_collections_deque, pop_each(collections.deque.pop)),
+    "list": (fill_list, pop_each(list.pop)),
+}
+
+STACKS = {
+    "linked list Stack": (lambda values: fill_stack(stack_linkedlist.Stack(), values),
+                          pop_each(stack_linkedlist.Stack.pop)),
+    "list Stack": (lambda values: fill_stack(Stack(), values), pop_each(Stack.pop)),
+    "NumericStack": (lambda values: fill_stack(NumericStack("q"), values), pop_each(NumericStack.pop)),
+    "NumericStack bound": (lambda values: fill_stack(NumericStack("q", len(values)), values),
+                           pop_each(NumericStack.pop)),
+    "NumericStack bulk": (fill_numeric_stack_in_chunks, empty_numeric_stack_in_chunks),
+}
+
+
+# Each entry: make an empty stack
+CHURN_STACKS = {
+    "linked list Stack": stack_linkedlist.Stack,
+    "linked list Stack pooled": lambda: stack_linkedlist.Stack(pool_size=-1),
+    "list Stack": Stack,
+    "NumericStack": lambda: NumericStack("q"),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    options = parser.parse_args()
+
+    print(f"{'size':>9} {'container':>18} {'bytes/item':>11} {'push ns':>9} {'pop ns':>9}")
+    for row in benchmark_containers(tuple(options.sizes)):
+        print(f"{row['size']:>9} {row['container']:>18} {row['bytes_per_item']:>11.1f} "
+              f"{row['push_ns']:>9.0f} {row['pop_ns']:>9.0f}")
+
+    print()
+    print(f"{'size':>9} {'stack':>18} {'bytes/item':>11} {'push ns':>9} {'pop ns':>9}")
+    for row in benchmark_stacks(tuple(options.sizes)):
+        print(f"{row['size']:>9} {row['container']:>18} {row['bytes_per_item']:>11.1f} "
+              f"{row['push_ns']:>9.0f} {row['pop_ns']:>9.0f}")
+
+    print()
+    print(f"{'churn workload':>26} {'seconds':>9} {'ops/s':>12}")
+    for row in benchmark_stack_churn():
+        print(f"{row['stack']:>26} {row['seconds']:>9.3f} {row['ops_per_second']:>12,.0f}")
@@ -0,0 +1,467 @@
+"""
+Implementation of the Deque abstract data type (ADT) with a linked list of blocks.
+"""
+from typing import Any, Iterable, Iterator
+
+# Items per block, at least 2. One block object and its list replace BLOCK_SIZE linked list nodes.
+BLOCK_SIZE = 64
+
+
+class Block:
+    """
+    A node of the deque's doubly linked list, holding up to BLOCK_SIZE items.
+
+    Attributes
+    ----------
+    data : list
+        BLOCK_SIZE slots, None where no item is stored
+    previous : Block | None
+    next : Block | None
+    """
+    __slots__ = ("data", "previous", "next")
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty, unlinked block.
+
+        Returns
+        -------
+        None
+        """
+        self.data = [None] * BLOCK_SIZE
+        self.previous = None
+        self.next = None
+
+
+class Deque:
+    """
+    Implementation of the deque abstract data type, as a doubly linked list of fixed-size blocks.
+
+    The items fill a run of slots that starts at `head_index` in the head block and ends at
+    `tail_index` in the tail block. Pushing or popping at either end only moves an index, and
+    links or unlinks a block once every BLOCK_SIZE items, so all four are O(1). Finding the
+    item at an index walks whole blocks from the nearer end, in O(n / BLOCK_SIZE).
+
+    With a `max_length`, the deque is a sliding window: pushing onto a full deque discards an
+    item from the opposite end.
+
+    Methods
+    -------
+    __init__(items=(), max_length=-1)
+        Initialize a deque, optionally with items and a maximum length.
+    push_front(item)
+        Add an item at the front.
+    push_back(item)
+        Add an item at the back.
+    pop_front()
+        Remove and return the front item.
+    pop_back()
+        Remove and return the back item.
+    peek_front()
+        Return the front item without removing it.
+    peek_back()
+        Return the back item without removing it.
+    extend(items)
+        Add items at the back, in order.
+    extendleft(items)
+        Add items at the front, one at a time, so they end up in reverse order.
+    get_length()
+        Return the number of items in the deque.
+    is_empty()
+        Check if the deque is empty.
+
+    Attributes
+    ----------
+    head_block : Block
+    tail_block : Block
+    head_index : int
+        The slot of the front item in the head block
+    tail_index : int
+        The slot of the back item in the tail block
+    length : int
+    max_length : int
+        The maximum number of items, or -1 for an unbounded deque
+    """
+    def __init__(self, items: Iterable[Any] = (), max_length: int = -1) -> None:
+        """
+        Initialize a deque, optionally with items and a maximum length.
+
+        If the max_length parameter is omitted or negative, the deque is unbounded. If the max_length
+        is non-negative, the deque keeps only the last max_length items pushed at the back.
+
+        Parameters
+        ----------
+        items : Iterable[Any] = ()
+            The initial items, from front to back
+        max_length : int = -1
+            The optional maximum length of the deque
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the provided max_length is less than -1
+        """
+        if max_length < -1:
+            raise ValueError("max_length must be -1 (for unbounded) or a non-negative integer")
+        self.max_length = max_length
+        self.head_block = self.tail_block = Block()
+        self.reset()
+        self.extend(items)
+
+    def reset(self) -> None:
+        """
+        Center the indices of an empty deque in its only block, so it can grow either way.
+
+        Returns
+        -------
+        None
+        """
+        self.head_index = BLOCK_SIZE // 2
+        self.tail_index = self.head_index - 1
+        self.length = 0
+
+    def push_back(self, item: Any) -> None:
+        """
+        Add an item at the back, discarding the front item if the deque is full.
+
+        Parameters
+        ----------
+        item : Any
+
+        Returns
+        -------
+        None
+        """
+        if self.length == self.max_length:
+            if self.max_length == 0:
+                return
+            self.pop_front()
+        if self.tail_index == BLOCK_SIZE - 1:
+            block = Block()
+            block.previous = self.tail_block
+            self.tail_block.next = block
+            self.tail_block = block
+            self.tail_index = -1
+        self.tail_index += 1
+        self.tail_block.data[self.tail_index] = item
+        self.length += 1
+
+    def push_front(self, item: Any) -> None:
+        """
+        Add an item at the front, discarding the back item if the deque is full.
+
+        Parameters
+        ----------
+        item : Any
+
+        Returns
+        -------
+        None
+        """
+        if self.length == self.max_length:
+            if self.max_length == 0:
+                return
+            self.pop_back()
+        if self.head_index == 0:
+            block = Block()
+            block.next = self.head_block
+            self.head_block.previous = block
+            self.head_block = block
+            self.head_index = BLOCK_SIZE
+        self.head_index -= 1
+        self.head_block.data[self.head_index] = item
+        self.length += 1
+
+    def pop_back(self) -> Any:
+        """
+        Remove and return the back item.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty
+        """
+        if self.length == 0:
+            raise IndexError("Cannot pop from an empty deque")
+        item = self.tail_block.data[self.tail_index]
+        self.tail_block.data[self.tail_index] = None
+        self.tail_index -= 1
+        self.length -= 1
+        if self.length == 0:
+            self.reset()
+        elif self.tail_index < 0:
+            self.tail_block = self.tail_block.previous
+            self.tail_block.next = None
+            self.tail_index = BLOCK_SIZE - 1
+        return item
+
+    def pop_front(self) -> Any:
+        """
+        Remove and return the front item.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty
+        """
+        if self.length == 0:
+            raise IndexError("Cannot pop from an empty deque")
+        item = self.head_block.data[self.head_index]
+        self.head_block.data[self.head_index] = None
+        self.head_index += 1
+        self.length -= 1
+        if self.length == 0:
+            self.reset()
+        elif self.head_index == BLOCK_SIZE:
+            self.head_block = self.head_block.next
+            self.head_block.previous = None
+            self.head_index = 0
+        return item
+
+    def peek_front(self) -> Any:
+        """
+        Return the front item without removing it.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty
+        """
+        if self.length == 0:
+            raise IndexError("Cannot peek into an empty deque")
+        return self.head_block.data[self.head_index]
+
+    def peek_back(self) -> Any:
+        """
+        Return the back item without removing it.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the deque is empty
+        """
+        if self.length == 0:
+            raise IndexError("Cannot peek into an empty deque")
+        return self.tail_block.data[self.tail_index]
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Add items at the back, in order, discarding items from the front beyond max_length.
+
+        Each block is filled with one slice assignment rather than one push per item.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+
+        Returns
+        -------
+        None
+        """
+        items = list(items)
+        if self.max_length >= 0:
+            items = items[len(items) - self.max_length:] if len(items) > self.max_length else items
+        position = 0
+        while position < len(items):
+            if self.tail_index == BLOCK_SIZE - 1:
+                block = Block()
+                block.previous = self.tail_block
+                self.tail_block.next = block
+                self.tail_block = block
+                self.tail_index = -1
+            count = min(BLOCK_SIZE - 1 - self.tail_index, len(items) - position)
+            self.tail_block.data[self.tail_index + 1:self.tail_index + 1 + count] = items[position:position + count]
+            self.tail_index += count
+            self.length += count
+            position += count
+        if self.max_length >= 0:
+            while self.length > self.max_length:
+                self.pop_front()
+
+    def extendleft(self, items: Iterable[Any]) -> None:
+        """
+        Add items at the front, one at a time, so that they end up in reverse order.
+
+        Items beyond max_length are discarded from the back. Each block is filled with one
+        slice assignment rather than one push per item.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+
+        Returns
+        -------
+        None
+        """
+        items = list(items)
+        if self.max_length >= 0:
+            items = items[len(items) - self.max_length:] if len(items) > self.max_length else items
+        position = 0
+        while position < len(items):
+            if self.head_index == 0:
+                block = Block()
+                block.next = self.head_block
+                self.head_block.previous = block
+                self.head_block = block
+                self.head_index = BLOCK_SIZE
+            count = min(self.head_index, len(items) - position)
+            self.head_block.data[self.head_index - count:self.head_index] = items[position:position + count][::-1]
+            self.head_index -= count
+            self.length += count
+            position += count
+        if self.max_length >= 0:
+            while self.length > self.max_length:
+                self.pop_back()
+
+    def locate(self, index: int) -> tuple[Block, int]:
+        """
+        Return the block and slot holding the item at an index, walking from the nearer end.
+
+        Parameters
+        ----------
+        index : int
+            Negative indices count from the back
+
+        Returns
+        -------
+        tuple[Block, int]
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range
+        """
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("deque index out of range")
+        if index < self.length // 2:
+            offset = self.head_index + index
+            block = self.head_block
+            for _ in range(offset // BLOCK_SIZE):
+                block = block.next
+            return block, offset % BLOCK_SIZE
+        offset = (BLOCK_SIZE - 1 - self.tail_index) + (self.length - 1 - index)
+        block = self.tail_block
+        for _ in range(offset // BLOCK_SIZE):
+            block = block.previous
+        return block, BLOCK_SIZE - 1 - offset % BLOCK_SIZE
+
+    def __getitem__(self, index: int) -> Any:
+        """
+        Return the item at an index, to allow `deque[index]`.
+
+        Parameters
+        ----------
+        index : int
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range
+        """
+        block, slot = self.locate(index)
+        return block.data[slot]
+
+    def __setitem__(self, index: int, item: Any) -> None:
+        """
+        Replace the item at an index, to allow `deque[index] = item`.
+
+        Parameters
+        ----------
+        index : int
+        item : Any
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        IndexError
+            If the index is out of range
+        """
+        block, slot = self.locate(index)
+        block.data[slot] = item
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the items from front to back.
+
+        Returns
+        -------
+        Iterator[Any]
+        """
+        block = self.head_block
+        start = self.head_index
+        remaining = self.length
+        while remaining > 0:
+            stop = min(BLOCK_SIZE, start + remaining)
+            yield from block.data[start:stop]
+            remaining -= stop - start
+            block = block.next
+            start = 0
+
+    def get_length(self) -> int:
+        """
+        Return the number of items in the deque.
+
+        Returns
+        -------
+        int
+        """
+        return len(self)
+
+    def __len__(self) -> int:
+        """
+        Override __len__ method to allow users to call `len(deque)`.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+        Check if the deque is empty.
+
+        Returns
+        -------
+        bool
+        """
+        return self.length == 0
+
+
+if __name__ == "__main__":
+    window = Deque(max_length=3)
+    window.extend([1, 2, 3, 4])
+    assert list(window) == [2, 3, 4]
+    window.push_front(0)
+    assert list(window) == [0, 2, 3]
+    assert window.pop_back() == 3
+    assert window[1] == 2 and window[-1] == 2
@@ -6,6 +6,9 @@ class Node:
     """
     The Node class implements a list node with three attributes, `data`, `next`, and `previous`.
     """
+    # No per-instance __dict__, which roughly halves the size of a node
+    __slots__ = ("data", "next", "previous")
+
     def __init__(self, initial_data: int):
         self.data = initial_data
         self.next = None
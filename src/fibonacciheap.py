@@ -0,0 +1,458 @@
+"""
+Implementation of a Fibonacci heap.
+
+A Fibonacci heap is a circular list of trees. Insert and meld only splice nodes into the root
+list, in O(1). Removing the root moves its children to the root list, then consolidates the
+trees so that no two roots have the same degree, in O(log n) amortized. Moving a node towards
+the root cuts it from its parent, and a parent that loses a second child is cut as well, which
+keeps decrease_key O(1) amortized.
+"""
+import operator
+from typing import Any
+
+from heap import PriorityQueue
+
+
+class FibonacciNode:
+    """
+    A node of a Fibonacci heap, and the handle returned by `FibonacciHeap.insert`.
+
+    Attributes
+    ----------
+    value : Any
+    parent : FibonacciNode | None
+    child : FibonacciNode | None
+        Any one of the children, which form a circular list
+    left : FibonacciNode
+    right : FibonacciNode
+        The neighbors in the circular list of siblings
+    degree : int
+        The number of children
+    marked : bool
+        Whether the node has lost a child since it became a child itself
+    """
+    __slots__ = ("value", "parent", "child", "left", "right", "degree", "marked")
+
+    def __init__(self, value: Any) -> None:
+        """
+        Initialize a node that is a circular list of its own.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        self.value = value
+        self.parent = None
+        self.child = None
+        self.left = self
+        self.right = self
+        self.degree = 0
+        self.marked = False
+
+
+def splice(first: FibonacciNode, second: FibonacciNode) -> None:
+    """
+    Join two circular lists into one.
+
+    Parameters
+    ----------
+    first : FibonacciNode
+        A node of the first list
+    second : FibonacciNode
+        A node of the second list
+
+    Returns
+    -------
+    None
+    """
+    first_right = first.right
+    second_left = second.left
+    first.right = second
+    second.left = first
+    second_left.right = first_right
+    first_right.left = second_left
+
+
+def unlink(node: FibonacciNode) -> None:
+    """
+    Take a node out of its circular list, leaving it a list of its own.
+
+    Parameters
+    ----------
+    node : FibonacciNode
+
+    Returns
+    -------
+    None
+    """
+    node.left.right = node.right
+    node.right.left = node.left
+    node.left = node
+    node.right = node
+
+
+class FibonacciHeap(PriorityQueue):
+    """
+    A max or min Fibonacci heap.
+
+    Methods
+    -------
+    insert(value)
+        Add a value and return its node.
+    remove()
+        Remove and return the value at the root.
+    peek()
+        Return the value at the root without removing it.
+    meld(other)
+        Move every value of another Fibonacci heap into this one in O(1).
+    delete(node)
+        Remove a node from anywhere in the heap and return its value.
+    decrease_key(node, value)
+        Lower the value of a node.
+    increase_key(node, value)
+        Raise the value of a node.
+    update(node, value)
+        Set the value of a node.
+
+    Attributes
+    ----------
+    max_heap : bool
+    top : FibonacciNode | None
+        The root whose value belongs at the top of the heap
+    length : int
+    """
+    def __init__(self, max_heap: bool = True) -> None:
+        """
+        Initialize an empty heap.
+
+        Parameters
+        ----------
+        max_heap : bool = True
+            Keep the largest value at the top, like MaxHeap, or the smallest if False
+
+        Returns
+        -------
+        None
+        """
+        self.max_heap = max_heap
+        # Strict comparison of two values, true when the first belongs nearer the top
+        self.precedes = operator.gt if max_heap else operator.lt
+        self.top = None
+        self.length = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of values in the heap.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def add_root(self, node: FibonacciNode) -> None:
+        """
+        Splice a single node into the root list and update the top.
+
+        Parameters
+        ----------
+        node : FibonacciNode
+
+        Returns
+        -------
+        None
+        """
+        node.parent = None
+        node.marked = False
+        if self.top is None:
+            self.top = node
+            return
+        splice(self.top, node)
+        if self.precedes(node.value, self.top.value):
+            self.top = node
+
+    def insert(self, value: Any) -> FibonacciNode:
+        """
+        Add a value and return its node, the handle for changing or deleting it later.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        FibonacciNode
+        """
+        node = FibonacciNode(value)
+        self.add_root(node)
+        self.length += 1
+        return node
+
+    def peek(self) -> Any:
+        """
+        Return the value at the top without removing it.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        if self.top is None:
+            raise IndexError("peek from an empty heap")
+        return self.top.value
+
+    def remove(self) -> Any:
+        """
+        Remove and return the value at the top.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        top = self.top
+        if top is None:
+            raise IndexError("remove from an empty heap")
+        if top.child is not None:
+            child = top.child
+            while True:
+                child.parent = None
+                child = child.right
+                if child is top.child:
+                    break
+            splice(top, top.child)
+            top.child = None
+            top.degree = 0
+        following = top.right
+        unlink(top)
+        self.length -= 1
+        if following is top:
+            self.top = None
+        else:
+            self.top = following
+            self.consolidate()
+        return top.value
+
+    def consolidate(self) -> None:
+        """
+        Link roots of equal degree until every root has a different degree, then find the top.
+
+        Returns
+        -------
+        None
+        """
+        roots = []
+        node = self.top
+        while True:
+            roots.append(node)
+            node = node.right
+            if node is self.top:
+                break
+        by_degree = {}
+        for root in roots:
+            unlink(root)
+            while root.degree in by_degree:
+                other = by_degree.pop(root.degree)
+                if self.precedes(other.value, root.value):
+                    root, other = other, root
+                # other becomes a child of root
+                other.parent = root
+                other.marked = False
+                if root.child is None:
+                    root.child = other
+                else:
+                    splice(root.child, other)
+                root.degree += 1
+            by_degree[root.degree] = root
+        self.top = None
+        for root in by_degree.values():
+            self.add_root(root)
+
+    def meld(self, other: "FibonacciHeap") -> None:
+        """
+        Move every value of another Fibonacci heap into this one in O(1), leaving the other empty.
+
+        Nodes keep their identity, so handles from the other heap stay valid in this one.
+        Melding a heap with itself leaves it unchanged.
+
+        Parameters
+        ----------
+        other : FibonacciHeap
+            A heap with the same ordering
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the other heap is ordered the other way
+        """
+        if other is self:
+            return
+        if other.max_heap != self.max_heap:
+            raise ValueError("cannot meld a max heap with a min heap")
+        if other.top is not None:
+            if self.top is None:
+                self.top = other.top
+            else:
+                splice(self.top, other.top)
+                if self.precedes(other.top.value, self.top.value):
+                    self.top = other.top
+        self.length += other.length
+        other.top = None
+        other.length = 0
+
+    def cut(self, node: FibonacciNode) -> None:
+        """
+        Move a node to the root list, then cut each ancestor that has now lost two children.
+
+        Parameters
+        ----------
+        node : FibonacciNode
+
+        Returns
+        -------
+        None
+        """
+        parent = node.parent
+        while parent is not None:
+            if parent.child is node:
+                parent.child = node.right if node.right is not node else None
+            unlink(node)
+            parent.degree -= 1
+            self.add_root(node)
+            if not parent.marked:
+                # A root never needs marking, only children count their lost children
+                parent.marked = parent.parent is not None
+                return
+            node = parent
+            parent = node.parent
+
+    def update(self, node: FibonacciNode, value: Any) -> None:
+        """
+        Set the value of a node.
+
+        A node moving towards the top is cut from its parent if it now belongs above it, in
+        O(1) amortized. A node moving away from the top is deleted and inserted again, in
+        O(log n) amortized.
+
+        Parameters
+        ----------
+        node : FibonacciNode
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        if self.precedes(node.value, value):
+            self.delete(node)
+            node.value = value
+            self.add_root(node)
+            self.length += 1
+            return
+        node.value = value
+        if node.parent is not None and self.precedes(value, node.parent.value):
+            self.cut(node)
+        elif self.precedes(value, self.top.value):
+            self.top = node
+
+    def delete(self, node: FibonacciNode) -> Any:
+        """
+        Remove a node from anywhere in the heap and return its value.
+
+        The node is cut to the root list, made the top, and removed as the top.
+
+        Parameters
+        ----------
+        node : FibonacciNode
+
+        Returns
+        -------
+        Any
+        """
+        if node.parent is not None:
+            self.cut(node)
+        self.top = node
+        return self.remove()
+
+    def decrease_key(self, node: FibonacciNode, value: Any) -> None:
+        """
+        Lower the value of a node, which is O(1) amortized in a min heap.
+
+        Parameters
+        ----------
+        node : FibonacciNode
+        value : Any
+            The new value, no larger than the current one
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the new value is larger than the current one
+        """
+        if value > node.value:
+            raise ValueError("decrease_key cannot raise a value")
+        self.update(node, value)
+
+    def increase_key(self, node: FibonacciNode, value: Any) -> None:
+        """
+        Raise the value of a node, which is O(1) amortized in a max heap.
+
+        Parameters
+        ----------
+        node : FibonacciNode
+        value : Any
+            The new value, no smaller than the current one
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the new value is smaller than the current one
+        """
+        if value < node.value:
+            raise ValueError("increase_key cannot lower a value")
+        self.update(node, value)
+
+
+if __name__ == "__main__":
+    heap = FibonacciHeap()
+    other = FibonacciHeap()
+    for value in (3, 9, 1):
+        heap.insert(value)
+    for value in (7, 2):
+        other.insert(value)
+    heap.meld(other)
+    assert len(heap) == 5 and len(other) == 0 and heap.peek() == 9
+    heap.meld(heap)
+    assert len(heap) == 5 and [heap.remove() for _ in range(5)] == [9, 7, 3, 2, 1]
+    empty = FibonacciHeap()
+    empty.meld(FibonacciHeap())
+    assert len(empty) == 0 and empty.top is None
+    try:
+        heap.meld(FibonacciHeap(max_heap=False))
+        assert False
+    except ValueError:
+        pass
@@ -1,7 +1,5 @@
-import queue
-import heapq
-import itertools
-
+from heap import IndexedHeap
+from queue import Queue
 from vertex import Vertex
 
 
@@ -38,20 +36,20 @@ class Graph:
         """
         distances = {}
         discovered_set = set()
-        frontier_queue = queue.SimpleQueue()
+        frontier_queue = Queue()
         visited_list = []
 
         distances[start_vertex] = 0
 
-        frontier_queue.put(start_vertex)
+        frontier_queue.enqueue(start_vertex)
         discovered_set.add(start_vertex)
 
-        while not frontier_queue.empty():
-            current_vertex = frontier_queue.get()
+        while not frontier_queue.is_empty():
+            current_vertex = frontier_queue.dequeue()
             visited_list.append(current_vertex)
             for adjacent_vertex in self.adjacency_list[current_vertex]:
                 if adjacent_vertex not in discovered_set:
-                    frontier_queue.put(adjacent_vertex)
+                    frontier_queue.enqueue(adjacent_vertex)
                     discovered_set.add(adjacent_vertex)
                     distances[adjacent_vertex] = distances[current_vertex] + 1
         return visited_list, distances
@@ -92,8 +90,9 @@ class Graph:
         """
         Compute shortest-path distances and predecessors from start_vertex using Dijkstra's algorithm.
 
-        A counter is implemented using itertools to act as a tie-breaker in instances where Vertices are
-        compared with equal distances.
+        Unvisited vertices wait in an IndexedHeap keyed by their tentative distance. Relaxing an edge
+        lowers the vertex's existing entry instead of pushing a duplicate, so the heap never holds more
+        than one entry per vertex, and only distances are ever compared.
 
         Parameters
         ----------
@@ -110,20 +109,18 @@ class Graph:
         distances = {v: float('inf') for v in self.adjacency_list}
         predecessors = {v: None for v in self.adjacency_list}
         distances[start_vertex] = 0
-        counter = itertools.count()
 
-        heap: list[tuple[float, int, Vertex]] = [(0, next(counter), start_vertex)]
-        while heap:
-            current_distance, _, u = heapq.heappop(heap)
-            if current_distance > distances[u]:
-                continue
+        unvisited = IndexedHeap()
+        unvisited.insert(start_vertex, 0)
+        while unvisited:
+            u, current_distance = unvisited.pop()
             for v in self.adjacency_list[u]:
                 weight = self.edge_weights.get((u, v), 1.0)
                 alt = current_distance + weight
                 if alt < distances[v]:
                     distances[v] = alt
                     predecessors[v] = u
-                    heapq.heappush(heap, (alt, next(counter), v))
+                    unvisited.update(v, alt)
 
         return distances, predecessors
 
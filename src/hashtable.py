@@ -0,0 +1,502 @@
+"""
+Implementation of a hash table with open addressing.
+
+Every item is stored in the table itself. A key's hash function gives its first bucket, and
+collisions are resolved by probing a sequence of further buckets:
+- linear probing tries (h + i) % N
+- quadratic probing tries (h + c1 * i + c2 * i^2) % N
+- double hashing tries (h + i * h2) % N, with a second step hash h2
+
+Buckets are empty-since-start, empty-after-removal (a tombstone, which a search must probe
+past) or occupied. The bucket states and the key hashes live in compact parallel `array`s next
+to the key and value lists, and the table is resized to the next prime of at least twice its
+size when its load factor grows past the maximum.
+"""
+from array import array
+from typing import Any, Callable, Iterator
+
+EMPTY_SINCE_START = 0
+EMPTY_AFTER_REMOVAL = 1
+OCCUPIED = 2
+PROBING_STRATEGIES = ("linear", "quadratic", "double")
+# Hashes are stored in an array('q'), so they are kept to 63 bits
+HASH_MASK = (1 << 63) - 1
+
+
+def modulo_hash(key: Any) -> int:
+    """
+    Return the key itself as its hash, so that the bucket is the key modulo the table size.
+
+    Keys that are not integers fall back to the built-in `hash`.
+
+    Parameters
+    ----------
+    key : Any
+
+    Returns
+    -------
+    int
+    """
+    return (key if isinstance(key, int) else hash(key)) & HASH_MASK
+
+
+def mid_square_hash(key: int) -> int:
+    """
+    Return the middle 32 bits of the binary square of a 64-bit integer key.
+
+    The middle bits of the square depend on every bit of the key, unlike the low bits
+    the modulo hash uses, so keys sharing a stride are still spread out. The middle is taken
+    from the square's actual width, so small keys do not all hash to zero.
+
+    Parameters
+    ----------
+    key : int
+
+    Returns
+    -------
+    int
+    """
+    squared = (key & 0xFFFF_FFFF_FFFF_FFFF) ** 2
+    return (squared >> max(0, (squared.bit_length() - 32) // 2)) & 0xFFFF_FFFF
+
+
+def multiplicative_string_hash(key: str) -> int:
+    """
+    Return the multiplicative string hash of a key, starting at 5381 and multiplying by 33.
+
+    Parameters
+    ----------
+    key : str
+
+    Returns
+    -------
+    int
+    """
+    string_hash = 5381
+    for character in key:
+        string_hash = (string_hash * 33 + ord(character)) & 0xFFFF_FFFF
+    return string_hash
+
+
+def next_prime(number: int) -> int:
+    """
+    Return the smallest prime at least as large as the number.
+
+    Parameters
+    ----------
+    number : int
+
+    Returns
+    -------
+    int
+    """
+    candidate = max(2, number)
+    while any(candidate % divisor == 0 for divisor in range(2, int(candidate ** 0.5) + 1)):
+        candidate += 1
+    return candidate
+
+
+class HashTable:
+    """
+    Implementation of a hash table using open addressing.
+
+    Methods
+    -------
+    bucket(key_hash, attempt)
+        Return the bucket examined by the given probe attempt.
+    insert(key, value)
+        Insert a key and value, or update the value if the key is already in the table.
+    search(key)
+        Return the value stored for the key, or None if the key is not in the table.
+    remove(key)
+        Remove the key, return True if it was in the table.
+    resize(new_size)
+        Rehash every item into a new set of buckets.
+    probe_length(key)
+        Return the number of buckets a search for the key examines.
+    load_factor()
+        Return the fraction of buckets that are not empty-since-start.
+    keys()
+        Iterate over the keys in bucket order.
+    items()
+        Iterate over the (key, value) pairs in bucket order.
+
+    Attributes
+    ----------
+    probing : str
+        "linear", "quadratic" or "double"
+    hash_function : Callable[[Any], int]
+    max_load_factor : float
+    c1 : int
+    c2 : int
+        The quadratic probing constants
+    states : array
+        The state of each bucket
+    hashes : array
+        The hash of the key in each occupied bucket
+    key_list : list
+    value_list : list
+    """
+    def __init__(self, probing: str = "linear", hash_function: Callable[[Any], int] = modulo_hash,
+                 initial_size: int = 11, max_load_factor: float = 0.5, c1: int = 1, c2: int = 1) -> None:
+        """
+        Initialize an empty hash table.
+
+        Parameters
+        ----------
+        probing : str = "linear"
+            The collision resolution strategy, "linear", "quadratic" or "double"
+        hash_function : Callable[[Any], int] = modulo_hash
+            Returns a non-negative integer hash of a key, the bucket is that hash modulo the size
+        initial_size : int = 11
+            The starting number of buckets, rounded up to a prime
+        max_load_factor : float = 0.5
+            The table is resized when more than this fraction of buckets is in use
+        c1 : int = 1
+        c2 : int = 1
+            The constants of quadratic probing
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the probing strategy is unknown, or the maximum load factor is not between 0 and 1
+        """
+        if probing not in PROBING_STRATEGIES:
+            raise ValueError(f"probing must be one of {', '.join(PROBING_STRATEGIES)}")
+        if not 0 < max_load_factor < 1:
+            raise ValueError("max_load_factor must be between 0 and 1")
+        self.probing = probing
+        self.hash_function = hash_function
+        self.max_load_factor = max_load_factor
+        self.c1 = c1
+        self.c2 = c2
+        self.item_count = 0
+        self.removed_count = 0
+        self.allocate(next_prime(max(3, initial_size)))
+
+    def allocate(self, size: int) -> None:
+        """
+        Replace the buckets with `size` empty-since-start buckets.
+
+        Parameters
+        ----------
+        size : int
+
+        Returns
+        -------
+        None
+        """
+        self.size = size
+        self.states = array("b", bytes(size))
+        self.hashes = array("q", bytes(8 * size))
+        self.key_list = [None] * size
+        self.value_list = [None] * size
+        self.removed_count = 0
+
+    def bucket(self, key_hash: int, attempt: int) -> int:
+        """
+        Return the bucket examined by the given probe attempt, the first attempt being 0.
+
+        Parameters
+        ----------
+        key_hash : int
+        attempt : int
+
+        Returns
+        -------
+        int
+        """
+        if self.probing == "linear":
+            return (key_hash + attempt) % self.size
+        if self.probing == "quadratic":
+            return (key_hash + self.c1 * attempt + self.c2 * attempt * attempt) % self.size
+        # The table size is prime, so any step between 1 and size - 1 reaches every bucket
+        step = 1 + (key_hash // self.size) % (self.size - 1)
+        return (key_hash + attempt * step) % self.size
+
+    def find_bucket(self, key: Any, key_hash: int) -> tuple[int, int]:
+        """
+        Return the bucket holding the key, and the number of buckets examined to find it.
+
+        The search stops at the first empty-since-start bucket, but probes past tombstones.
+
+        Parameters
+        ----------
+        key : Any
+        key_hash : int
+
+        Returns
+        -------
+        tuple[int, int]
+            The bucket, or -1 if the key is not in the table, and the probe count
+        """
+        states = self.states
+        for attempt in range(self.size):
+            bucket = self.bucket(key_hash, attempt)
+            state = states[bucket]
+            if state == EMPTY_SINCE_START:
+                return -1, attempt + 1
+            if state == OCCUPIED and self.hashes[bucket] == key_hash and self.key_list[bucket] == key:
+                return bucket, attempt + 1
+        return -1, self.size
+
+    def insert(self, key: Any, value: Any = None) -> None:
+        """
+        Insert a key and value, or update the value if the key is already in the table.
+
+        Parameters
+        ----------
+        key : Any
+        value : Any = None
+
+        Returns
+        -------
+        None
+        """
+        key_hash = self.hash_function(key) & HASH_MASK
+        bucket, _ = self.find_bucket(key, key_hash)
+        if bucket != -1:
+            self.value_list[bucket] = value
+            return
+        if (self.item_count + self.removed_count + 1) > self.max_load_factor * self.size:
+            self.resize()
+        # Quadratic probing may not reach every bucket, growing the table changes the sequence
+        while not self.place(key_hash, key, value):
+            self.resize(next_prime(2 * self.size))
+        self.item_count += 1
+
+    def place(self, key_hash: int, key: Any, value: Any) -> bool:
+        """
+        Store an item in the first bucket of its probe sequence that is not occupied.
+
+        Parameters
+        ----------
+        key_hash : int
+        key : Any
+        value : Any
+
+        Returns
+        -------
+        bool
+            False if the probe sequence has no free bucket
+        """
+        for attempt in range(self.size):
+            bucket = self.bucket(key_hash, attempt)
+            if self.states[bucket] != OCCUPIED:
+                if self.states[bucket] == EMPTY_AFTER_REMOVAL:
+                    self.removed_count -= 1
+                self.states[bucket] = OCCUPIED
+                self.hashes[bucket] = key_hash
+                self.key_list[bucket] = key
+                self.value_list[bucket] = value
+                return True
+        return False
+
+    def resize(self, new_size: int | None = None) -> None:
+        """
+        Rehash every item into a new set of buckets, which also clears every tombstone.
+
+        Parameters
+        ----------
+        new_size : int | None = None
+            Defaults to the next prime of at least twice the size, or to the current size
+            when the table is mostly full of tombstones rather than items
+
+        Returns
+        -------
+        None
+        """
+        if new_size is None:
+            new_size = self.size
+            if self.item_count + 1 > self.max_load_factor * self.size / 2:
+                new_size = next_prime(2 * self.size)
+        items = [(self.hashes[bucket], self.key_list[bucket], self.value_list[bucket])
+                 for bucket in range(self.size) if self.states[bucket] == OCCUPIED]
+        self.allocate(new_size)
+        while not all(self.place(key_hash, key, value) for key_hash, key, value in items):
+            self.allocate(next_prime(2 * self.size))
+
+    def search(self, key: Any) -> Any:
+        """
+        Return the value stored for the key, or None if the key is not in the table.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        Any
+        """
+        bucket, _ = self.find_bucket(key, self.hash_function(key) & HASH_MASK)
+        return None if bucket == -1 else self.value_list[bucket]
+
+    def remove(self, key: Any) -> bool:
+        """
+        Remove the key, return True if it was in the table.
+
+        The bucket is marked empty-after-removal, so that searches for keys inserted after
+        this one still probe past it.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        bool
+        """
+        bucket, _ = self.find_bucket(key, self.hash_function(key) & HASH_MASK)
+        if bucket == -1:
+            return False
+        self.states[bucket] = EMPTY_AFTER_REMOVAL
+        self.key_list[bucket] = None
+        self.value_list[bucket] = None
+        self.item_count -= 1
+        self.removed_count += 1
+        return True
+
+    def probe_length(self, key: Any) -> int:
+        """
+        Return the number of buckets a search for the key examines.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        int
+        """
+        return self.find_bucket(key, self.hash_function(key) & HASH_MASK)[1]
+
+    def load_factor(self) -> float:
+        """
+        Return the fraction of buckets that are not empty-since-start.
+
+        Returns
+        -------
+        float
+        """
+        return (self.item_count + self.removed_count) / self.size
+
+    def keys(self) -> Iterator[Any]:
+        """
+        Iterate over the keys in bucket order.
+
+        Returns
+        -------
+        Iterator[Any]
+        """
+        return (self.key_list[bucket] for bucket in range(self.size) if self.states[bucket] == OCCUPIED)
+
+    def items(self) -> Iterator[tuple[Any, Any]]:
+        """
+        Iterate over the (key, value) pairs in bucket order.
+
+        Returns
+        -------
+        Iterator[tuple[Any, Any]]
+        """
+        return ((self.key_list[bucket], self.value_list[bucket])
+                for bucket in range(self.size) if self.states[bucket] == OCCUPIED)
+
+    def __len__(self) -> int:
+        """
+        Return the number of items in the table.
+
+        Returns
+        -------
+        int
+        """
+        return self.item_count
+
+    def __contains__(self, key: Any) -> bool:
+        """
+        Check if the key is in the table, to allow `key in table`.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        bool
+        """
+        return self.find_bucket(key, self.hash_function(key) & HASH_MASK)[0] != -1
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Return the value stored for the key, to allow `table[key]`.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the table
+        """
+        bucket, _ = self.find_bucket(key, self.hash_function(key) & HASH_MASK)
+        if bucket == -1:
+            raise KeyError(key)
+        return self.value_list[bucket]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """
+        Insert or update a key, to allow `table[key] = value`.
+
+        Parameters
+        ----------
+        key : Any
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        self.insert(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        """
+        Remove a key, to allow `del table[key]`.
+
+        Parameters
+        ----------
+        key : Any
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If the key is not in the table
+        """
+        if not self.remove(key):
+            raise KeyError(key)
+
+
+if __name__ == "__main__":
+    for probing in PROBING_STRATEGIES:
+        table = HashTable(probing)
+        for number in range(0, 300, 3):
+            table.insert(number, str(number))
+        assert len(table) == 100
+        assert table.search(27) == "27"
+        assert table.remove(27) and 27 not in table
+        assert table.search(30) == "30"
+        assert table.search(28) is None
+    table = HashTable("double", multiplicative_string_hash)
+    table["Joe"] = 1
+    assert table["Joe"] == 1
@@ -0,0 +1,147 @@
+"""
+Benchmarks for `hashtable.HashTable`, compared against `dict` and `searching.linear_search`.
+
+Usage
+-----
+python hashtable_benchmark.py --sizes 1000 100000 --queries 100000
+"""
+import argparse
+import random
+import time
+
+from hashtable import HashTable, PROBING_STRATEGIES, mid_square_hash, modulo_hash, multiplicative_string_hash
+from searching import linear_search
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+DEFAULT_QUERIES = 100_000
+# linear_search is O(n) per lookup, so it is only timed over this many queries
+LINEAR_SEARCH_QUERIES = 200
+HASH_FUNCTIONS = {
+    "modulo": modulo_hash,
+    "mid_square": mid_square_hash,
+    "string": multiplicative_string_hash,
+}
+
+
+def make_keys(size: int, hash_name: str, generator: random.Random) -> list:
+    """
+    Return `size` distinct keys for the hash function, strings for the string hash.
+
+    Integer keys are multiples of 8, a stride that collides often under the modulo hash.
+
+    Parameters
+    ----------
+    size : int
+    hash_name : str
+    generator : random.Random
+
+    Returns
+    -------
+    list
+    """
+    keys = [8 * key for key in generator.sample(range(8 * size), size)]
+    if hash_name == "string":
+        return [f"key-{key}" for key in keys]
+    return keys
+
+
+def time_lookups(lookup, queries: list) -> float:
+    """
+    Return the average seconds per call of `lookup` over the queries.
+
+    Parameters
+    ----------
+    lookup : Callable
+    queries : list
+
+    Returns
+    -------
+    float
+    """
+    start = time.perf_counter()
+    for query in queries:
+        lookup(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def benchmark_hash_tables(sizes: tuple[int, ...] = DEFAULT_SIZES, queries: int = DEFAULT_QUERIES,
+                          max_load_factor: float = 0.5, seed: int = 0) -> list[dict]:
+    """
+    Time lookups of every probing strategy and hash function, and of `dict` and `linear_search`.
+
+    Half of the queries are keys in the table and half are misses.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] = DEFAULT_SIZES
+        The numbers of keys inserted
+    queries : int = DEFAULT_QUERIES
+    max_load_factor : float = 0.5
+    seed : int = 0
+
+    Returns
+    -------
+    list[dict]
+        One entry per size, hash function and structure with the keys "size", "hash",
+        "structure", "insert_ns", "lookup_ns" and "average_probes", which is None for the
+        structures that do not probe
+    """
+    generator = random.Random(seed)
+    report = []
+    for size in sizes:
+        for hash_name, hash_function in HASH_FUNCTIONS.items():
+            keys = make_keys(size, hash_name, generator)
+            misses = [key + 1 for key in keys] if hash_name != "string" else [key + "!" for key in keys]
+            lookups = [generator.choice(keys) if generator.random() < 0.5 else generator.choice(misses)
+                       for _ in range(queries)]
+            for probing in PROBING_STRATEGIES:
+                table = HashTable(probing, hash_function, max_load_factor=max_load_factor)
+                start = time.perf_counter()
+                for key in keys:
+                    table.insert(key, key)
+                insert_seconds = time.perf_counter() - start
+                report.append({
+                    "size": size,
+                    "hash": hash_name,
+                    "structure": f"HashTable({probing})",
+                    "insert_ns": insert_seconds / size * 1e9,
+                    "lookup_ns": time_lookups(table.search, lookups) * 1e9,
+                    "average_probes": sum(map(table.probe_length, lookups)) / len(lookups),
+                })
+
+            start = time.perf_counter()
+            builtin = {key: key for key in keys}
+            insert_seconds = time.perf_counter() - start
+            report.append({
+                "size": size,
+                "hash": hash_name,
+                "structure": "dict",
+                "insert_ns": insert_seconds / size * 1e9,
+                "lookup_ns": time_lookups(builtin.get, lookups) * 1e9,
+                "average_probes": None,
+            })
+            if hash_name == "modulo":
+                report.append({
+                    "size": size,
+                    "hash": "-",
+                    "structure": "linear_search",
+                    "insert_ns": 0.0,
+                    "lookup_ns": time_lookups(lambda key: linear_search(keys, key),
+                                              lookups[:LINEAR_SEARCH_QUERIES]) * 1e9,
+                    "average_probes": None,
+                })
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES)
+    parser.add_argument("--max-load-factor", type=float, default=0.5)
+    options = parser.parse_args()
+
+    print(f"{'size':>8} {'hash':>10} {'structure':>22} {'insert ns':>10} {'lookup ns':>10} {'probes':>7}")
+    for row in benchmark_hash_tables(tuple(options.sizes), options.queries, options.max_load_factor):
+        probes = "" if row["average_probes"] is None else f"{row['average_probes']:.2f}"
+        print(f"{row['size']:>8} {row['hash']:>10} {row['structure']:>22} {row['insert_ns']:>10.0f} "
+              f"{row['lookup_ns']:>10.0f} {probes:>7}")
@@ -1,52 +1,158 @@
-class MaxHeap:
+import operator
+from abc import ABC, abstractmethod
+from array import array
+
+
+class PriorityQueue(ABC):
+    """
+    The interface shared by the mergeable priority queues: MaxHeap, PairingHeap and FibonacciHeap.
+
+    Methods
+    -------
+    insert(value)
+        Add a value.
+    remove()
+        Remove and return the value at the root.
+    peek()
+        Return the value at the root without removing it.
+    meld(other)
+        Move every value of another heap of the same type into this one.
+    """
+    @abstractmethod
+    def insert(self, value):
+        """
+        Add a value.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        Any
+            A handle for the value, if the heap supports changing values in place
+        """
+
+    @abstractmethod
+    def remove(self):
+        """
+        Remove and return the value at the root.
+
+        Returns
+        -------
+        Any
+        """
+
+    @abstractmethod
+    def peek(self):
+        """
+        Return the value at the root without removing it.
+
+        Returns
+        -------
+        Any
+        """
+
+    @abstractmethod
+    def meld(self, other) -> None:
+        """
+        Move every value of another heap of the same type into this one, leaving the other empty.
+
+        Parameters
+        ----------
+        other : PriorityQueue
+
+        Returns
+        -------
+        None
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Return the number of values in the heap.
+
+        Returns
+        -------
+        int
+        """
+
+    def __bool__(self) -> bool:
+        """
+        Return True if the heap has values.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self) > 0
+
+
+class MaxHeap(PriorityQueue):
     def __init__(self):
         self.heap_array = []
 
+    @classmethod
+    def from_iterable(cls, values):
+        # Build the heap bottom-up in O(n) instead of with n inserts in O(n log n)
+        heap = cls()
+        heap.heap_array = list(values)
+        heap.heapify()
+        return heap
+
+    def heapify(self):
+        # Percolate down every internal node, starting from the last one
+        for node_index in range(len(self.heap_array) // 2 - 1, -1, -1):
+            self.percolate_down(node_index)
+
     def percolate_up(self, node_index):
+        # Hold the value aside and move smaller parents down into the hole
+        value = self.heap_array[node_index]
         while node_index > 0:
             parent_index = (node_index - 1) // 2
             # check for violations of max heap property
-            if self.heap_array[node_index] <= self.heap_array[parent_index]:
-                return
-            else:
-                # swap heap_array[node_index] and heap_array[parent_index]
-                temp = self.heap_array[node_index]
-                self.heap_array[node_index] = self.heap_array[parent_index]
-                self.heap_array[parent_index] = temp
-                node_index = parent_index
+            if value <= self.heap_array[parent_index]:
+                break
+            self.heap_array[node_index] = self.heap_array[parent_index]
+            node_index = parent_index
+        self.heap_array[node_index] = value
 
     def percolate_down(self, node_index):
-        child_index = 2 * node_index + 1
+        # Hold the value aside and move larger children up into the hole
         value = self.heap_array[node_index]
-        while child_index < len(self.heap_array):
-            # Find the max among the node and the node's children
-            max_value = value
-            max_index = -1
-            i = 0
-            while i < 2 and i + child_index < len(self.heap_array):
-                if self.heap_array[i + child_index] > max_value:
-                    max_value = self.heap_array[i + child_index]
-                    max_index = i + child_index
-                i = i + 1
+        length = len(self.heap_array)
+        child_index = 2 * node_index + 1
+        while child_index < length:
+            # Find the larger of the node's children
+            if child_index + 1 < length and self.heap_array[child_index + 1] > self.heap_array[child_index]:
+                child_index += 1
 
             # check for a violation of the max heap property
-            if max_value == value:
-                return
-            else:
-                # swap heap_array[node_index] and heap_array[max_index]
-                temp = self.heap_array[node_index]
-                self.heap_array[node_index] = self.heap_array[max_index]
-                self.heap_array[max_index] = temp
+            if self.heap_array[child_index] <= value:
+                break
+            self.heap_array[node_index] = self.heap_array[child_index]
 
-                # Continue loop from the larger child node
-                node_index = max_index
-                child_index = 2 * node_index + 1
+            # Continue loop from the larger child node
+            node_index = child_index
+            child_index = 2 * node_index + 1
+        self.heap_array[node_index] = value
 
     def insert(self, value):
         self.heap_array.append(value)
         # Percolate up from the last index to restore the heap property
         self.percolate_up(len(self.heap_array) - 1)
 
+    def insert_many(self, values):
+        values = list(values)
+        old_length = len(self.heap_array)
+        self.heap_array.extend(values)
+        # k inserts cost about k * log2(n) moves, re-heapifying costs about n
+        if len(values) * max(1, len(self.heap_array).bit_length()) > len(self.heap_array):
+            self.heapify()
+        else:
+            for node_index in range(old_length, len(self.heap_array)):
+                self.percolate_up(node_index)
+
     def remove(self):
         # Retrieve the root value
         max_value = self.heap_array[0]
@@ -58,3 +164,675 @@ class MaxHeap:
             # percolate down to restore max heap property
             self.percolate_down(0)
         return max_value
+
+    def pushpop(self, value):
+        # Insert value then remove the root, with a single percolate down
+        if not self.heap_array or value >= self.heap_array[0]:
+            return value
+        max_value = self.heap_array[0]
+        self.heap_array[0] = value
+        self.percolate_down(0)
+        return max_value
+
+    def replace(self, value):
+        # Remove the root then insert value, with a single percolate down
+        max_value = self.heap_array[0]
+        self.heap_array[0] = value
+        self.percolate_down(0)
+        return max_value
+
+    def peek(self):
+        return self.heap_array[0]
+
+    def meld(self, other) -> None:
+        # Melding a heap with itself leaves it unchanged, rather than emptying it
+        if other is self:
+            return
+        if not isinstance(other, MaxHeap):
+            raise TypeError("can only meld a MaxHeap into a MaxHeap")
+        # An array heap has no cheaper merge than appending the other array and re-heapifying in O(n)
+        self.insert_many(other.heap_array)
+        other.heap_array = []
+
+    def __len__(self):
+        return len(self.heap_array)
+
+    def __bool__(self):
+        return len(self.heap_array) > 0
+
+
+class IndexedHeap:
+    """
+    A binary min or max heap of handles, each with a priority that can be changed in place.
+
+    A dictionary maps every handle to its position in the heap, so a handle's priority can be
+    changed, or the handle removed, in O(log n) without searching the heap. A handle appears at
+    most once, so a heap used for Dijkstra's algorithm holds at most one entry per vertex.
+
+    Methods
+    -------
+    insert(handle, priority)
+        Add a handle with the given priority.
+    peek()
+        Return the root handle and its priority without removing them.
+    pop()
+        Remove and return the root handle and its priority.
+    decrease_key(handle, priority)
+        Lower the priority of a handle.
+    increase_key(handle, priority)
+        Raise the priority of a handle.
+    update(handle, priority)
+        Set the priority of a handle, inserting it if it is not in the heap.
+    remove(handle)
+        Remove a handle from anywhere in the heap and return its priority.
+    get_priority(handle)
+        Return the priority of a handle.
+    contains(handle)
+        Check if the handle is in the heap.
+
+    Attributes
+    ----------
+    max_heap : bool
+        True if the root has the largest priority, False if it has the smallest
+    handles : list
+        The handles in heap order
+    priorities : list
+        The priority of each handle in `handles`
+    positions : dict
+        Maps each handle to its index in `handles`
+    """
+    def __init__(self, max_heap: bool = False) -> None:
+        """
+        Initialize an empty heap.
+
+        Parameters
+        ----------
+        max_heap : bool = False
+            Keep the largest priority at the root instead of the smallest
+
+        Returns
+        -------
+        None
+        """
+        self.max_heap = max_heap
+        self.handles = []
+        self.priorities = []
+        self.positions = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of handles in the heap.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.handles)
+
+    def __contains__(self, handle) -> bool:
+        """
+        Check if the handle is in the heap, to allow `handle in heap`.
+
+        Parameters
+        ----------
+        handle : Hashable
+
+        Returns
+        -------
+        bool
+        """
+        return handle in self.positions
+
+    def contains(self, handle) -> bool:
+        """
+        Check if the handle is in the heap.
+
+        Parameters
+        ----------
+        handle : Hashable
+
+        Returns
+        -------
+        bool
+        """
+        return handle in self.positions
+
+    def before(self, priority, other_priority) -> bool:
+        """
+        Check if a priority belongs nearer the root than another.
+
+        Parameters
+        ----------
+        priority : Any
+        other_priority : Any
+
+        Returns
+        -------
+        bool
+        """
+        return priority > other_priority if self.max_heap else priority < other_priority
+
+    def place(self, index: int, handle, priority) -> None:
+        """
+        Store a handle and its priority at an index and record the new position.
+
+        Parameters
+        ----------
+        index : int
+        handle : Hashable
+        priority : Any
+
+        Returns
+        -------
+        None
+        """
+        self.handles[index] = handle
+        self.priorities[index] = priority
+        self.positions[handle] = index
+
+    def percolate_up(self, node_index: int) -> None:
+        """
+        Move the entry at node_index up until its parent belongs nearer the root.
+
+        The entry is held aside while the parents that belong below it move down into the
+        hole, and it is written once at its final index.
+
+        Parameters
+        ----------
+        node_index : int
+
+        Returns
+        -------
+        None
+        """
+        handle = self.handles[node_index]
+        priority = self.priorities[node_index]
+        while node_index > 0:
+            parent_index = (node_index - 1) // 2
+            if not self.before(priority, self.priorities[parent_index]):
+                break
+            self.place(node_index, self.handles[parent_index], self.priorities[parent_index])
+            node_index = parent_index
+        self.place(node_index, handle, priority)
+
+    def percolate_down(self, node_index: int) -> None:
+        """
+        Move the entry at node_index down until no child belongs nearer the root.
+
+        Parameters
+        ----------
+        node_index : int
+
+        Returns
+        -------
+        None
+        """
+        handle = self.handles[node_index]
+        priority = self.priorities[node_index]
+        length = len(self.handles)
+        child_index = 2 * node_index + 1
+        while child_index < length:
+            if child_index + 1 < length and self.before(self.priorities[child_index + 1],
+                                                        self.priorities[child_index]):
+                child_index += 1
+            if not self.before(self.priorities[child_index], priority):
+                break
+            self.place(node_index, self.handles[child_index], self.priorities[child_index])
+            node_index = child_index
+            child_index = 2 * node_index + 1
+        self.place(node_index, handle, priority)
+
+    def insert(self, handle, priority) -> None:
+        """
+        Add a handle with the given priority.
+
+        Parameters
+        ----------
+        handle : Hashable
+            Any hashable value, only the priorities are compared
+        priority : Any
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the handle is already in the heap
+        """
+        if handle in self.positions:
+            raise ValueError(f"{handle!r} is already in the heap")
+        self.handles.append(handle)
+        self.priorities.append(priority)
+        self.percolate_up(len(self.handles) - 1)
+
+    def peek(self) -> tuple:
+        """
+        Return the root handle and its priority without removing them.
+
+        Returns
+        -------
+        tuple
+            The handle and its priority
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        if not self.handles:
+            raise IndexError("peek from an empty heap")
+        return self.handles[0], self.priorities[0]
+
+    def pop(self) -> tuple:
+        """
+        Remove and return the root handle and its priority.
+
+        Returns
+        -------
+        tuple
+            The handle and its priority
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        if not self.handles:
+            raise IndexError("pop from an empty heap")
+        return self.remove_at(0)
+
+    def remove_at(self, index: int) -> tuple:
+        """
+        Remove and return the handle and priority at an index of the heap.
+
+        The last entry is moved into the hole, then percolated up or down, whichever
+        direction restores the heap property.
+
+        Parameters
+        ----------
+        index : int
+
+        Returns
+        -------
+        tuple
+            The handle and its priority
+        """
+        handle = self.handles[index]
+        priority = self.priorities[index]
+        del self.positions[handle]
+        last_handle = self.handles.pop()
+        last_priority = self.priorities.pop()
+        if index < len(self.handles):
+            self.place(index, last_handle, last_priority)
+            if index > 0 and self.before(last_priority, self.priorities[(index - 1) // 2]):
+                self.percolate_up(index)
+            else:
+                self.percolate_down(index)
+        return handle, priority
+
+    def remove(self, handle):
+        """
+        Remove a handle from anywhere in the heap and return its priority.
+
+        Parameters
+        ----------
+        handle : Hashable
+
+        Returns
+        -------
+        Any
+            The priority the handle had
+
+        Raises
+        ------
+        KeyError
+            If the handle is not in the heap
+        """
+        return self.remove_at(self.positions[handle])[1]
+
+    def get_priority(self, handle):
+        """
+        Return the priority of a handle.
+
+        Parameters
+        ----------
+        handle : Hashable
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        KeyError
+            If the handle is not in the heap
+        """
+        return self.priorities[self.positions[handle]]
+
+    def decrease_key(self, handle, priority) -> None:
+        """
+        Lower the priority of a handle.
+
+        Parameters
+        ----------
+        handle : Hashable
+        priority : Any
+            The new priority, no larger than the current one
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If the handle is not in the heap
+        ValueError
+            If the new priority is larger than the current one
+        """
+        if priority > self.get_priority(handle):
+            raise ValueError("decrease_key cannot raise a priority")
+        self.update(handle, priority)
+
+    def increase_key(self, handle, priority) -> None:
+        """
+        Raise the priority of a handle.
+
+        Parameters
+        ----------
+        handle : Hashable
+        priority : Any
+            The new priority, no smaller than the current one
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        KeyError
+            If the handle is not in the heap
+        ValueError
+            If the new priority is smaller than the current one
+        """
+        if priority < self.get_priority(handle):
+            raise ValueError("increase_key cannot lower a priority")
+        self.update(handle, priority)
+
+    def update(self, handle, priority) -> None:
+        """
+        Set the priority of a handle, inserting it if it is not in the heap.
+
+        Parameters
+        ----------
+        handle : Hashable
+        priority : Any
+
+        Returns
+        -------
+        None
+        """
+        index = self.positions.get(handle)
+        if index is None:
+            self.insert(handle, priority)
+            return
+        old_priority = self.priorities[index]
+        self.priorities[index] = priority
+        if self.before(priority, old_priority):
+            self.percolate_up(index)
+        else:
+            self.percolate_down(index)
+
+
+class NumericHeap:
+    """
+    A compact binary heap of numeric priorities, each with an integer payload id.
+
+    Priorities are kept in an `array('d')` or `array('q')` and payload ids in a parallel
+    `array('q')`, so an entry costs 16 bytes, or 24 with FIFO tie-breaking, against about
+    100 bytes for a tuple of boxed numbers in a list. Payloads are ids into whatever table
+    the caller keeps the real objects in.
+
+    Methods
+    -------
+    push(priority, payload)
+        Add a priority and its payload id.
+    peek()
+        Return the root priority and payload id without removing them.
+    pop()
+        Remove and return the root priority and payload id.
+    bytes_per_entry()
+        Return the number of bytes each entry occupies in the arrays.
+    memory_bytes()
+        Return the number of bytes allocated by the arrays.
+
+    Attributes
+    ----------
+    max_heap : bool
+        True if the root has the largest priority, False if it has the smallest
+    priority_precedes : Callable
+        `operator.gt` for a max heap, `operator.lt` for a min heap
+    priorities : array
+    payloads : array
+    sequences : array | None
+        The insertion number of each entry when ties are broken first in, first out
+    """
+    def __init__(self, typecode: str = "d", max_heap: bool = False, fifo: bool = False) -> None:
+        """
+        Initialize an empty heap.
+
+        Parameters
+        ----------
+        typecode : str = "d"
+            "d" for float priorities, "q" for signed 64-bit integer priorities
+        max_heap : bool = False
+            Keep the largest priority at the root instead of the smallest
+        fifo : bool = False
+            Pop entries with equal priorities in the order they were pushed
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the typecode is not "d" or "q"
+        """
+        if typecode not in ("d", "q"):
+            raise ValueError("typecode must be 'd' or 'q'")
+        self.max_heap = max_heap
+        # Strict comparison of two priorities, true when the first belongs nearer the root
+        self.priority_precedes = operator.gt if max_heap else operator.lt
+        self.priorities = array(typecode)
+        self.payloads = array("q")
+        self.sequences = array("q") if fifo else None
+        self.next_sequence = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in the heap.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.priorities)
+
+    def __bool__(self) -> bool:
+        """
+        Return True if the heap has entries.
+
+        Returns
+        -------
+        bool
+        """
+        return len(self.priorities) > 0
+
+    def push(self, priority: int | float, payload: int = 0) -> None:
+        """
+        Add a priority and its payload id.
+
+        The new entry is held aside while the parents that belong below it move down into
+        the hole, and it is written once at its final index.
+
+        Parameters
+        ----------
+        priority : int | float
+        payload : int = 0
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        OverflowError
+            If an integer priority or the payload id does not fit in 64 bits, in which case
+            the heap is left unchanged
+        """
+        priorities = self.priorities
+        payloads = self.payloads
+        sequences = self.sequences
+        precedes = self.priority_precedes
+        sequence = self.next_sequence
+        priorities.append(priority)
+        try:
+            payloads.append(payload)
+        except (OverflowError, TypeError):
+            # Keep the parallel arrays the same length when the payload id is rejected
+            priorities.pop()
+            raise
+        if sequences is not None:
+            sequences.append(sequence)
+        self.next_sequence = sequence + 1
+        node_index = len(priorities) - 1
+        while node_index > 0:
+            parent_index = (node_index - 1) // 2
+            parent_priority = priorities[parent_index]
+            # Equal priorities only move up when ties are broken by the earlier sequence
+            if not (precedes(priority, parent_priority) or (
+                    sequences is not None and priority == parent_priority and sequence < sequences[parent_index])):
+                break
+            priorities[node_index] = parent_priority
+            payloads[node_index] = payloads[parent_index]
+            if sequences is not None:
+                sequences[node_index] = sequences[parent_index]
+            node_index = parent_index
+        priorities[node_index] = priority
+        payloads[node_index] = payload
+        if sequences is not None:
+            sequences[node_index] = sequence
+
+    def peek(self) -> tuple[int | float, int]:
+        """
+        Return the root priority and payload id without removing them.
+
+        Returns
+        -------
+        tuple[int | float, int]
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        if not self.priorities:
+            raise IndexError("peek from an empty heap")
+        return self.priorities[0], self.payloads[0]
+
+    def pop(self) -> tuple[int | float, int]:
+        """
+        Remove and return the root priority and payload id.
+
+        The last entry is percolated down from the root through a hole.
+
+        Returns
+        -------
+        tuple[int | float, int]
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        priorities = self.priorities
+        payloads = self.payloads
+        sequences = self.sequences
+        precedes = self.priority_precedes
+        if not priorities:
+            raise IndexError("pop from an empty heap")
+        root = priorities[0], payloads[0]
+        priority = priorities.pop()
+        payload = payloads.pop()
+        sequence = sequences.pop() if sequences is not None else 0
+        length = len(priorities)
+        if not length:
+            return root
+        node_index = 0
+        child_index = 1
+        while child_index < length:
+            # Pick the child that belongs nearer the root
+            child_priority = priorities[child_index]
+            if child_index + 1 < length:
+                right_priority = priorities[child_index + 1]
+                if precedes(right_priority, child_priority) or (
+                        sequences is not None and right_priority == child_priority
+                        and sequences[child_index + 1] < sequences[child_index]):
+                    child_index += 1
+                    child_priority = right_priority
+            if not (precedes(child_priority, priority) or (
+                    sequences is not None and child_priority == priority and sequences[child_index] < sequence)):
+                break
+            priorities[node_index] = child_priority
+            payloads[node_index] = payloads[child_index]
+            if sequences is not None:
+                sequences[node_index] = sequences[child_index]
+            node_index = child_index
+            child_index = 2 * node_index + 1
+        priorities[node_index] = priority
+        payloads[node_index] = payload
+        if sequences is not None:
+            sequences[node_index] = sequence
+        return root
+
+    def bytes_per_entry(self) -> int:
+        """
+        Return the number of bytes each entry occupies in the arrays.
+
+        Returns
+        -------
+        int
+        """
+        return (self.priorities.itemsize + self.payloads.itemsize
+                + (self.sequences.itemsize if self.sequences is not None else 0))
+
+    def memory_bytes(self) -> int:
+        """
+        Return the number of bytes allocated by the arrays, including spare capacity.
+
+        Returns
+        -------
+        int
+        """
+        arrays = [self.priorities, self.payloads] + ([self.sequences] if self.sequences is not None else [])
+        return sum(values.buffer_info()[1] * values.itemsize for values in arrays)
+
+
+if __name__ == "__main__":
+    heap = MaxHeap.from_iterable([3, 9, 1])
+    other = MaxHeap.from_iterable([7, 2])
+    heap.meld(other)
+    assert len(heap) == 5 and len(other) == 0 and heap.peek() == 9
+    heap.meld(heap)
+    assert len(heap) == 5 and [heap.remove() for _ in range(5)] == [9, 7, 3, 2, 1]
+    empty = MaxHeap()
+    empty.meld(MaxHeap())
+    assert len(empty) == 0
+    try:
+        heap.meld([1, 2])
+        assert False
+    except TypeError:
+        pass
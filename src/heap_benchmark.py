@@ -0,0 +1,355 @@
+"""
+Memory and throughput of the heaps in `heap`, compared on the same timer-event workload.
+
+`benchmark_heaps` fills and drains each heap with float deadlines and integer event ids.
+`MaxHeap` stores the entries as (deadline, event id) tuples in a list, with deadlines negated
+to pop the earliest first. `benchmark_meld` and `benchmark_dijkstra` compare the mergeable heaps
+with `MaxHeap` and `heapq` on meld-heavy and decrease-key-heavy workloads.
+
+Usage
+-----
+python heap_benchmark.py --sizes 10000 1000000
+"""
+import argparse
+import heapq
+import random
+import time
+import tracemalloc
+
+from fibonacciheap import FibonacciHeap
+from heap import MaxHeap, NumericHeap
+from pairingheap import PairingHeap
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def fill_max_heap(deadlines: list[float]) -> MaxHeap:
+    """
+    Return a MaxHeap of (negated deadline, event id) tuples, built with `insert`.
+
+    Parameters
+    ----------
+    deadlines : list[float]
+
+    Returns
+    -------
+    MaxHeap
+    """
+    heap = MaxHeap()
+    for event_id, deadline in enumerate(deadlines):
+        heap.insert((-deadline, event_id))
+    return heap
+
+
+def fill_heapq(deadlines: list[float]) -> list:
+    """
+    Return a `heapq` list of (deadline, event id) tuples, built with `heappush`.
+
+    Parameters
+    ----------
+    deadlines : list[float]
+
+    Returns
+    -------
+    list
+    """
+    heap = []
+    for event_id, deadline in enumerate(deadlines):
+        heapq.heappush(heap, (deadline, event_id))
+    return heap
+
+
+def fill_numeric_heap(deadlines: list[float], fifo: bool = False) -> NumericHeap:
+    """
+    Return a min NumericHeap of deadlines with their event ids, built with `push`.
+
+    Parameters
+    ----------
+    deadlines : list[float]
+    fifo : bool = False
+
+    Returns
+    -------
+    NumericHeap
+    """
+    heap = NumericHeap("d", fifo=fifo)
+    for event_id, deadline in enumerate(deadlines):
+        heap.push(deadline, event_id)
+    return heap
+
+
+HEAPS = {
+    "MaxHeap of tuples": (fill_max_heap, MaxHeap.remove),
+    "heapq of tuples": (fill_heapq, heapq.heappop),
+    "NumericHeap": (fill_numeric_heap, NumericHeap.pop),
+    "NumericHeap fifo": (lambda deadlines: fill_numeric_heap(deadlines, fifo=True), NumericHeap.pop),
+}
+
+
+def benchmark_heaps(sizes: tuple[int, ...] = DEFAULT_SIZES, seed: int = 0) -> list[dict]:
+    """
+    Measure the memory held by each heap once filled, and the time to fill and drain it.
+
+    Memory is measured with `tracemalloc` as the bytes still allocated after the heap is
+    built, so it includes the boxed tuples and numbers as well as the containers.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] = DEFAULT_SIZES
+        The numbers of entries
+    seed : int = 0
+
+    Returns
+    -------
+    list[dict]
+        One entry per size and heap with the keys "size", "heap", "bytes_per_entry",
+        "push_ns" and "pop_ns"
+    """
+    generator = random.Random(seed)
+    report = []
+    for size in sizes:
+        deadlines = [generator.random() * 1e6 for _ in range(size)]
+        for name, (fill, pop) in HEAPS.items():
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            heap = fill(deadlines)
+            held = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            del heap
+
+            start = time.perf_counter()
+            heap = fill(deadlines)
+            push_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(size):
+                pop(heap)
+            pop_seconds = time.perf_counter() - start
+            report.append({
+                "size": size,
+                "heap": name,
+                "bytes_per_entry": held / size,
+                "push_ns": push_seconds / size * 1e9,
+                "pop_ns": pop_seconds / size * 1e9,
+            })
+    return report
+
+
+def meld_heapq(heap: list, other: list) -> None:
+    """
+    Move every entry of another `heapq` list into a heap, by extending and re-heapifying.
+
+    Parameters
+    ----------
+    heap : list
+    other : list
+
+    Returns
+    -------
+    None
+    """
+    heap.extend(other)
+    heapq.heapify(heap)
+    other.clear()
+
+
+# Each entry: make an empty max heap, insert, remove the root, meld another heap into the first
+MELD_HEAPS = {
+    "MaxHeap": (MaxHeap, MaxHeap.insert, MaxHeap.remove, MaxHeap.meld),
+    "heapq": (list, lambda heap, value: heapq.heappush(heap, -value), heapq.heappop, meld_heapq),
+    "PairingHeap": (PairingHeap, PairingHeap.insert, PairingHeap.remove, PairingHeap.meld),
+    "FibonacciHeap": (FibonacciHeap, FibonacciHeap.insert, FibonacciHeap.remove, FibonacciHeap.meld),
+}
+
+
+def benchmark_meld(queues: int = 16, rounds: int = 2_000, batch: int = 8, seed: int = 0) -> list[dict]:
+    """
+    Time a work-stealing pattern: per-worker queues that are filled, drained and melded.
+
+    Every round, each queue receives `batch` new tasks and removes its most urgent task, and
+    one queue steals all the tasks of another by melding it in.
+
+    Parameters
+    ----------
+    queues : int = 16
+    rounds : int = 2_000
+    batch : int = 8
+    seed : int = 0
+
+    Returns
+    -------
+    list[dict]
+        One entry per heap with the keys "heap", "seconds" and "meld_us", the average time
+        of one meld
+    """
+    report = []
+    for name, (make, insert, remove, meld) in MELD_HEAPS.items():
+        generator = random.Random(seed)
+        heaps = [make() for _ in range(queues)]
+        meld_seconds = 0.0
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for heap in heaps:
+                for _ in range(batch):
+                    insert(heap, generator.random())
+                remove(heap)
+            thief, victim = generator.sample(range(queues), 2)
+            meld_start = time.perf_counter()
+            meld(heaps[thief], heaps[victim])
+            meld_seconds += time.perf_counter() - meld_start
+        report.append({
+            "heap": name,
+            "seconds": time.perf_counter() - start,
+            "meld_us": meld_seconds / rounds * 1e6,
+        })
+    return report
+
+
+def make_graph(vertices: int, edges: int, seed: int = 0) -> list[list[tuple[int, float]]]:
+    """
+    Return a random directed graph as lists of (neighbor, weight) pairs, with a path from vertex 0 to every vertex.
+
+    Parameters
+    ----------
+    vertices : int
+    edges : int
+    seed : int = 0
+
+    Returns
+    -------
+    list[list[tuple[int, float]]]
+    """
+    generator = random.Random(seed)
+    adjacency = [[] for _ in range(vertices)]
+    for vertex in range(1, vertices):
+        adjacency[generator.randrange(vertex)].append((vertex, generator.random()))
+    for _ in range(edges - (vertices - 1)):
+        adjacency[generator.randrange(vertices)].append((generator.randrange(vertices), generator.random()))
+    return adjacency
+
+
+def dijkstra_lazy(adjacency: list, make, insert, remove, negate: bool) -> list[float]:
+    """
+    Dijkstra's algorithm that pushes a new entry per relaxation and skips stale entries.
+
+    Parameters
+    ----------
+    adjacency : list
+    make : Callable
+    insert : Callable
+    remove : Callable
+    negate : bool
+        Store negated distances, for a max heap
+
+    Returns
+    -------
+    list[float]
+    """
+    sign = -1 if negate else 1
+    distances = [float("inf")] * len(adjacency)
+    distances[0] = 0.0
+    heap = make()
+    insert(heap, (0.0, 0))
+    while heap:
+        distance, vertex = remove(heap)
+        distance *= sign
+        if distance > distances[vertex]:
+            continue
+        for neighbor, weight in adjacency[vertex]:
+            alternative = distance + weight
+            if alternative < distances[neighbor]:
+                distances[neighbor] = alternative
+                insert(heap, (sign * alternative, neighbor))
+    return distances
+
+
+def dijkstra_decrease_key(adjacency: list, heap) -> list[float]:
+    """
+    Dijkstra's algorithm that keeps one node per vertex and lowers it with decrease_key.
+
+    Parameters
+    ----------
+    adjacency : list
+    heap : PairingHeap | FibonacciHeap
+        An empty min heap
+
+    Returns
+    -------
+    list[float]
+    """
+    distances = [float("inf")] * len(adjacency)
+    distances[0] = 0.0
+    nodes = {0: heap.insert((0.0, 0))}
+    while heap:
+        distance, vertex = heap.remove()
+        del nodes[vertex]
+        for neighbor, weight in adjacency[vertex]:
+            alternative = distance + weight
+            if alternative < distances[neighbor]:
+                distances[neighbor] = alternative
+                if neighbor in nodes:
+                    heap.decrease_key(nodes[neighbor], (alternative, neighbor))
+                else:
+                    nodes[neighbor] = heap.insert((alternative, neighbor))
+    return distances
+
+
+def benchmark_dijkstra(vertices: int = 20_000, edges: int = 200_000, seed: int = 0) -> list[dict]:
+    """
+    Time single-source shortest paths on a random graph with each heap.
+
+    `MaxHeap` and `heapq` hold up to one entry per relaxed edge, the mergeable heaps one node
+    per vertex.
+
+    Parameters
+    ----------
+    vertices : int = 20_000
+    edges : int = 200_000
+    seed : int = 0
+
+    Returns
+    -------
+    list[dict]
+        One entry per heap with the keys "heap" and "seconds"
+
+    Raises
+    ------
+    AssertionError
+        If the heaps disagree on the distances
+    """
+    adjacency = make_graph(vertices, edges, seed)
+    runs = {
+        "MaxHeap": lambda: dijkstra_lazy(adjacency, MaxHeap, MaxHeap.insert, MaxHeap.remove, True),
+        "heapq": lambda: dijkstra_lazy(adjacency, list, heapq.heappush, heapq.heappop, False),
+        "PairingHeap": lambda: dijkstra_decrease_key(adjacency, PairingHeap(max_heap=False)),
+        "FibonacciHeap": lambda: dijkstra_decrease_key(adjacency, FibonacciHeap(max_heap=False)),
+    }
+    report = []
+    expected = None
+    for name, run in runs.items():
+        start = time.perf_counter()
+        distances = run()
+        report.append({"heap": name, "seconds": time.perf_counter() - start})
+        expected = expected or distances
+        assert distances == expected, f"{name} computed different distances"
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    options = parser.parse_args()
+
+    print(f"{'size':>9} {'heap':>18} {'bytes/entry':>12} {'push ns':>9} {'pop ns':>9}")
+    for row in benchmark_heaps(tuple(options.sizes)):
+        print(f"{row['size']:>9} {row['heap']:>18} {row['bytes_per_entry']:>12.1f} "
+              f"{row['push_ns']:>9.0f} {row['pop_ns']:>9.0f}")
+
+    print()
+    print(f"{'meld workload':>18} {'seconds':>9} {'meld us':>9}")
+    for row in benchmark_meld():
+        print(f"{row['heap']:>18} {row['seconds']:>9.3f} {row['meld_us']:>9.1f}")
+
+    print()
+    print(f"{'dijkstra workload':>18} {'seconds':>9}")
+    for row in benchmark_dijkstra():
+        print(f"{row['heap']:>18} {row['seconds']:>9.3f}")
@@ -0,0 +1,290 @@
+"""
+A learned index over large sorted numeric arrays.
+
+A sorted array is a monotone function from key to position, so a small model can predict
+where a key is stored. This is a two-level recursive model index (RMI): a root linear model
+picks one of many leaf linear models, and the leaf predicts the position. Each leaf records
+the largest error of its predictions over the keys it covers, and a lookup only binary
+searches that error window instead of the whole array.
+"""
+from array import array
+from math import ceil, log2
+
+from searching import binary_search
+
+# The default number of keys per leaf model. More leaves fit skewed keys more closely and
+# give smaller windows, at 32 bytes per leaf.
+KEYS_PER_LEAF = 1024
+
+
+def count_probes(numbers: list[int | float] | array, key: int | float, low: int, high: int) -> int:
+    """
+    Return the number of probes `binary_search(numbers, key, low, high)` makes.
+
+    Parameters
+    ----------
+    numbers : list[int|float] | array
+        List of numbers to be searched. Must be sorted in ascending order.
+    key : int|float
+    low : int
+    high : int
+
+    Returns
+    -------
+    int
+    """
+    probes = 0
+    while high >= low:
+        probes += 1
+        mid = (high + low) // 2
+        if numbers[mid] < key:
+            low = mid + 1
+        elif numbers[mid] > key:
+            high = mid - 1
+        else:
+            break
+    return probes
+
+
+class LearnedIndex:
+    """
+    A two-level piecewise-linear model of the positions of sorted keys.
+
+    The root model is the straight line from the first to the last key, scaled to the number
+    of leaves. The keys routed to a leaf are contiguous, and the leaf model is the straight line
+    through its first and last key. The index keeps a reference to the keys and does not copy
+    them, so it costs only the per-leaf arrays.
+
+    Methods
+    -------
+    leaf(key)
+        Return the leaf model the root model routes the key to.
+    predict(leaf, key)
+        Return the position the leaf model predicts for the key.
+    window(key)
+        Return the lowest and highest index the key can be stored at.
+    find(key)
+        Return the index of the key, -1 if not found.
+    memory_bytes()
+        Return the number of bytes used by the leaf models.
+    average_probes(queries)
+        Return the average number of probes per lookup, and that of a plain `binary_search`.
+
+    Attributes
+    ----------
+    numbers : list[int|float] | array
+        The indexed keys
+    leaf_count : int
+    starts : array
+        The index of the first key routed to each leaf, followed by `len(numbers)`
+    first_keys : array
+        The first key routed to each leaf
+    slopes : array
+        The positions per unit of key of each leaf model
+    errors : array
+        The largest distance between a predicted and an actual position in each leaf
+    """
+    def __init__(self, numbers: list[int | float] | array, leaf_count: int | None = None) -> None:
+        """
+        Fit the models to keys sorted in ascending order.
+
+        Training makes two passes over the keys, one to route them to leaves and one to
+        measure each leaf's error.
+
+        Parameters
+        ----------
+        numbers : list[int|float] | array
+            The keys to be indexed. Must be sorted in ascending order.
+        leaf_count : int | None = None
+            The number of leaf models, defaults to one per `KEYS_PER_LEAF` keys
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If `leaf_count` is less than one
+        """
+        length = len(numbers)
+        if leaf_count is None:
+            leaf_count = max(1, length // KEYS_PER_LEAF)
+        if leaf_count < 1:
+            raise ValueError("leaf_count must be at least 1")
+        self.numbers = numbers
+        self.leaf_count = leaf_count
+        self.starts = array("q", bytes(8 * (leaf_count + 1)))
+        self.first_keys = array("d", bytes(8 * leaf_count))
+        self.slopes = array("d", bytes(8 * leaf_count))
+        self.errors = array("q", bytes(8 * leaf_count))
+        if not length:
+            return
+        self.root_low = numbers[0]
+        span = numbers[-1] - numbers[0]
+        self.root_slope = leaf_count / span if span else 0.0
+
+        # The root model is monotone, so each leaf covers the slice between its start and the next
+        leaf = 0
+        for position in range(length):
+            routed = self.leaf(numbers[position])
+            while leaf < routed:
+                leaf += 1
+                self.starts[leaf] = position
+        for empty_leaf in range(leaf + 1, leaf_count + 1):
+            self.starts[empty_leaf] = length
+
+        for leaf in range(leaf_count):
+            start = self.starts[leaf]
+            stop = self.starts[leaf + 1]
+            if start == stop:
+                continue
+            first_key = numbers[start]
+            last_key = numbers[stop - 1]
+            self.first_keys[leaf] = first_key
+            self.slopes[leaf] = (stop - 1 - start) / (last_key - first_key) if last_key != first_key else 0.0
+            error = 0
+            for position in range(start, stop):
+                error = max(error, abs(position - self.predict(leaf, numbers[position])))
+            self.errors[leaf] = error
+
+    def leaf(self, key: int | float) -> int:
+        """
+        Return the leaf model the root model routes the key to.
+
+        Parameters
+        ----------
+        key : int|float
+
+        Returns
+        -------
+        int
+        """
+        leaf = int((key - self.root_low) * self.root_slope)
+        return min(max(leaf, 0), self.leaf_count - 1)
+
+    def predict(self, leaf: int, key: int | float) -> int:
+        """
+        Return the position the leaf model predicts for the key.
+
+        Parameters
+        ----------
+        leaf : int
+        key : int|float
+
+        Returns
+        -------
+        int
+        """
+        return self.starts[leaf] + int((key - self.first_keys[leaf]) * self.slopes[leaf])
+
+    def window(self, key: int | float) -> tuple[int, int]:
+        """
+        Return the lowest and highest index the key can be stored at.
+
+        Parameters
+        ----------
+        key : int|float
+
+        Returns
+        -------
+        tuple[int, int]
+            The bounds, inclusive. The window is empty, with the low bound above the high
+            bound, when the key routes to a leaf without keys.
+        """
+        if not self.numbers:
+            return 0, -1
+        leaf = self.leaf(key)
+        predicted = self.predict(leaf, key)
+        error = self.errors[leaf]
+        return max(self.starts[leaf], predicted - error), min(self.starts[leaf + 1] - 1, predicted + error)
+
+    def find(self, key: int | float) -> int:
+        """
+        Return the index of the key, -1 if not found.
+
+        Parameters
+        ----------
+        key : int|float
+
+        Returns
+        -------
+        int
+        """
+        low, high = self.window(key)
+        return binary_search(self.numbers, key, low, high)
+
+    def __contains__(self, key: int | float) -> bool:
+        """
+        Check if the key is in the index, to allow `key in index`.
+
+        Parameters
+        ----------
+        key : int|float
+
+        Returns
+        -------
+        bool
+        """
+        return self.find(key) != -1
+
+    def __len__(self) -> int:
+        """
+        Return the number of indexed keys.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.numbers)
+
+    def memory_bytes(self) -> int:
+        """
+        Return the number of bytes used by the leaf models, not counting the keys.
+
+        Returns
+        -------
+        int
+        """
+        return sum(model.buffer_info()[1] * model.itemsize
+                   for model in (self.starts, self.first_keys, self.slopes, self.errors))
+
+    def average_probes(self, queries: list[int | float]) -> dict:
+        """
+        Return the average number of probes per lookup, and that of a plain `binary_search`.
+
+        Parameters
+        ----------
+        queries : list[int|float]
+
+        Returns
+        -------
+        dict
+            The keys "learned_index" and "binary_search" for the average probes,
+            "largest_window" for the number of keys in the largest error window of any leaf,
+            and "worst_case_probes" for the probes a lookup in that window can take
+        """
+        learned = 0
+        plain = 0
+        for key in queries:
+            low, high = self.window(key)
+            learned += count_probes(self.numbers, key, low, high)
+            plain += count_probes(self.numbers, key, 0, len(self.numbers) - 1)
+        largest_window = max((min(2 * error + 1, self.starts[leaf + 1] - self.starts[leaf])
+                              for leaf, error in enumerate(self.errors)), default=0)
+        return {
+            "learned_index": learned / len(queries) if queries else 0.0,
+            "binary_search": plain / len(queries) if queries else 0.0,
+            "largest_window": largest_window,
+            "worst_case_probes": ceil(log2(largest_window + 1)),
+        }
+
+
+if __name__ == "__main__":
+    keys = [3 * i for i in range(10_000)]
+    index = LearnedIndex(keys)
+    assert index.find(2_997) == 999
+    assert index.find(2_998) == -1
+    assert -3 not in index and 30_000 not in index
+    probes = index.average_probes(list(range(0, 30_000, 7)))
+    assert probes["learned_index"] < probes["binary_search"]
@@ -0,0 +1,382 @@
+"""
+Implementation of a pairing heap.
+
+A pairing heap is a single tree in which every node's children are kept in a linked list.
+Two heaps are linked by making the root that belongs lower the first child of the other, so
+insert and meld are O(1). Removing the root pairs up its children left to right, then links
+the pairs right to left, which costs O(log n) amortized.
+"""
+import operator
+from typing import Any
+
+from heap import PriorityQueue
+
+
+class PairingNode:
+    """
+    A node of a pairing heap, and the handle returned by `PairingHeap.insert`.
+
+    Attributes
+    ----------
+    value : Any
+    child : PairingNode | None
+        The first child
+    sibling : PairingNode | None
+        The next sibling
+    previous : PairingNode | None
+        The previous sibling, or the parent for a first child
+    """
+    __slots__ = ("value", "child", "sibling", "previous")
+
+    def __init__(self, value: Any) -> None:
+        """
+        Initialize a node without parent, children or siblings.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        self.value = value
+        self.child = None
+        self.sibling = None
+        self.previous = None
+
+
+class PairingHeap(PriorityQueue):
+    """
+    A max or min pairing heap.
+
+    Methods
+    -------
+    insert(value)
+        Add a value and return its node.
+    remove()
+        Remove and return the value at the root.
+    peek()
+        Return the value at the root without removing it.
+    meld(other)
+        Move every value of another pairing heap into this one in O(1).
+    delete(node)
+        Remove a node from anywhere in the heap and return its value.
+    decrease_key(node, value)
+        Lower the value of a node.
+    increase_key(node, value)
+        Raise the value of a node.
+    update(node, value)
+        Set the value of a node.
+
+    Attributes
+    ----------
+    max_heap : bool
+    root : PairingNode | None
+    length : int
+    """
+    def __init__(self, max_heap: bool = True) -> None:
+        """
+        Initialize an empty heap.
+
+        Parameters
+        ----------
+        max_heap : bool = True
+            Keep the largest value at the root, like MaxHeap, or the smallest if False
+
+        Returns
+        -------
+        None
+        """
+        self.max_heap = max_heap
+        # Strict comparison of two values, true when the first belongs nearer the root
+        self.precedes = operator.gt if max_heap else operator.lt
+        self.root = None
+        self.length = 0
+
+    def __len__(self) -> int:
+        """
+        Return the number of values in the heap.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def link(self, first: PairingNode | None, second: PairingNode | None) -> PairingNode | None:
+        """
+        Link two trees and return the new root.
+
+        Parameters
+        ----------
+        first : PairingNode | None
+        second : PairingNode | None
+
+        Returns
+        -------
+        PairingNode | None
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if self.precedes(second.value, first.value):
+            first, second = second, first
+        # second becomes the first child of first
+        second.previous = first
+        second.sibling = first.child
+        if first.child is not None:
+            first.child.previous = second
+        first.child = second
+        first.sibling = None
+        first.previous = None
+        return first
+
+    def merge_pairs(self, first_child: PairingNode | None) -> PairingNode | None:
+        """
+        Combine a list of sibling trees into one with the two-pass pairing.
+
+        Parameters
+        ----------
+        first_child : PairingNode | None
+
+        Returns
+        -------
+        PairingNode | None
+        """
+        pairs = []
+        node = first_child
+        while node is not None:
+            second = node.sibling
+            following = second.sibling if second is not None else None
+            node.sibling = node.previous = None
+            if second is not None:
+                second.sibling = second.previous = None
+            pairs.append(self.link(node, second))
+            node = following
+        root = None
+        for tree in reversed(pairs):
+            root = self.link(tree, root)
+        return root
+
+    def cut(self, node: PairingNode) -> None:
+        """
+        Detach the subtree rooted at a node, other than the root, from its parent or siblings.
+
+        Parameters
+        ----------
+        node : PairingNode
+
+        Returns
+        -------
+        None
+        """
+        if node.previous.child is node:
+            node.previous.child = node.sibling
+        else:
+            node.previous.sibling = node.sibling
+        if node.sibling is not None:
+            node.sibling.previous = node.previous
+        node.sibling = None
+        node.previous = None
+
+    def insert(self, value: Any) -> PairingNode:
+        """
+        Add a value and return its node, the handle for changing or deleting it later.
+
+        Parameters
+        ----------
+        value : Any
+
+        Returns
+        -------
+        PairingNode
+        """
+        node = PairingNode(value)
+        self.root = self.link(self.root, node)
+        self.length += 1
+        return node
+
+    def peek(self) -> Any:
+        """
+        Return the value at the root without removing it.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        if self.root is None:
+            raise IndexError("peek from an empty heap")
+        return self.root.value
+
+    def remove(self) -> Any:
+        """
+        Remove and return the value at the root.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the heap is empty
+        """
+        if self.root is None:
+            raise IndexError("remove from an empty heap")
+        root = self.root
+        self.root = self.merge_pairs(root.child)
+        root.child = None
+        self.length -= 1
+        return root.value
+
+    def meld(self, other: "PairingHeap") -> None:
+        """
+        Move every value of another pairing heap into this one in O(1), leaving the other empty.
+
+        Nodes keep their identity, so handles from the other heap stay valid in this one.
+        Melding a heap with itself leaves it unchanged.
+
+        Parameters
+        ----------
+        other : PairingHeap
+            A heap with the same ordering
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the other heap is ordered the other way
+        """
+        if other is self:
+            return
+        if other.max_heap != self.max_heap:
+            raise ValueError("cannot meld a max heap with a min heap")
+        self.root = self.link(self.root, other.root)
+        self.length += other.length
+        other.root = None
+        other.length = 0
+
+    def delete(self, node: PairingNode) -> Any:
+        """
+        Remove a node from anywhere in the heap and return its value.
+
+        Parameters
+        ----------
+        node : PairingNode
+
+        Returns
+        -------
+        Any
+        """
+        if node is self.root:
+            return self.remove()
+        self.cut(node)
+        self.root = self.link(self.root, self.merge_pairs(node.child))
+        node.child = None
+        self.length -= 1
+        return node.value
+
+    def update(self, node: PairingNode, value: Any) -> None:
+        """
+        Set the value of a node.
+
+        A node moving towards the root is cut from its parent and linked with the root in
+        O(1). A node moving away from the root is deleted and inserted again, in O(log n)
+        amortized.
+
+        Parameters
+        ----------
+        node : PairingNode
+        value : Any
+
+        Returns
+        -------
+        None
+        """
+        if self.precedes(node.value, value):
+            self.delete(node)
+            node.value = value
+            self.root = self.link(self.root, node)
+            self.length += 1
+            return
+        node.value = value
+        if node is not self.root:
+            self.cut(node)
+            self.root = self.link(self.root, node)
+
+    def decrease_key(self, node: PairingNode, value: Any) -> None:
+        """
+        Lower the value of a node, which is O(1) in a min heap.
+
+        Parameters
+        ----------
+        node : PairingNode
+        value : Any
+            The new value, no larger than the current one
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the new value is larger than the current one
+        """
+        if value > node.value:
+            raise ValueError("decrease_key cannot raise a value")
+        self.update(node, value)
+
+    def increase_key(self, node: PairingNode, value: Any) -> None:
+        """
+        Raise the value of a node, which is O(1) in a max heap.
+
+        Parameters
+        ----------
+        node : PairingNode
+        value : Any
+            The new value, no smaller than the current one
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the new value is smaller than the current one
+        """
+        if value < node.value:
+            raise ValueError("increase_key cannot lower a value")
+        self.update(node, value)
+
+
+if __name__ == "__main__":
+    heap = PairingHeap()
+    other = PairingHeap()
+    for value in (3, 9, 1):
+        heap.insert(value)
+    for value in (7, 2):
+        other.insert(value)
+    heap.meld(other)
+    assert len(heap) == 5 and len(other) == 0 and heap.peek() == 9
+    heap.meld(heap)
+    assert len(heap) == 5 and [heap.remove() for _ in range(5)] == [9, 7, 3, 2, 1]
+    empty = PairingHeap()
+    empty.meld(PairingHeap())
+    assert len(empty) == 0 and empty.root is None
+    try:
+        heap.meld(PairingHeap(max_heap=False))
+        assert False
+    except ValueError:
+        pass
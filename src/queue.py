@@ -1,8 +1,311 @@
+"""
+Implementation of the Queue abstract data type (ADT).
+"""
+from typing import Any, Iterable
+
+# The capacity a queue starts with, and never shrinks below
+MIN_CAPACITY = 8
+
 
 class Queue:
+    """
+    Implementation of the queue abstract data type, using a circular array.
+
+    Items are stored in a preallocated list used as a ring: the front item is at `front_index`
+    and the others follow it, wrapping around to index 0 at the end of the list. Enqueue and
+    dequeue only move an index, so both are O(1). When the array is full it is resized to twice
+    its capacity, and when it drops below a quarter full it is halved, so resizing costs O(1)
+    amortized per operation.
+
+    Methods
+    -------
+    __init__(max_length=-1)
+        Initialize a queue, optionally with a maximum length to create a bounded queue.
+    enqueue(item)
+        Add an item to the end of the queue, provided it doesn't exceed the given bound.
+    enqueue_many(items)
+        Add items to the end of the queue, up to the given bound.
+    dequeue()
+        Remove and return the item at the front of the queue.
+    dequeue_many(count)
+        Remove and return up to count items from the front of the queue.
+    peek()
+        Returns the value of the item at the front of the queue, but does not remove it.
+    get_length()
+        Return the number of items in the queue.
+    is_empty()
+        Check if the queue is empty.
+    resize(capacity)
+        Move the items to a new array of the given capacity.
+    shrink()
+        Halve the capacity while the queue is less than a quarter full.
+
+    Attributes
+    ----------
+    queue_list : list
+        The circular array, its length is the capacity
+    front_index : int
+        The index of the front item in `queue_list`
+    length : int
+        The number of items in the queue
+    max_length : int
+        The maximum number of items, or -1 for an unbounded queue
+    """
     def __init__(self, max_length: int = -1) -> None:
-        self.items = []
+        """
+        Initialize a queue, optionally with a maximum length to create a bounded queue.
+
+        If the max_length parameter is omitted or negative, the queue is unbounded. If the max_length
+        is non-negative, the queue is bounded.
+
+        Parameters
+        ----------
+        max_length : int = -1
+            The optional maximum length of the queue
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the provided max_length is less than -1
+        """
+        if max_length < -1:
+            raise ValueError("max_length must be -1 (for unbounded) or a non-negative integer")
         self.max_length = max_length
+        self.queue_list = [None] * self.capacity_limit(MIN_CAPACITY)
+        self.front_index = 0
+        self.length = 0
+
+    def capacity_limit(self, capacity: int) -> int:
+        """
+        Return the capacity, reduced to the maximum length of a bounded queue.
+
+        Parameters
+        ----------
+        capacity : int
+
+        Returns
+        -------
+        int
+        """
+        return capacity if self.max_length < 0 else min(capacity, self.max_length)
+
+    def resize(self, capacity: int) -> None:
+        """
+        Move the items to a new array of the given capacity, starting at index 0.
+
+        The items are copied as at most two slices, the part up to the end of the array and the
+        part that wrapped around to its start.
+
+        Parameters
+        ----------
+        capacity : int
+            The new capacity, at least the number of items
+
+        Returns
+        -------
+        None
+        """
+        new_list = self.copy_front(self.length)
+        new_list.extend([None] * (capacity - self.length))
+        self.queue_list = new_list
+        self.front_index = 0
+
+    def copy_front(self, count: int) -> list:
+        """
+        Return a copy of the first count items, in queue order.
+
+        Parameters
+        ----------
+        count : int
+            At most the number of items
+
+        Returns
+        -------
+        list
+        """
+        stop = self.front_index + count
+        if stop <= len(self.queue_list):
+            return self.queue_list[self.front_index:stop]
+        return self.queue_list[self.front_index:] + self.queue_list[:stop - len(self.queue_list)]
+
+    def enqueue(self, item: Any) -> bool:
+        """
+        Add an item to the end of the queue, provided it doesn't exceed the given bound.
+
+        Parameters
+        ----------
+        item : Any
+            The item to be added to the queue.
+
+        Returns
+        -------
+        bool
+            True if the item was added, False if the queue is full
+        """
+        if self.length == self.max_length:
+            return False
+        if self.length == len(self.queue_list):
+            self.resize(self.capacity_limit(2 * len(self.queue_list)))
+        self.queue_list[(self.front_index + self.length) % len(self.queue_list)] = item
+        self.length += 1
+        return True
+
+    def enqueue_many(self, items: Iterable[Any]) -> int:
+        """
+        Add items to the end of the queue, up to the given bound.
+
+        The array is resized at most once, and the items are copied into it as at most two
+        slices, instead of one enqueue per item.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+
+        Returns
+        -------
+        int
+            The number of items added, fewer than given if the queue became full
+        """
+        items = list(items)
+        if self.max_length >= 0:
+            items = items[:self.max_length - self.length]
+        if not items:
+            return 0
+        new_length = self.length + len(items)
+        if new_length > len(self.queue_list):
+            capacity = len(self.queue_list)
+            while capacity < new_length:
+                capacity *= 2
+            self.resize(self.capacity_limit(capacity))
+        capacity = len(self.queue_list)
+        start = (self.front_index + self.length) % capacity
+        first_part = min(len(items), capacity - start)
+        self.queue_list[start:start + first_part] = items[:first_part]
+        self.queue_list[:len(items) - first_part] = items[first_part:]
+        self.length = new_length
+        return len(items)
+
+    def dequeue(self) -> Any:
+        """
+        Remove and return the item at the front of the queue.
+
+        Returns
+        -------
+        Any
+            The item at the front of the queue.
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty
+        """
+        if self.is_empty():
+            raise IndexError("Cannot dequeue from an empty queue")
+        item = self.queue_list[self.front_index]
+        # Clear the slot so the queue does not keep the item alive
+        self.queue_list[self.front_index] = None
+        self.front_index = (self.front_index + 1) % len(self.queue_list)
+        self.length -= 1
+        self.shrink()
+        return item
+
+    def dequeue_many(self, count: int) -> list:
+        """
+        Remove and return up to count items from the front of the queue.
+
+        Parameters
+        ----------
+        count : int
+
+        Returns
+        -------
+        list
+            The items in queue order, fewer than count if the queue held fewer
+
+        Raises
+        ------
+        ValueError
+            If count is negative
+        """
+        if count < 0:
+            raise ValueError("count must be a non-negative integer")
+        count = min(count, self.length)
+        items = self.copy_front(count)
+        capacity = len(self.queue_list)
+        stop = self.front_index + count
+        self.queue_list[self.front_index:min(stop, capacity)] = [None] * (min(stop, capacity) - self.front_index)
+        if stop > capacity:
+            self.queue_list[:stop - capacity] = [None] * (stop - capacity)
+        self.front_index = stop % capacity if capacity else 0
+        self.length -= count
+        self.shrink()
+        return items
+
+    def shrink(self) -> None:
+        """
+        Halve the capacity while the queue is less than a quarter full.
+
+        Halving at a quarter rather than at a half leaves room for the queue to grow again
+        before it must double, so alternating enqueues and dequeues never resize every time.
+
+        Returns
+        -------
+        None
+        """
+        capacity = len(self.queue_list)
+        if capacity > MIN_CAPACITY and self.length < capacity // 4:
+            new_capacity = capacity // 2
+            while new_capacity > MIN_CAPACITY and self.length < new_capacity // 4:
+                new_capacity //= 2
+            self.resize(max(new_capacity, MIN_CAPACITY))
+
+    def peek(self) -> Any:
+        """
+        Returns the value of the item at the front of the queue, but does not remove it.
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        IndexError
+            If the queue is empty
+        """
+        if self.is_empty():
+            raise IndexError("Cannot peek from an empty queue")
+        return self.queue_list[self.front_index]
+
+    def get_length(self) -> int:
+        """
+        Return the number of items in the queue.
+
+        Returns
+        -------
+        int
+        """
+        return len(self)
+
+    def __len__(self) -> int:
+        """
+        Override __len__ method to allow users to call `len(queue)`.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+        Check if the queue is empty.
 
-    def enqueue(self, value):
-        if self.
\ No newline at end of file
+        Returns
+        -------
+        bool
+        """
+        return self.length == 0
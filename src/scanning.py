@@ -0,0 +1,384 @@
+"""
+Linear scans over large unsorted numeric buffers.
+
+`searching.linear_search` compares the key with every element in the interpreter. The scans
+here work on the raw bytes of an `array`, `memoryview` or NumPy array instead: an equality
+scan packs the key into the buffer's item format and finds that byte pattern with
+`bytes.find`, which runs at memory speed in C. When NumPy is installed, comparisons and
+predicates are evaluated on whole chunks at once. Buffers are scanned in chunks of
+`SCAN_CHUNK_ITEMS` elements so that each chunk stays in cache while it is searched.
+"""
+import struct
+from array import array
+from itertools import compress, count
+from multiprocessing import shared_memory
+from typing import Callable
+
+from workerpool import map_in_processes
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it only enables the vectorized scan paths
+    np = None
+
+# Elements per chunk, 512 KB of 8-byte numbers, small enough to stay in the L2 cache
+SCAN_CHUNK_ITEMS = 1 << 16
+# find_first only starts worker processes for buffers of at least this many elements
+PARALLEL_SCAN_THRESHOLD = 10_000_000
+# Above this many keys, one set lookup per element beats one `bytes.find` per key in find_many
+PATTERN_SCAN_MAX_KEYS = 12
+FLOAT_FORMATS = frozenset("efd")
+
+
+def element_view(values) -> memoryview:
+    """
+    Return a one-dimensional memoryview of the numbers in an `array`, `memoryview` or NumPy array.
+
+    Parameters
+    ----------
+    values : array | memoryview | numpy.ndarray
+        A C-contiguous buffer of numbers in native byte order
+
+    Returns
+    -------
+    memoryview
+
+    Raises
+    ------
+    TypeError
+        If `values` does not support the buffer protocol, or does not hold native numbers
+    """
+    view = memoryview(values)
+    item_format = view.format.lstrip("@")
+    if len(item_format) != 1 or item_format not in "bBhHiIlLqQnNefd":
+        raise TypeError(f"cannot scan a buffer of format {view.format!r}")
+    if view.ndim != 1 or view.format != item_format:
+        view = view.cast("B").cast(item_format)
+    return view
+
+
+def key_patterns(item_format: str, key: int | float) -> list[bytes]:
+    """
+    Return the byte patterns of the elements that compare equal to the key.
+
+    Most keys have exactly one pattern. Float zero has two, 0.0 and -0.0, and keys that no
+    element can equal, such as NaN, 2.5 in an integer buffer or 2**70 in a 64-bit buffer,
+    have none.
+
+    Parameters
+    ----------
+    item_format : str
+        The struct format of one element
+    key : int|float
+
+    Returns
+    -------
+    list[bytes]
+    """
+    if item_format not in FLOAT_FORMATS and isinstance(key, float):
+        if not key.is_integer():
+            return []
+        key = int(key)
+    try:
+        pattern = struct.pack(item_format, key)
+    except (struct.error, OverflowError, TypeError):
+        return []
+    # Packing rounds floats to the element precision, so the packed value must still equal the key
+    if struct.unpack(item_format, pattern)[0] != key:
+        return []
+    if item_format in FLOAT_FORMATS and key == 0:
+        return [struct.pack(item_format, 0.0), struct.pack(item_format, -0.0)]
+    return [pattern]
+
+
+def find_pattern(data: bytes, pattern: bytes, itemsize: int, start: int = 0) -> int:
+    """
+    Return the byte offset of the first item-aligned occurrence of pattern, or -1.
+
+    Parameters
+    ----------
+    data : bytes
+    pattern : bytes
+    itemsize : int
+    start : int = 0
+        The byte offset the search starts at, a multiple of `itemsize`
+
+    Returns
+    -------
+    int
+    """
+    position = data.find(pattern, start)
+    # A match that straddles two elements is not an element equal to the key
+    while position != -1 and position % itemsize:
+        position = data.find(pattern, position + 1)
+    return position
+
+
+def chunk_bounds(length: int, start: int = 0, stop: int | None = None):
+    """
+    Yield the start and stop of each `SCAN_CHUNK_ITEMS` chunk of the range.
+
+    Parameters
+    ----------
+    length : int
+    start : int = 0
+    stop : int | None = None
+
+    Returns
+    -------
+    Iterator[tuple[int, int]]
+    """
+    stop = length if stop is None else min(stop, length)
+    for chunk_start in range(start, stop, SCAN_CHUNK_ITEMS):
+        yield chunk_start, min(chunk_start + SCAN_CHUNK_ITEMS, stop)
+
+
+def find_first_in_range(values, key: int | float, start: int = 0, stop: int | None = None) -> int:
+    """
+    Return the index of the first element of `values[start:stop]` equal to the key, or -1.
+
+    Parameters
+    ----------
+    values : array | memoryview | numpy.ndarray
+    key : int|float
+    start : int = 0
+    stop : int | None = None
+
+    Returns
+    -------
+    int
+    """
+    view = element_view(values)
+    if np is not None:
+        numbers = np.asarray(view)
+        for chunk_start, chunk_stop in chunk_bounds(len(view), start, stop):
+            hits = np.flatnonzero(numbers[chunk_start:chunk_stop] == key)
+            if len(hits):
+                return chunk_start + int(hits[0])
+        return -1
+
+    patterns = key_patterns(view.format, key)
+    itemsize = view.itemsize
+    for chunk_start, chunk_stop in chunk_bounds(len(view), start, stop):
+        data = view[chunk_start:chunk_stop].tobytes()
+        offsets = [offset for offset in (find_pattern(data, pattern, itemsize) for pattern in patterns)
+                   if offset != -1]
+        if offsets:
+            return chunk_start + min(offsets) // itemsize
+    return -1
+
+
+def scan_shared_range(block_name: str, item_format: str, key: int | float, start: int, stop: int) -> int:
+    """
+    Run `find_first_in_range` over a range of a shared memory buffer, in a worker process.
+
+    Parameters
+    ----------
+    block_name : str
+        The name of the shared memory block holding the buffer
+    item_format : str
+    key : int|float
+    start : int
+    stop : int
+
+    Returns
+    -------
+    int
+    """
+    block = shared_memory.SharedMemory(name=block_name)
+    view = block.buf.cast(item_format)
+    try:
+        return find_first_in_range(view, key, start, stop)
+    finally:
+        view.release()
+        block.close()
+
+
+def find_first(values, key: int | float, workers: int = 1) -> int:
+    """
+    Return the index of the first element equal to the key, or -1 if not found.
+
+    Equality follows `==`, so 0.0 finds -0.0, NaN finds nothing and an integer key finds an
+    equal float. With `workers` above one and at least `PARALLEL_SCAN_THRESHOLD` elements, the
+    buffer is copied once into shared memory and each worker process scans one contiguous
+    slice. The smallest index found by any worker is the global first index.
+
+    Parameters
+    ----------
+    values : array | memoryview | numpy.ndarray
+        The buffer to scan
+    key : int|float
+    workers : int = 1
+        The number of processes used for large buffers
+
+    Returns
+    -------
+    int
+    """
+    view = element_view(values)
+    length = len(view)
+    if workers <= 1 or length < PARALLEL_SCAN_THRESHOLD:
+        return find_first_in_range(view, key)
+
+    block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+    try:
+        block.buf[:view.nbytes] = view.cast("B")
+        bounds = [(length * w // workers, length * (w + 1) // workers) for w in range(workers)]
+        found = map_in_processes(
+            scan_shared_range,
+            [(block.name, view.format, key, start, stop) for start, stop in bounds],
+            workers,
+        )
+    finally:
+        block.close()
+        block.unlink()
+    return min((index for index in found if index != -1), default=-1)
+
+
+def find_all(values, key: int | float) -> array:
+    """
+    Return the indices of every element equal to the key.
+
+    Parameters
+    ----------
+    values : array | memoryview | numpy.ndarray
+    key : int|float
+
+    Returns
+    -------
+    array
+        An `array('q')` of indices in ascending order, a NumPy array when NumPy is installed
+    """
+    view = element_view(values)
+    if np is not None:
+        return np.flatnonzero(np.asarray(view) == key)
+
+    indices = array("q")
+    patterns = key_patterns(view.format, key)
+    itemsize = view.itemsize
+    for chunk_start, chunk_stop in chunk_bounds(len(view)):
+        data = view[chunk_start:chunk_stop].tobytes()
+        chunk_indices = []
+        for pattern in patterns:
+            offset = find_pattern(data, pattern, itemsize)
+            while offset != -1:
+                chunk_indices.append(chunk_start + offset // itemsize)
+                offset = find_pattern(data, pattern, itemsize, offset + itemsize)
+        indices.extend(sorted(chunk_indices))
+    return indices
+
+
+def find_where(values, predicate: Callable, first: bool = False, vectorized: bool = True) -> array | int:
+    """
+    Return the indices of the elements for which the predicate is true.
+
+    When NumPy is installed and `vectorized` is true, the predicate is called once per chunk
+    with a NumPy array and must return a boolean mask, so use `&` and `|` instead of `and`
+    and `or`, for example `lambda v: (v > 10) & (v % 2 == 0)`. Otherwise it is called once per
+    element, through `map` and `compress`.
+
+    Parameters
+    ----------
+    values : array | memoryview | numpy.ndarray
+    predicate : Callable
+    first : bool = False
+        Return only the first matching index, or -1, and stop scanning there
+    vectorized : bool = True
+        Whether the predicate accepts NumPy arrays
+
+    Returns
+    -------
+    array | int
+        An `array('q')` of indices in ascending order, or the first index if `first`
+    """
+    view = element_view(values)
+    numbers = np.asarray(view) if np is not None and vectorized else view
+    indices = array("q")
+    for chunk_start, chunk_stop in chunk_bounds(len(view)):
+        if numbers is view:
+            chunk_indices = compress(count(chunk_start), map(predicate, view[chunk_start:chunk_stop]))
+        else:
+            chunk_indices = (np.flatnonzero(predicate(numbers[chunk_start:chunk_stop])) + chunk_start).tolist()
+        if first:
+            for index in chunk_indices:
+                return index
+        else:
+            indices.extend(chunk_indices)
+    return -1 if first else indices
+
+
+def find_many(values, keys: list[int | float]) -> array:
+    """
+    Return the index of the first element equal to each key, or -1, in one pass over the buffer.
+
+    Each chunk is searched for every key that has not been found yet while the chunk is still
+    in cache, so the buffer is read from memory once however many keys there are, and the scan
+    stops as soon as every key has been found. While at most `PATTERN_SCAN_MAX_KEYS` keys are
+    left, each is found with `bytes.find`, and above that every element of the chunk is looked
+    up in a set of the keys with `map`, which costs the same however many keys there are.
+
+    Parameters
+    ----------
+    values : array | memoryview | numpy.ndarray
+    keys : list[int|float]
+
+    Returns
+    -------
+    array
+        An `array('q')` holding the first index of each key, or -1 if it was not found
+    """
+    view = element_view(values)
+    itemsize = view.itemsize
+    indices = array("q", [-1]) * len(keys)
+    # Duplicate keys share one search, and keys no element can equal are never searched
+    pending = {}
+    for position, key in enumerate(keys):
+        patterns = key_patterns(view.format, key)
+        if patterns:
+            pending.setdefault(patterns[0], (patterns, []))[1].append(position)
+    numbers = np.asarray(view) if np is not None else None
+
+    for chunk_start, chunk_stop in chunk_bounds(len(view)):
+        if not pending:
+            break
+        if numbers is not None:
+            chunk = numbers[chunk_start:chunk_stop]
+            wanted = np.frombuffer(b"".join(pending), dtype=chunk.dtype)
+            hits = np.flatnonzero(np.isin(chunk, wanted))
+            if not len(hits):
+                continue
+            found_values, first_hits = np.unique(chunk[hits], return_index=True)
+            found = {}
+            for value, hit in zip(found_values.tolist(), first_hits.tolist()):
+                for pattern in key_patterns(view.format, value):
+                    found[pattern] = min(found.get(pattern, chunk_start + int(hits[hit])),
+                                         chunk_start + int(hits[hit]))
+        elif len(pending) > PATTERN_SCAN_MAX_KEYS:
+            wanted = {struct.unpack(view.format, pattern)[0]: pattern for pattern in pending}
+            found = {}
+            chunk = view[chunk_start:chunk_stop]
+            for index in compress(count(chunk_start), map(wanted.__contains__, chunk)):
+                found.setdefault(wanted[view[index]], index)
+        else:
+            data = view[chunk_start:chunk_stop].tobytes()
+            found = {}
+            for pattern, (patterns, _) in pending.items():
+                offsets = [offset for offset in (find_pattern(data, p, itemsize) for p in patterns) if offset != -1]
+                if offsets:
+                    found[pattern] = chunk_start + min(offsets) // itemsize
+        for pattern, index in found.items():
+            if pattern in pending:
+                for position in pending.pop(pattern)[1]:
+                    indices[position] = index
+    return indices
+
+
+if __name__ == "__main__":
+    numbers = array("d", [4.0, -0.0, 7.5, 4.0, float("nan"), 7.5])
+    assert find_first(numbers, 7.5) == 2
+    assert find_first(numbers, 0) == 1
+    assert find_first(numbers, float("nan")) == -1
+    assert list(find_all(numbers, 4)) == [0, 3]
+    assert list(find_where(numbers, lambda value: value > 5)) == [2, 5]
+    assert find_where(numbers, lambda value: value > 5, first=True) == 2
+    assert list(find_many(numbers, [7.5, 1.0, 4.0])) == [2, -1, 0]
@@ -1,3 +1,33 @@
+"""
+Searching algorithm implementations
+
+Implementations of the following algorithms
+- linear search
+- binary search, for one key or for many keys per call
+- interpolation search
+- exponential search
+- adaptive search, which routes each lookup to the cheapest of the above
+"""
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from math import isqrt
+
+from workerpool import map_in_processes
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it only enables the vectorized search paths
+    np = None
+
+# binary_search_many only starts worker processes for at least this many keys
+PARALLEL_SEARCH_THRESHOLD = 1_000_000
+# Interpolation search falls back to binary search after this many probes that fail to halve the range
+INTERPOLATION_SLOW_PROBES = 2
+# AdaptiveSearch uses interpolation when sampled keys sit within this fraction of the list
+# from the position a straight line between the first and last key predicts
+INTERPOLATION_MAX_ERROR = 0.01
+
 
 def linear_search(numbers: list[int|float], key: int|float) -> int:
     """
@@ -20,7 +50,7 @@ def linear_search(numbers: list[int|float], key: int|float) -> int:
             return i
     return -1
 
-def binary_search(numbers: list[int|float], key: int|float) -> int:
+def binary_search(numbers: list[int|float], key: int|float, low: int = 0, high: int | None = None) -> int:
     """
     Perform a binary search on the given list of numbers for the provided key.
 
@@ -32,14 +62,18 @@ def binary_search(numbers: list[int|float], key: int|float) -> int:
         List of numbers to be searched. Must be sorted in ascending order.
     key : int|float
         Key value to search within the provided list.
+    low : int = 0
+        The lower bound of the range to be searched
+    high : int | None = None
+        The upper bound of the range to be searched, defaults to the last index
 
     Returns
     -------
     int
         The index of the found key, -1 if not found.
     """
-    low = 0
-    high = len(numbers) - 1
+    if high is None:
+        high = len(numbers) - 1
     while high >= low:
         mid = (high + low) // 2
         if numbers[mid] < key:
@@ -49,3 +83,221 @@ def binary_search(numbers: list[int|float], key: int|float) -> int:
         else:
             return mid
     return -1
+
+
+def binary_search_many(sorted_values: list[int | float], keys: list[int | float], workers: int = 1) -> array:
+    """
+    Search a sorted list for many keys in one call, returning the index of each key or -1.
+
+    The strategy is chosen by the shape of the input:
+    - NumPy arrays are searched with a vectorized `numpy.searchsorted`
+    - at least `PARALLEL_SEARCH_THRESHOLD` keys with `workers` above one are split into
+      chunks that are searched in worker processes
+    - sorted keys that are dense relative to `sorted_values` are matched with a merge-style
+      linear sweep, which visits each element of both lists at most once
+    - otherwise every key is binary searched with `bisect_left`, and sorted keys start each
+      search where the previous one ended
+
+    Unlike `binary_search`, a key that appears several times always maps to its first index.
+
+    Parameters
+    ----------
+    sorted_values : list[int|float]
+        Values to be searched. Must be sorted in ascending order.
+    keys : list[int|float]
+        Keys to search for, in any order
+    workers : int = 1
+        The number of processes used for large inputs
+
+    Returns
+    -------
+    array
+        An `array('q')` holding the index of each key, or -1 if it was not found, as a NumPy
+        array when either input is a NumPy array
+    """
+    if np is not None and (isinstance(sorted_values, np.ndarray) or isinstance(keys, np.ndarray)):
+        sorted_values = np.asarray(sorted_values)
+        keys = np.asarray(keys)
+        positions = np.searchsorted(sorted_values, keys, side="left")
+        found = positions < len(sorted_values)
+        found[found] = sorted_values[positions[found]] == keys[found]
+        return np.where(found, positions, -1)
+
+    if workers > 1 and len(keys) >= PARALLEL_SEARCH_THRESHOLD:
+        chunk_size = -(-len(keys) // workers)
+        tasks = [(sorted_values, keys[start:start + chunk_size]) for start in range(0, len(keys), chunk_size)]
+        indices = array("q")
+        for chunk_indices in map_in_processes(binary_search_many, tasks, workers):
+            indices.extend(chunk_indices)
+        return indices
+
+    indices = array("q", [-1]) * len(keys)
+    length = len(sorted_values)
+    keys_sorted = all(previous <= key for previous, key in zip(keys, islice(keys, 1, None)))
+    if keys_sorted and len(keys) * length.bit_length() >= length:
+        position = 0
+        for i, key in enumerate(keys):
+            while position < length and sorted_values[position] < key:
+                position += 1
+            if position < length and sorted_values[position] == key:
+                indices[i] = position
+        return indices
+
+    position = 0
+    for i, key in enumerate(keys):
+        position = bisect_left(sorted_values, key, position if keys_sorted else 0)
+        if position < length and sorted_values[position] == key:
+            indices[i] = position
+    return indices
+
+
+def interpolation_search(numbers: list[int|float], key: int|float, low: int = 0, high: int | None = None) -> int:
+    """
+    Perform an interpolation search on the given list of numbers for the provided key.
+
+    Instead of probing the middle of the range, each probe is placed where the key would be
+    if the values between `numbers[low]` and `numbers[high]` were evenly spaced. On
+    near-uniform keys such as timestamps and sequential IDs this takes O(log log n) probes.
+    A probe that fails to halve the range means the values are not evenly spaced there, and
+    after `INTERPOLATION_SLOW_PROBES` of those the rest of the range is binary searched, so
+    skewed data still costs O(log n).
+
+    Note that the input list of numbers must be sorted in ascending order.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+        List of numbers to be searched. Must be sorted in ascending order.
+    key : int|float
+        Key value to search within the provided list.
+    low : int = 0
+        The lower bound of the range to be searched
+    high : int | None = None
+        The upper bound of the range to be searched, defaults to the last index
+
+    Returns
+    -------
+    int
+        The index of the found key, -1 if not found.
+    """
+    if high is None:
+        high = len(numbers) - 1
+    slow_probes = 0
+    while low <= high and numbers[low] <= key <= numbers[high]:
+        if numbers[high] == numbers[low]:
+            return low
+        if slow_probes >= INTERPOLATION_SLOW_PROBES:
+            return binary_search(numbers, key, low, high)
+        previous_range = high - low
+        probe = low + int((key - numbers[low]) * (high - low) // (numbers[high] - numbers[low]))
+        if numbers[probe] < key:
+            low = probe + 1
+        elif numbers[probe] > key:
+            high = probe - 1
+        else:
+            return probe
+        if 2 * (high - low) > previous_range:
+            slow_probes += 1
+    return -1
+
+
+def exponential_search(numbers: list[int|float], key: int|float) -> int:
+    """
+    Perform an exponential search on the given list of numbers for the provided key.
+
+    The indices 1, 2, 4, 8, ... are probed until one holds a value of at least `key`, and
+    the range since the previous probe is binary searched. A key at index i costs about
+    2 * log2(i) probes, which beats `binary_search` for keys near the front of the list.
+
+    Note that the input list of numbers must be sorted in ascending order.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+        List of numbers to be searched. Must be sorted in ascending order.
+    key : int|float
+        Key value to search within the provided list.
+
+    Returns
+    -------
+    int
+        The index of the found key, -1 if not found.
+    """
+    if not numbers:
+        return -1
+    bound = 1
+    while bound < len(numbers) and numbers[bound] < key:
+        bound *= 2
+    return binary_search(numbers, key, bound // 2, min(bound, len(numbers) - 1))
+
+
+class AdaptiveSearch:
+    """
+    Search a sorted list, routing each lookup to the cheapest search for its key.
+
+    The key distribution is sampled once, when the searcher is created. Keys near the front of
+    the list go to `exponential_search`. The remaining keys go to `interpolation_search` if
+    the sample shows the keys are close to evenly spaced, and to `binary_search` otherwise.
+
+    Methods
+    -------
+    search(key)
+        Return the index of the key, -1 if not found.
+
+    Attributes
+    ----------
+    numbers : list[int|float]
+    front_key : int|float
+        Keys up to this value are routed to exponential search
+    uniform : bool
+        Whether the sample showed near-uniform keys
+    """
+    def __init__(self, numbers: list[int|float], sample_size: int = 64) -> None:
+        """
+        Sample the key distribution of a sorted list.
+
+        Parameters
+        ----------
+        numbers : list[int|float]
+            List of numbers to be searched. Must be sorted in ascending order.
+        sample_size : int = 64
+            The number of evenly spaced keys compared against a uniform spread
+
+        Returns
+        -------
+        None
+        """
+        self.numbers = numbers
+        length = len(numbers)
+        # Exponential search needs about 2 * log2(i) probes for index i, fewer than binary
+        # search's log2(n) while i is below sqrt(n)
+        self.front_key = numbers[isqrt(length - 1)] if length else None
+        self.uniform = False
+        if length > 2 and numbers[-1] != numbers[0]:
+            spread = numbers[-1] - numbers[0]
+            worst_error = 0.0
+            for sample in range(sample_size + 1):
+                index = sample * (length - 1) // sample_size
+                predicted = (numbers[index] - numbers[0]) * (length - 1) / spread
+                worst_error = max(worst_error, abs(predicted - index) / length)
+            self.uniform = worst_error <= INTERPOLATION_MAX_ERROR
+
+    def search(self, key: int|float) -> int:
+        """
+        Return the index of the key, -1 if not found.
+
+        Parameters
+        ----------
+        key : int|float
+
+        Returns
+        -------
+        int
+        """
+        if not self.numbers:
+            return -1
+        if key <= self.front_key:
+            return exponential_search(self.numbers, key)
+        if self.uniform:
+            return interpolation_search(self.numbers, key)
+        return binary_search(self.numbers, key)
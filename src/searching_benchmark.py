@@ -0,0 +1,151 @@
+"""
+Benchmarks for the search structures, compared against `searching.binary_search`.
+
+Usage
+-----
+python searching_benchmark.py --sizes 1000 1000000 100000000 --queries 100000
+"""
+import argparse
+import random
+import time
+from array import array
+
+from learnedindex import LearnedIndex
+from searching import binary_search
+from sortedindex import SortedIndex
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_QUERIES = 100_000
+
+
+def make_sorted_keys(size: int) -> array:
+    """
+    Return `size` sorted even integers, so that odd queries miss.
+
+    The keys are kept in an `array('q')` so that 10^8 keys still fit in memory.
+
+    Parameters
+    ----------
+    size : int
+
+    Returns
+    -------
+    array
+    """
+    return array("q", range(0, 2 * size, 2))
+
+
+def time_lookups(lookup, queries: list[int]) -> float:
+    """
+    Return the average seconds per call of `lookup` over the queries.
+
+    Parameters
+    ----------
+    lookup : Callable[[int], int]
+    queries : list[int]
+
+    Returns
+    -------
+    float
+    """
+    start = time.perf_counter()
+    for query in queries:
+        lookup(query)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def benchmark_sorted_index(sizes: tuple[int, ...] = DEFAULT_SIZES, queries: int = DEFAULT_QUERIES,
+                           seed: int = 0) -> list[dict]:
+    """
+    Compare `SortedIndex.find` with `binary_search` over the same sorted keys.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] = DEFAULT_SIZES
+        The numbers of keys to index
+    queries : int = DEFAULT_QUERIES
+        The number of random lookups per size, about half of which miss
+    seed : int = 0
+
+    Returns
+    -------
+    list[dict]
+        One entry per size with the keys "size", "build_seconds", "binary_search_ns",
+        "sorted_index_ns" and "index_bytes"
+    """
+    generator = random.Random(seed)
+    report = []
+    for size in sizes:
+        keys = make_sorted_keys(size)
+        lookups = [generator.randrange(2 * size) for _ in range(queries)]
+        start = time.perf_counter()
+        index = SortedIndex(keys, "q")
+        build_seconds = time.perf_counter() - start
+        report.append({
+            "size": size,
+            "build_seconds": build_seconds,
+            "binary_search_ns": time_lookups(lambda key: binary_search(keys, key), lookups) * 1e9,
+            "sorted_index_ns": time_lookups(index.find, lookups) * 1e9,
+            "index_bytes": index.memory_bytes(),
+        })
+    return report
+
+
+def benchmark_learned_index(sizes: tuple[int, ...] = DEFAULT_SIZES, queries: int = DEFAULT_QUERIES,
+                            seed: int = 0) -> list[dict]:
+    """
+    Compare `LearnedIndex.find` with `binary_search` over the same random sorted keys.
+
+    Parameters
+    ----------
+    sizes : tuple[int, ...] = DEFAULT_SIZES
+        The numbers of keys to index
+    queries : int = DEFAULT_QUERIES
+        The number of random lookups per size, about half of which miss
+    seed : int = 0
+
+    Returns
+    -------
+    list[dict]
+        One entry per size with the keys "size", "build_seconds", "binary_search_ns",
+        "learned_index_ns", "binary_search_probes", "learned_index_probes" and "index_bytes"
+    """
+    generator = random.Random(seed)
+    report = []
+    for size in sizes:
+        keys = array("q", sorted(generator.sample(range(2 * size), size)))
+        lookups = [generator.randrange(2 * size) for _ in range(queries)]
+        start = time.perf_counter()
+        index = LearnedIndex(keys)
+        build_seconds = time.perf_counter() - start
+        probes = index.average_probes(lookups)
+        report.append({
+            "size": size,
+            "build_seconds": build_seconds,
+            "binary_search_ns": time_lookups(lambda key: binary_search(keys, key), lookups) * 1e9,
+            "learned_index_ns": time_lookups(index.find, lookups) * 1e9,
+            "binary_search_probes": probes["binary_search"],
+            "learned_index_probes": probes["learned_index"],
+            "index_bytes": index.memory_bytes(),
+        })
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES)
+    options = parser.parse_args()
+
+    print(f"{'size':>11} {'build s':>9} {'binary_search ns':>17} {'SortedIndex ns':>15} {'index MB':>9}")
+    for row in benchmark_sorted_index(tuple(options.sizes), options.queries):
+        print(f"{row['size']:>11} {row['build_seconds']:>9.3f} {row['binary_search_ns']:>17.0f} "
+              f"{row['sorted_index_ns']:>15.0f} {row['index_bytes'] / 2 ** 20:>9.1f}")
+
+    print()
+    print(f"{'size':>11} {'build s':>9} {'binary_search ns':>17} {'LearnedIndex ns':>16} "
+          f"{'probes':>7} {'learned probes':>15} {'index KB':>9}")
+    for row in benchmark_learned_index(tuple(options.sizes), options.queries):
+        print(f"{row['size']:>11} {row['build_seconds']:>9.3f} {row['binary_search_ns']:>17.0f} "
+              f"{row['learned_index_ns']:>16.0f} {row['binary_search_probes']:>7.1f} "
+              f"{row['learned_index_probes']:>15.1f} {row['index_bytes'] / 2 ** 10:>9.1f}")
@@ -12,6 +12,9 @@ class Node:
     data : int
     next : Node
     """
+    # No per-instance __dict__, which roughly halves the size of a node
+    __slots__ = ("data", "next")
+
     def __init__(self, initial_data: int):
         self.data = initial_data
         self.next = None
@@ -0,0 +1,221 @@
+"""
+A static search index over sorted keys, stored in Eytzinger (breadth-first) order.
+
+A binary search over a plain sorted list jumps across the whole list on its first probes,
+so each probe of a large list is a cache miss. The Eytzinger layout stores the implicit
+binary search tree level by level: the root at index 1 and the children of index k at 2k and
+2k + 1. The first levels of every search share the same few cache lines, and the next probe
+is always near the current one.
+"""
+from array import array
+
+
+class SortedIndex:
+    """
+    A read-only index built once from sorted keys, answering searches in O(log n).
+
+    Keys are stored in Eytzinger order in a compact `array`, next to a parallel array mapping
+    each slot back to the key's index in the original sorted sequence. All results are
+    reported as indices into that original sequence.
+
+    Methods
+    -------
+    find(key)
+        Return the index of the first occurrence of key, or -1 if it is not found.
+    lower_bound(key)
+        Return the index of the first key that is not less than key.
+    upper_bound(key)
+        Return the index of the first key that is greater than key.
+    count_range(low, high)
+        Return the number of keys between low and high, inclusive.
+
+    Attributes
+    ----------
+    keys : array
+        The keys in Eytzinger order, slot 0 is unused
+    positions : array
+        The original index of the key in each slot
+    """
+    def __init__(self, sorted_values: list[int | float], typecode: str | None = None) -> None:
+        """
+        Build the index from keys sorted in ascending order.
+
+        Parameters
+        ----------
+        sorted_values : list[int|float]
+            The keys to be indexed. Must be sorted in ascending order.
+        typecode : str | None = None
+            The `array` typecode of the keys, defaults to "q" when every key is an integer
+            and "d" otherwise
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        OverflowError
+            If an integer key does not fit in the given typecode
+        """
+        if typecode is None:
+            typecode = "q" if all(isinstance(value, int) for value in sorted_values) else "d"
+        length = len(sorted_values)
+        self.keys = array(typecode, bytes(array(typecode).itemsize * (length + 1)))
+        self.positions = array("q", bytes(8 * (length + 1)))
+
+        # An in-order walk of the implicit tree visits the slots in sorted order
+        rank = 0
+        slot = 1
+        pending = []
+        while pending or slot <= length:
+            if slot <= length:
+                pending.append(slot)
+                slot = 2 * slot
+            else:
+                slot = pending.pop()
+                self.keys[slot] = sorted_values[rank]
+                self.positions[slot] = rank
+                rank += 1
+                slot = 2 * slot + 1
+
+    def __len__(self) -> int:
+        """
+        Return the number of indexed keys.
+
+        Returns
+        -------
+        int
+        """
+        return len(self.keys) - 1
+
+    def __contains__(self, key: int | float) -> bool:
+        """
+        Check if the key is in the index, to allow `key in index`.
+
+        Parameters
+        ----------
+        key : int | float
+
+        Returns
+        -------
+        bool
+        """
+        return self.find(key) != -1
+
+    def lower_bound_slot(self, key: int | float, inclusive: bool = False) -> int:
+        """
+        Return the slot of the first key not less than `key`, or greater than it if `inclusive`.
+
+        The descent does not branch on the comparison, it adds the comparison result to the
+        next slot index. When it falls off the tree, the answer is the last slot where the
+        descent went left, found by dropping the trailing one bits, plus one more bit, from
+        the final slot index.
+
+        Parameters
+        ----------
+        key : int | float
+        inclusive : bool = False
+            Step past keys equal to `key`, for an upper bound
+
+        Returns
+        -------
+        int
+            The slot, or 0 if every key is smaller
+        """
+        keys = self.keys
+        length = len(keys) - 1
+        slot = 1
+        if inclusive:
+            while slot <= length:
+                slot = 2 * slot + (keys[slot] <= key)
+        else:
+            while slot <= length:
+                slot = 2 * slot + (keys[slot] < key)
+        return slot >> (~slot & (slot + 1)).bit_length()
+
+    def find(self, key: int | float) -> int:
+        """
+        Return the index of the first occurrence of key, or -1 if it is not found.
+
+        Parameters
+        ----------
+        key : int | float
+
+        Returns
+        -------
+        int
+        """
+        slot = self.lower_bound_slot(key)
+        if slot and self.keys[slot] == key:
+            return self.positions[slot]
+        return -1
+
+    def lower_bound(self, key: int | float) -> int:
+        """
+        Return the index of the first key that is not less than key.
+
+        Parameters
+        ----------
+        key : int | float
+
+        Returns
+        -------
+        int
+            An index between 0 and `len(self)`
+        """
+        slot = self.lower_bound_slot(key)
+        return self.positions[slot] if slot else len(self)
+
+    def upper_bound(self, key: int | float) -> int:
+        """
+        Return the index of the first key that is greater than key.
+
+        Parameters
+        ----------
+        key : int | float
+
+        Returns
+        -------
+        int
+            An index between 0 and `len(self)`
+        """
+        slot = self.lower_bound_slot(key, inclusive=True)
+        return self.positions[slot] if slot else len(self)
+
+    def count_range(self, low: int | float, high: int | float) -> int:
+        """
+        Return the number of keys between low and high, inclusive.
+
+        Parameters
+        ----------
+        low : int | float
+        high : int | float
+
+        Returns
+        -------
+        int
+        """
+        return max(0, self.upper_bound(high) - self.lower_bound(low))
+
+    def memory_bytes(self) -> int:
+        """
+        Return the number of bytes used by the key and position arrays.
+
+        Returns
+        -------
+        int
+        """
+        return (self.keys.buffer_info()[1] * self.keys.itemsize
+                + self.positions.buffer_info()[1] * self.positions.itemsize)
+
+
+if __name__ == "__main__":
+    index = SortedIndex([2, 3, 3, 5, 8, 13])
+    assert len(index) == 6
+    assert index.find(3) == 1
+    assert index.find(4) == -1
+    assert index.lower_bound(4) == 3
+    assert index.upper_bound(3) == 3
+    assert index.upper_bound(13) == 6
+    assert index.count_range(3, 8) == 4
+    assert 13 in index
@@ -4,9 +4,82 @@ Sorting algorithm implementations
 Implementations of the following algorithms
 - selection sort
 - insertion sort
+- shell sort, with Ciura, Tokuda, Sedgewick and Pratt gap sequences
+- quicksort
+- introsort
+- merge sort
+- natural merge sort
+- radix sort
+- byte-wise LSD radix sort for 64-bit integers
+- heap sort, with a Floyd sift-down, d-ary variant
+
+and of selection without a full sort
+- nth element / select (introselect)
+- top k (bounded heap)
 """
+import heapq
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, it only enables the vectorized radix sort path
+    np = None
+
+# Ranges at or below this size are finished with insertion sort inside introsort
+INTROSORT_INSERTION_CUTOFF = 16
+# Ranges at or above this size use Tukey's ninther instead of median-of-three
+INTROSORT_NINTHER_THRESHOLD = 128
+# Consecutive wins by one run before natural merge sort switches to galloping
+MIN_GALLOP = 7
 
-def selection_sort(numbers: list[int]) -> None:
+
+def sort_decorated(numbers: list, sort_function: Callable[[list], None], key: Callable | None = None,
+                   reverse: bool = False, low_index: int = 0, high_index: int | None = None) -> None:
+    """
+    Sort `numbers[low_index:high_index + 1]` by key, using `sort_function` on decorated elements.
+
+    The key of each element is computed exactly once and kept in a parallel list of
+    (key, position) pairs, which `sort_function` sorts in place of the elements themselves.
+    The position breaks ties between equal keys, so the result is stable whichever algorithm
+    `sort_function` uses. For `reverse`, positions are negated before sorting ascending and
+    the result is reversed, which keeps equal keys in their original order.
+
+    Parameters
+    ----------
+    numbers : list
+        The list to be sorted (modified in-place)
+    sort_function : Callable[[list], None]
+        Sorts a whole list in-place in ascending order
+    key : Callable | None = None
+        Extracts the comparison key from each element, defaults to the element itself
+    reverse : bool = False
+    low_index : int = 0
+        The lower bound of the segment to be sorted
+    high_index : int | None = None
+        The upper bound of the segment to be sorted, defaults to the last index
+
+    Returns
+    -------
+    None
+    """
+    if high_index is None:
+        high_index = len(numbers) - 1
+    values = numbers[low_index:high_index + 1]
+    keys = values if key is None else [key(value) for value in values]
+    step = -1 if reverse else 1
+    decorated = [(key_value, position * step) for position, key_value in enumerate(keys)]
+    sort_function(decorated)
+    if reverse:
+        decorated.reverse()
+    numbers[low_index:high_index + 1] = [values[abs(position)] for _, position in decorated]
+
+
+def selection_sort(numbers: list[int], key: Callable | None = None, reverse: bool = False) -> None:
     """
     Implementation of the selection sort algorithm.
 
@@ -16,11 +89,18 @@ def selection_sort(numbers: list[int]) -> None:
     ----------
     numbers : list[int]
         The list of numbers to be sorted
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
 
     Returns
     -------
     None
     """
+    if key is not None or reverse:
+        sort_decorated(numbers, selection_sort, key, reverse)
+        return
     for i in range(len(numbers) - 1):
         index_smallest = i
         for j in range(i + 1, len(numbers)):
@@ -30,23 +110,42 @@ def selection_sort(numbers: list[int]) -> None:
             numbers[i], numbers[index_smallest] = numbers[index_smallest], numbers[i]
 
 
-def insertion_sort(numbers: list[int | float]) -> None:
+def insertion_sort(numbers: list[int | float], low_index: int = 0, high_index: int | None = None,
+                   key: Callable | None = None, reverse: bool = False) -> None:
     """
     Sort an array of integers or floating point numbers in-place in ascending order.
 
+    The current element is held aside while larger elements are shifted one position
+    to the right, so each step costs one assignment instead of a three-assignment swap.
+
     Parameters
     ----------
     numbers : list[int|float]
+    low_index : int = 0
+        The lower bound of the segment to be sorted
+    high_index : int | None = None
+        The upper bound of the segment to be sorted, defaults to the last index
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
 
     Returns
     -------
     None
     """
-    for i in range(1, len(numbers)):
-        j = i
-        while j > 0 and numbers[j] < numbers[j - 1]:
-            numbers[j], numbers[j - 1] = numbers[j - 1], numbers[j]
+    if key is not None or reverse:
+        sort_decorated(numbers, insertion_sort, key, reverse, low_index, high_index)
+        return
+    if high_index is None:
+        high_index = len(numbers) - 1
+    for i in range(low_index + 1, high_index + 1):
+        value = numbers[i]
+        j = i - 1
+        while j >= low_index and value < numbers[j]:
+            numbers[j + 1] = numbers[j]
             j -= 1
+        numbers[j + 1] = value
 
 
 def insertion_sort_interleaved(numbers: list[int], start_index: int, gap: int) -> None:
@@ -79,26 +178,206 @@ def insertion_sort_interleaved(numbers: list[int], start_index: int, gap: int) -
         raise ValueError("Invalid parameters")
 
     for i in range(start_index + gap, len(numbers), gap):
-        j = i
-        while (j - gap >= start_index) and (numbers[j] < numbers[j - gap]):
-            numbers[j], numbers[j - gap] = numbers[j - gap], numbers[j]
-            j = j - gap
+        value = numbers[i]
+        j = i - gap
+        while j >= start_index and value < numbers[j]:
+            numbers[j + gap] = numbers[j]
+            j -= gap
+        numbers[j + gap] = value
+
+
+def gap_insertion_sort(numbers: list[int], gap: int) -> None:
+    """
+    Sort every interleaved subarray of `numbers` with the given gap in one pass.
+
+    This is equivalent to calling `insertion_sort_interleaved` for every start index
+    below `gap`, without re-validating the arguments for each start index. The element
+    being inserted is held aside while larger elements are shifted `gap` positions right.
+
+    Parameters
+    ----------
+    numbers : list[int]
+        The list of integers to be partially sorted
+    gap : int
+        The step interval between elements in each interleaved subarray, at least one
+
+    Returns
+    -------
+    None
+    """
+    for i in range(gap, len(numbers)):
+        value = numbers[i]
+        j = i - gap
+        while j >= 0 and value < numbers[j]:
+            numbers[j + gap] = numbers[j]
+            j -= gap
+        numbers[j + gap] = value
+
+
+def ciura_gaps(limit: int) -> list[int]:
+    """
+    Return Ciura's gap sequence below `limit` in ascending order.
+
+    Ciura's empirically best gaps stop at 1750, larger gaps are extended by a factor of 2.25.
+
+    Parameters
+    ----------
+    limit : int
+
+    Returns
+    -------
+    list[int]
+    """
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] < limit:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in gaps if gap < limit] or [1]
+
+
+def tokuda_gaps(limit: int) -> list[int]:
+    """
+    Return Tokuda's gap sequence, ceil((9^k - 4^k) / (5 * 4^(k-1))), below `limit` in ascending order.
+
+    Parameters
+    ----------
+    limit : int
+
+    Returns
+    -------
+    list[int]
+    """
+    gaps = [1]
+    k = 2
+    while True:
+        gap = -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+        if gap >= limit:
+            return gaps
+        gaps.append(gap)
+        k += 1
+
+
+def sedgewick_gaps(limit: int) -> list[int]:
+    """
+    Return Sedgewick's 1986 gap sequence, 1 then 4^k + 3 * 2^(k-1) + 1, below `limit` in ascending order.
+
+    Parameters
+    ----------
+    limit : int
+
+    Returns
+    -------
+    list[int]
+    """
+    gaps = [1]
+    k = 1
+    while True:
+        gap = 4 ** k + 3 * 2 ** (k - 1) + 1
+        if gap >= limit:
+            return gaps
+        gaps.append(gap)
+        k += 1
+
+
+def pratt_gaps(limit: int) -> list[int]:
+    """
+    Return Pratt's gap sequence, every 2^p * 3^q, below `limit` in ascending order.
+
+    Parameters
+    ----------
+    limit : int
+
+    Returns
+    -------
+    list[int]
+    """
+    gaps = []
+    power_of_two = 1
+    while power_of_two < limit:
+        gap = power_of_two
+        while gap < limit:
+            gaps.append(gap)
+            gap *= 3
+        power_of_two *= 2
+    gaps.sort()
+    return gaps or [1]
+
+
+GAP_SEQUENCES = {
+    "ciura": ciura_gaps,
+    "tokuda": tokuda_gaps,
+    "sedgewick": sedgewick_gaps,
+    "pratt": pratt_gaps,
+}
+
+
+@lru_cache(maxsize=None)
+def cached_gap_values(sequence: str, size_class: int) -> tuple[int, ...]:
+    """
+    Return the named gap sequence below 2^size_class in descending order, cached per size class.
+
+    Parameters
+    ----------
+    sequence : str
+        A key of `GAP_SEQUENCES`
+    size_class : int
+        The bit length of the list sizes the gaps are for
+
+    Returns
+    -------
+    tuple[int, ...]
+    """
+    return tuple(reversed(GAP_SEQUENCES[sequence](1 << size_class)))
+
+
+def shell_sort_gaps(length: int, sequence: str = "ciura") -> list[int]:
+    """
+    Return the gap values for sorting a list of `length` elements, in descending order ending with 1.
+
+    Parameters
+    ----------
+    length : int
+        The length of the list to be sorted
+    sequence : str = "ciura"
+        The name of the gap sequence, one of "ciura", "tokuda", "sedgewick" or "pratt"
 
+    Returns
+    -------
+    list[int]
 
-def shell_sort(numbers: list[int], gap_values: list[int]) -> None:
+    Raises
+    ------
+    ValueError
+        If the gap sequence is unknown
+    """
+    if sequence not in GAP_SEQUENCES:
+        raise ValueError(f"Unknown gap sequence {sequence!r}, expected one of {', '.join(GAP_SEQUENCES)}")
+    return [gap for gap in cached_gap_values(sequence, length.bit_length()) if gap < length] or [1]
+
+
+def shell_sort(numbers: list[int], gap_values: list[int] | None = None, sequence: str = "ciura",
+               key: Callable | None = None, reverse: bool = False) -> None:
     """
     Sort a list of integers in-place using the Shell sort algorithm.
 
     The algorithm uses a sequence of gap values, which should typically be provided
     in descending order, with the final gap being 1 to ensure the list is fully sorted.
+    If no gap values are provided, they are taken from the named gap sequence for the
+    length of the list (see `shell_sort_gaps`).
 
     Parameters
     ----------
     numbers : list[int]
         A list of integers to be sorted
-    gap_values : list[int]
+    gap_values : list[int] | None = None
         A list of positive integers representing the gap sequence. This must contain at
         least one gap, and the final gap value should be 1.
+    sequence : str = "ciura"
+        The gap sequence used when `gap_values` is omitted, one of "ciura", "tokuda",
+        "sedgewick" or "pratt"
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
 
     Returns
     -------
@@ -108,18 +387,23 @@ def shell_sort(numbers: list[int], gap_values: list[int]) -> None:
     ------
     ValueError
         If an empty list is provided for the gap values, or if gap values
-        are provided in non-descending order, or do not end with one.
+        are provided in non-descending order, or do not end with one, or if
+        the gap sequence is unknown.
     """
     if not numbers:
         return None
-    if not gap_values:
+    if gap_values is None:
+        gap_values = shell_sort_gaps(len(numbers), sequence)
+    elif not gap_values:
         raise ValueError("You must provide gap values")
-    if gap_values != sorted(gap_values, reverse=True) or gap_values[-1] != 1:
+    elif gap_values[-1] != 1 or any(gap < next_gap for gap, next_gap in zip(gap_values, gap_values[1:])):
         raise ValueError("Gap values must be in descending order and end with 1")
+    if key is not None or reverse:
+        sort_decorated(numbers, lambda decorated: shell_sort(decorated, gap_values), key, reverse)
+        return
 
     for gap_value in gap_values:
-        for i in range(gap_value):
-            insertion_sort_interleaved(numbers, i, gap_value)
+        gap_insertion_sort(numbers, gap_value)
 
 
 def partition(numbers: list[int | float], low_index: int, high_index: int) -> int:
@@ -158,12 +442,14 @@ def partition(numbers: list[int | float], low_index: int, high_index: int) -> in
     return high_index
 
 
-def quicksort(numbers: list[int | float], low_index: int, high_index: int) -> None:
+def quicksort(numbers: list[int | float], low_index: int, high_index: int,
+              key: Callable | None = None, reverse: bool = False) -> None:
     """
     Sort a list in-place using quicksort algorithm.
 
     This implementation relies on the Hoare partition schema and
-    will select the pivot as the middle index of the given list.
+    will select the pivot as the middle index of the given list. Sorted-around-the-middle
+    or adversarial inputs make it quadratic and recursion-limited, use `introsort` for those.
 
     Parameters
     ----------
@@ -173,16 +459,150 @@ def quicksort(numbers: list[int | float], low_index: int, high_index: int) -> No
         The lower bound of the segment to be sorted
     high_index : int
         The upper bound of the segment to be sorted
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
     """
     # Our base case for recursion is where the partition size is 1 or zero elements
     if low_index >= high_index:
         return
+    if key is not None or reverse:
+        sort_decorated(numbers, lambda decorated: quicksort(decorated, 0, len(decorated) - 1),
+                       key, reverse, low_index, high_index)
+        return
 
     partition_index = partition(numbers, low_index, high_index)
     quicksort(numbers, low_index, partition_index)
     quicksort(numbers, partition_index + 1, high_index)
 
 
+def median_of_three(numbers: list[int | float], a: int, b: int, c: int) -> int:
+    """
+    Return whichever of the indices `a`, `b` and `c` holds the median value.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+    a : int
+    b : int
+    c : int
+
+    Returns
+    -------
+    int
+        The index of the median value
+    """
+    if numbers[a] < numbers[b]:
+        if numbers[b] < numbers[c]:
+            return b
+        return c if numbers[a] < numbers[c] else a
+    if numbers[a] < numbers[c]:
+        return a
+    return c if numbers[b] < numbers[c] else b
+
+
+def introsort_pivot_index(numbers: list[int | float], low_index: int, high_index: int) -> int:
+    """
+    Return the index of a pivot for the given segment.
+
+    Small segments use the median of the first, middle and last elements, large segments
+    use Tukey's ninther (the median of three medians-of-three) so that organ-pipe and
+    other patterned inputs still split close to the middle.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+    low_index : int
+        The lower bound of the segment
+    high_index : int
+        The upper bound of the segment
+
+    Returns
+    -------
+    int
+        The index of the chosen pivot
+    """
+    midpoint = low_index + (high_index - low_index) // 2
+    if high_index - low_index + 1 < INTROSORT_NINTHER_THRESHOLD:
+        return median_of_three(numbers, low_index, midpoint, high_index)
+    step = (high_index - low_index + 1) // 8
+    return median_of_three(
+        numbers,
+        median_of_three(numbers, low_index, low_index + step, low_index + 2 * step),
+        median_of_three(numbers, midpoint - step, midpoint, midpoint + step),
+        median_of_three(numbers, high_index - 2 * step, high_index - step, high_index),
+    )
+
+
+def introsort(numbers: list[int | float], low_index: int = 0, high_index: int | None = None,
+              key: Callable | None = None, reverse: bool = False) -> None:
+    """
+    Sort a list in-place using the introsort algorithm.
+
+    Introsort is quicksort built on `partition`, with three changes that give it an
+    O(n log n) worst case:
+    - the pivot is a median-of-three or ninther, moved to the middle index where
+      `partition` expects it
+    - segments are kept on an explicit stack instead of recursing, smaller side first,
+      so the stack never holds more than O(log n) segments
+    - segments of `INTROSORT_INSERTION_CUTOFF` elements or fewer are finished with
+      `insertion_sort`, and segments that are still being split after 2*log2(n)
+      partition levels are handed to `heap_sort`
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+        The list to be sorted (modified in-place)
+    low_index : int = 0
+        The lower bound of the segment to be sorted
+    high_index : int | None = None
+        The upper bound of the segment to be sorted, defaults to the last index
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
+
+    Returns
+    -------
+    None
+    """
+    if key is not None or reverse:
+        sort_decorated(numbers, introsort, key, reverse, low_index, high_index)
+        return
+    if high_index is None:
+        high_index = len(numbers) - 1
+    if high_index <= low_index:
+        return
+
+    depth_limit = 2 * ((high_index - low_index + 1).bit_length() - 1)
+    segments = [(low_index, high_index, depth_limit)]
+    while segments:
+        low, high, depth = segments.pop()
+        if high - low < INTROSORT_INSERTION_CUTOFF:
+            insertion_sort(numbers, low, high)
+            continue
+        if depth == 0:
+            segment = numbers[low:high + 1]
+            heap_sort(segment)
+            numbers[low:high + 1] = segment
+            continue
+
+        # partition() pivots on the middle element, so move the chosen pivot there
+        pivot_index = introsort_pivot_index(numbers, low, high)
+        midpoint = low + (high - low) // 2
+        numbers[pivot_index], numbers[midpoint] = numbers[midpoint], numbers[pivot_index]
+        partition_index = partition(numbers, low, high)
+
+        # Push the larger side first so the smaller side is sorted next
+        if partition_index - low > high - partition_index - 1:
+            segments.append((low, partition_index, depth - 1))
+            segments.append((partition_index + 1, high, depth - 1))
+        else:
+            segments.append((partition_index + 1, high, depth - 1))
+            segments.append((low, partition_index, depth - 1))
+
+
 def merge(numbers: list[int | float], i: int, j: int, k: int) -> None:
     """
     Merge two sorted subarrays into a single sorted subarray.
@@ -227,7 +647,7 @@ def merge(numbers: list[int | float], i: int, j: int, k: int) -> None:
         numbers[i + mp] = merged_numbers[mp]
 
 
-def merge_sort(numbers: list[int | float], i: int, k: int) -> None:
+def merge_sort(numbers: list[int | float], i: int, k: int, key: Callable | None = None, reverse: bool = False) -> None:
     """
     Sort a subarray in-place using the merge sort algorithm.
 
@@ -239,7 +659,14 @@ def merge_sort(numbers: list[int | float], i: int, k: int) -> None:
         Start index of the subarray to be sorted
     k : int
         End index of the subarray to be sorted
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
     """
+    if key is not None or reverse:
+        sort_decorated(numbers, lambda decorated: merge_sort(decorated, 0, len(decorated) - 1), key, reverse, i, k)
+        return
     if i < k:
         j = (i + k) // 2
         # recursively sort left and right partitions
@@ -249,6 +676,160 @@ def merge_sort(numbers: list[int | float], i: int, k: int) -> None:
         merge(numbers, i, j, k)
 
 
+def find_runs(numbers: list[int | float]) -> list[int]:
+    """
+    Split a list into ascending runs and return the run boundaries.
+
+    Non-descending runs are kept as they are, strictly descending runs are reversed in
+    place. Only strictly descending runs are reversed so that equal elements never change
+    their relative order.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+        The list to be split into runs (descending runs are reversed in-place)
+
+    Returns
+    -------
+    list[int]
+        The start index of every run followed by `len(numbers)`, e.g. [0, 4, 9, 12]
+        describes the runs [0, 4), [4, 9) and [9, 12)
+    """
+    boundaries = [0]
+    start = 0
+    while start < len(numbers):
+        end = start + 1
+        if end < len(numbers) and numbers[end] < numbers[start]:
+            while end + 1 < len(numbers) and numbers[end + 1] < numbers[end]:
+                end += 1
+            end += 1
+            numbers[start:end] = numbers[start:end][::-1]
+        else:
+            while end < len(numbers) and not numbers[end] < numbers[end - 1]:
+                end += 1
+        boundaries.append(end)
+        start = end
+    return boundaries
+
+
+def merge_runs(source: list[int | float], target: list[int | float], low: int, mid: int, high: int) -> None:
+    """
+    Merge the sorted runs `source[low:mid]` and `source[mid:high]` into `target[low:high]`.
+
+    Elements of the left run that are already smaller than the whole right run, and
+    elements of the right run that are already larger than the whole left run, are
+    copied as slices. When one run wins `MIN_GALLOP` times in a row the merge gallops,
+    using a binary search to find how many more elements it wins and copying them in a
+    single slice.
+
+    Parameters
+    ----------
+    source : list[int|float]
+        The list holding both runs
+    target : list[int|float]
+        The list that receives the merged run
+    low : int
+        Start index of the left run
+    mid : int
+        Start index of the right run (end of the left run)
+    high : int
+        End index (exclusive) of the right run
+
+    Returns
+    -------
+    None
+    """
+    if mid == high or not source[mid] < source[mid - 1]:
+        target[low:high] = source[low:high]
+        return
+
+    # Skip the left prefix that precedes the right run, and the right suffix that follows the left run
+    i = bisect_right(source, source[mid], low, mid)
+    target[low:i] = source[low:i]
+    right_end = bisect_left(source, source[mid - 1], mid, high)
+    target[right_end:high] = source[right_end:high]
+
+    j = mid
+    k = i
+    left_wins = 0
+    right_wins = 0
+    while i < mid and j < right_end:
+        if source[j] < source[i]:
+            target[k] = source[j]
+            k += 1
+            j += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP and j < right_end:
+                end = bisect_left(source, source[i], j, right_end)
+                target[k:k + end - j] = source[j:end]
+                k += end - j
+                j = end
+                right_wins = 0
+        else:
+            target[k] = source[i]
+            k += 1
+            i += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and i < mid:
+                end = bisect_right(source, source[j], i, mid)
+                target[k:k + end - i] = source[i:end]
+                k += end - i
+                i = end
+                left_wins = 0
+    # One of the runs is exhausted, copy what is left of the other
+    target[k:k + mid - i] = source[i:mid]
+    k += mid - i
+    target[k:right_end] = source[j:right_end]
+
+
+def natural_merge_sort(numbers: list[int | float], key: Callable | None = None, reverse: bool = False) -> None:
+    """
+    Sort a list in-place using a bottom-up, natural merge sort.
+
+    Unlike `merge_sort`, this version
+    - starts from the ascending and descending runs already present in the input
+      (see `find_runs`), so a sorted or reversed list costs a single O(n) pass
+    - merges adjacent runs iteratively instead of recursing
+    - allocates one auxiliary buffer up front and ping-pongs between it and `numbers`
+      on every pass, instead of allocating a temporary list per merge
+
+    The sort is stable.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+        The list to be sorted (sorted in-place)
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
+
+    Returns
+    -------
+    None
+    """
+    if key is not None or reverse:
+        sort_decorated(numbers, natural_merge_sort, key, reverse)
+        return
+    if len(numbers) < 2:
+        return
+    runs = find_runs(numbers)
+    source = numbers
+    target = numbers[:]
+    while len(runs) > 2:
+        merged_runs = [0]
+        for r in range(0, len(runs) - 1, 2):
+            high = runs[r + 2] if r + 2 < len(runs) else runs[r + 1]
+            merge_runs(source, target, runs[r], runs[r + 1], high)
+            merged_runs.append(high)
+        runs = merged_runs
+        source, target = target, source
+    if source is not numbers:
+        numbers[:] = source
+
+
 def radix_get_max_length(numbers: list[int]) -> int:
     """
     Return the maximum length of a number in numbers.
@@ -287,24 +868,45 @@ def radix_get_length(value: int) -> int:
     digits = 0
     while value != 0:
         digits += 1
-        value = int(value / 10)
+        value //= 10
     return digits
 
 
-def radix_sort(numbers: list[int]) -> None:
+def radix_sort(numbers: list[int], key: Callable | None = None, reverse: bool = False) -> None:
     """
     Sort an array of numbers using the radix sort algorithm.
 
     Note that this implementation of radix sort supports negative integers.
 
+    When sorting by `key`, each integer key is computed once and combined with the element's
+    position as `key * n + position`, so one radix sort over those integers orders by key and
+    keeps equal keys in their original order.
+
     Parameters
     ----------
     numbers : list[int]
+    key : Callable | None = None
+        Extracts the integer sort key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
 
     Returns
     -------
     None
     """
+    if key is not None or reverse:
+        values = numbers[:]
+        keys = values if key is None else [key(value) for value in values]
+        length = len(values)
+        decorated = [key_value * length + (length - 1 - position if reverse else position)
+                     for position, key_value in enumerate(keys)]
+        radix_sort(decorated)
+        if reverse:
+            decorated.reverse()
+            numbers[:] = [values[length - 1 - encoded % length] for encoded in decorated]
+        else:
+            numbers[:] = [values[encoded % length] for encoded in decorated]
+        return
     buckets = [[] for _ in range(10)]
     # find the max length of any number in the provided numbers
     max_digits = radix_get_max_length(numbers)
@@ -330,6 +932,122 @@ def radix_sort(numbers: list[int]) -> None:
     numbers.clear()
     numbers.extend(negatives + non_negatives)
 
+
+def radix_sort_int64(numbers: list[int] | array, digit_bits: int = 8) -> None:
+    """
+    Sort 64-bit signed integers in-place using a least significant digit radix sort.
+
+    Each pass sorts on one 8-bit or 16-bit digit of the two's complement value:
+    - digits are read straight out of the `array('q')` bytes instead of with division
+    - a counting pass plus prefix sum gives every digit its output offset, and elements
+      are scattered into one output buffer that is preallocated and reused for every pass
+    - passes where every element has the same digit are skipped, so small values only
+      pay for the digits they use
+    - negative values are handled by flipping the sign bit of the top digit, which just
+      visits the top digit's buckets in the order 0x80..0xFF, 0x00..0x7F
+
+    `list` input, and arrays of the other integer typecodes, are copied into an `array('q')`
+    first. `array('q')` input is sorted without converting it to a list. NumPy arrays take a vectorized path, when NumPy is installed.
+
+    Parameters
+    ----------
+    numbers : list[int] | array
+        A list, integer `array` or NumPy integer array, sorted in-place
+    digit_bits : int = 8
+        The size of each digit, either 8 (eight passes, 256 buckets) or
+        16 (four passes, 65536 buckets)
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If `digit_bits` is not 8 or 16
+    OverflowError
+        If a value does not fit in a signed 64-bit integer
+    """
+    if digit_bits not in (8, 16):
+        raise ValueError("digit_bits must be 8 or 16")
+    if np is not None and isinstance(numbers, np.ndarray):
+        radix_sort_int64_numpy(numbers, digit_bits)
+        return
+    keys = numbers if isinstance(numbers, array) and numbers.typecode == "q" else array("q", numbers)
+    if len(keys) < 2:
+        return
+    buffer = array("q", bytes(keys.itemsize * len(keys)))
+    radix = 1 << digit_bits
+    passes = 64 // digit_bits
+    for digit_index in range(passes):
+        # Little-endian machines store the least significant digit first
+        offset = digit_index if sys.byteorder == "little" else passes - 1 - digit_index
+        if digit_bits == 8:
+            digits = keys.tobytes()[offset::passes]
+        else:
+            digits = memoryview(keys.tobytes()).cast("H")[offset::passes]
+
+        digit_counts = Counter(digits)
+        if len(digit_counts) == 1:
+            continue
+        if digit_index == passes - 1:
+            bucket_order = list(range(radix // 2, radix)) + list(range(radix // 2))
+        else:
+            bucket_order = range(radix)
+        offsets = [0] * radix
+        total = 0
+        for digit in bucket_order:
+            offsets[digit] = total
+            total += digit_counts.get(digit, 0)
+
+        for value, digit in zip(keys, digits):
+            position = offsets[digit]
+            buffer[position] = value
+            offsets[digit] = position + 1
+        keys, buffer = buffer, keys
+
+    if isinstance(numbers, list):
+        numbers[:] = keys.tolist()
+    elif isinstance(numbers, array) and numbers.typecode != "q":
+        # Slice assignment needs an array of the same typecode
+        numbers[:] = array(numbers.typecode, keys)
+    elif keys is not numbers:
+        numbers[:] = keys
+
+
+def radix_sort_int64_numpy(numbers, digit_bits: int = 8) -> None:
+    """
+    Sort a NumPy integer array in-place with the same digit passes as `radix_sort_int64`.
+
+    The keys are reinterpreted as unsigned 64-bit integers with the sign bit flipped, so
+    no pass needs to special-case negatives. Each pass relies on NumPy's stable sort of
+    8-bit and 16-bit digits, which is itself a counting sort, and gathers into a
+    preallocated buffer.
+
+    Parameters
+    ----------
+    numbers : numpy.ndarray
+        A one-dimensional integer array, sorted in-place
+    digit_bits : int = 8
+        The size of each digit, either 8 or 16
+
+    Returns
+    -------
+    None
+    """
+    sign_bit = np.uint64(1 << 63)
+    keys = numbers.astype(np.int64).view(np.uint64) ^ sign_bit
+    buffer = np.empty_like(keys)
+    mask = np.uint64((1 << digit_bits) - 1)
+    digit_type = np.uint8 if digit_bits == 8 else np.uint16
+    for shift in range(0, 64, digit_bits):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(digit_type)
+        if (digits == digits[0]).all():
+            continue
+        np.take(keys, np.argsort(digits, kind="stable"), out=buffer)
+        keys, buffer = buffer, keys
+    numbers[...] = (keys ^ sign_bit).view(np.int64)
+
 def max_heap_percolate_down(node_index, heap_list, list_size):
     child_index = 2 * node_index + 1
     value = heap_list[node_index]
@@ -354,7 +1072,25 @@ def max_heap_percolate_down(node_index, heap_list, list_size):
         node_index = max_index
         child_index = 2 * node_index + 1
 
-def heap_sort(numbers):
+def heap_sort(numbers: list[int | float], key: Callable | None = None, reverse: bool = False) -> None:
+    """
+    Sort a list in-place using the heap sort algorithm.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
+
+    Returns
+    -------
+    None
+    """
+    if key is not None or reverse:
+        sort_decorated(numbers, heap_sort, key, reverse)
+        return
     i = len(numbers) // 2 - 1
     while i >= 0:
         max_heap_percolate_down(i, numbers, len(numbers))
@@ -367,4 +1103,252 @@ def heap_sort(numbers):
         numbers[0] = numbers[i]
         numbers[i] = temp
         max_heap_percolate_down(0, numbers, i)
-        i = i - 1
\ No newline at end of file
+        i = i - 1
+
+
+def max_heap_sift_down_floyd(value: int | float, node_index: int, heap_list: list[int | float],
+                             list_size: int, arity: int = 2) -> None:
+    """
+    Place `value` in the hole at `node_index` and restore the max heap property below it.
+
+    This uses Floyd's variant of percolate down. The hole first descends all the way to a
+    leaf, always moving the largest child up into it, which costs `arity - 1` comparisons per
+    level and never compares against `value`. The value then sifts up from that leaf, which
+    is usually only a level or two because the value being placed came from the bottom of the
+    heap. Elements are moved into the hole rather than swapped.
+
+    Parameters
+    ----------
+    value : int | float
+        The value to be placed, `heap_list[node_index]` is treated as empty
+    node_index : int
+        The index of the hole
+    heap_list : list[int|float]
+    list_size : int
+        The number of elements at the front of `heap_list` that make up the heap
+    arity : int = 2
+        The number of children per node
+
+    Returns
+    -------
+    None
+    """
+    start_index = node_index
+    child_index = arity * node_index + 1
+    while child_index < list_size:
+        max_index = child_index
+        for i in range(child_index + 1, min(child_index + arity, list_size)):
+            if heap_list[max_index] < heap_list[i]:
+                max_index = i
+        heap_list[node_index] = heap_list[max_index]
+        node_index = max_index
+        child_index = arity * node_index + 1
+
+    parent_index = (node_index - 1) // arity
+    while node_index > start_index and heap_list[parent_index] < value:
+        heap_list[node_index] = heap_list[parent_index]
+        node_index = parent_index
+        parent_index = (node_index - 1) // arity
+    heap_list[node_index] = value
+
+
+def floyd_heap_sort(numbers: list[int | float], arity: int = 4, key: Callable | None = None,
+                    reverse: bool = False) -> None:
+    """
+    Sort a list in-place using heap sort on a d-ary heap with Floyd's sift-down.
+
+    Compared to `heap_sort`, elements are moved into a hole instead of swapped, and
+    `max_heap_sift_down_floyd` roughly halves the comparisons made by each percolate down.
+    A 4-ary or 8-ary heap is shallower than a binary heap, and the children of a node sit
+    next to each other in memory.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+    arity : int = 4
+        The number of children per heap node, at least 2
+    key : Callable | None = None
+        Extracts the comparison key from each element, it is called exactly once per element
+    reverse : bool = False
+        Sort in descending order, elements with equal keys keep their original order
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If `arity` is less than 2
+    """
+    if arity < 2:
+        raise ValueError("arity must be at least 2")
+    if key is not None or reverse:
+        sort_decorated(numbers, lambda decorated: floyd_heap_sort(decorated, arity), key, reverse)
+        return
+
+    # Heapify from the last parent node upward
+    for i in range((len(numbers) - 2) // arity, -1, -1):
+        max_heap_sift_down_floyd(numbers[i], i, numbers, len(numbers), arity)
+
+    # Move the max to the end, then place the displaced last element starting from the root hole
+    for i in range(len(numbers) - 1, 0, -1):
+        value = numbers[i]
+        numbers[i] = numbers[0]
+        max_heap_sift_down_floyd(value, 0, numbers, i, arity)
+
+
+def median_of_medians(numbers: list[int | float], low_index: int, high_index: int) -> int:
+    """
+    Return the index of a median-of-medians pivot for the given segment.
+
+    The segment is split into groups of five, each group is sorted with `insertion_sort`
+    and its median moved to the front of the segment, and the median of those medians is
+    found with `nth_element`. The pivot is guaranteed to have at least 30% of the segment
+    on either side of it, which makes selection linear in the worst case.
+
+    Note: the segment is reordered.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+    low_index : int
+        The lower bound of the segment
+    high_index : int
+        The upper bound of the segment
+
+    Returns
+    -------
+    int
+        The index of the pivot
+    """
+    medians_end = low_index
+    for group_start in range(low_index, high_index + 1, 5):
+        group_end = min(group_start + 4, high_index)
+        insertion_sort(numbers, group_start, group_end)
+        median_index = group_start + (group_end - group_start) // 2
+        numbers[medians_end], numbers[median_index] = numbers[median_index], numbers[medians_end]
+        medians_end += 1
+    middle_index = low_index + (medians_end - 1 - low_index) // 2
+    nth_element(numbers, middle_index, low_index, medians_end - 1)
+    return middle_index
+
+
+def nth_element(numbers: list[int | float], k: int, low_index: int = 0, high_index: int | None = None) -> None:
+    """
+    Partially order a list in-place so that `numbers[k]` holds the value it would hold if sorted.
+
+    Afterwards every element before index k is less than or equal to `numbers[k]`, and every
+    element after it is greater than or equal to it, without sorting either side. This is
+    introselect: it repeatedly calls `partition` and keeps only the side holding index k,
+    picking pivots like `introsort`. If the segment is still being split after 2*log2(n)
+    partitions it switches to `median_of_medians` pivots, which bounds the worst case at O(n).
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+        The list to be partially ordered (modified in-place)
+    k : int
+        The index to be placed, between `low_index` and `high_index`
+    low_index : int = 0
+        The lower bound of the segment to be ordered
+    high_index : int | None = None
+        The upper bound of the segment to be ordered, defaults to the last index
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    IndexError
+        If k is outside the segment
+    """
+    if high_index is None:
+        high_index = len(numbers) - 1
+    if not low_index <= k <= high_index:
+        raise IndexError("k is outside the segment being ordered")
+
+    depth = 2 * ((high_index - low_index + 1).bit_length() - 1)
+    while high_index > low_index:
+        if high_index - low_index < INTROSORT_INSERTION_CUTOFF:
+            insertion_sort(numbers, low_index, high_index)
+            return
+        if depth > 0:
+            pivot_index = introsort_pivot_index(numbers, low_index, high_index)
+            depth -= 1
+        else:
+            pivot_index = median_of_medians(numbers, low_index, high_index)
+
+        # partition() pivots on the middle element, so move the chosen pivot there
+        midpoint = low_index + (high_index - low_index) // 2
+        numbers[pivot_index], numbers[midpoint] = numbers[midpoint], numbers[pivot_index]
+        partition_index = partition(numbers, low_index, high_index)
+        if k <= partition_index:
+            high_index = partition_index
+        else:
+            low_index = partition_index + 1
+
+
+def select(numbers: list[int | float], k: int) -> int | float:
+    """
+    Return the k-th smallest value (counting from 0) of a list, without sorting it.
+
+    Note: `numbers` is not modified, `nth_element` runs on a copy.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+    k : int
+        The rank of the value to return, `len(numbers) // 2` for the median
+
+    Returns
+    -------
+    int | float
+
+    Raises
+    ------
+    IndexError
+        If k is not a valid index of `numbers`
+    """
+    if not 0 <= k < len(numbers):
+        raise IndexError("k is out of range")
+    values = list(numbers)
+    nth_element(values, k)
+    return values[k]
+
+
+def top_k(iterable: Iterable, k: int, key: Callable | None = None) -> list:
+    """
+    Return the k largest items of an iterable in descending order, in O(n log k) time and O(k) memory.
+
+    The items are streamed through a min-heap that never holds more than k entries, whose
+    root is the smallest item kept so far. An item is only pushed if it beats the root.
+    Items with equal keys are returned in the order they arrived, like
+    `sorted(iterable, key=key, reverse=True)[:k]`.
+
+    Parameters
+    ----------
+    iterable : Iterable
+    k : int
+        The number of items to return
+    key : Callable | None = None
+        Extracts the comparison key from each item, it is called exactly once per item
+
+    Returns
+    -------
+    list
+        Up to k items, largest first
+    """
+    if k <= 0:
+        return []
+    # Entries are (key, -arrival, item), so for equal keys the latest arrival is evicted first
+    heap = []
+    for arrival, item in enumerate(iterable):
+        item_key = item if key is None else key(item)
+        if len(heap) < k:
+            heapq.heappush(heap, (item_key, -arrival, item))
+        elif heap[0][0] < item_key:
+            heapq.heapreplace(heap, (item_key, -arrival, item))
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
@@ -0,0 +1,360 @@
+"""
+Benchmark and regression suite for the algorithms in `sorting`.
+
+Every algorithm is run over every input distribution and size, recording wall time,
+comparisons, swaps and peak memory. Results are written to JSON, and a stored baseline can
+be compared against a new run to catch performance regressions.
+
+Usage
+-----
+python sorting_benchmark.py --sizes 100 1000 10000 --output results.json
+python sorting_benchmark.py --baseline results.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable
+
+import sorting
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique", "organ_pipe", "nearly_sorted")
+DEFAULT_SIZES = (100, 1_000, 10_000)
+# Inputs above this size skip the instrumented run that counts comparisons and swaps
+DEFAULT_COUNT_LIMIT = 100_000
+
+
+class Algorithm:
+    """
+    A sorting algorithm under benchmark.
+
+    Attributes
+    ----------
+    name : str
+    sort : Callable[[list], None]
+        Sorts a list in-place
+    max_size : int
+        Larger inputs are skipped, so quadratic algorithms are not run at 10^7 elements
+    countable : bool
+        False for algorithms that do not compare elements through Python, or that move
+        them outside the list, where comparison and swap counts would be meaningless
+    """
+    def __init__(self, name: str, sort: Callable[[list], None], max_size: int = 10 ** 7, countable: bool = True):
+        self.name = name
+        self.sort = sort
+        self.max_size = max_size
+        self.countable = countable
+
+
+ALGORITHMS = {
+    algorithm.name: algorithm for algorithm in (
+        Algorithm("selection_sort", sorting.selection_sort, max_size=10_000),
+        Algorithm("insertion_sort", sorting.insertion_sort, max_size=10_000),
+        Algorithm("shell_sort", sorting.shell_sort),
+        Algorithm("quicksort", lambda numbers: sorting.quicksort(numbers, 0, len(numbers) - 1)),
+        Algorithm("introsort", sorting.introsort),
+        Algorithm("merge_sort", lambda numbers: sorting.merge_sort(numbers, 0, len(numbers) - 1)),
+        Algorithm("natural_merge_sort", sorting.natural_merge_sort),
+        Algorithm("heap_sort", sorting.heap_sort),
+        Algorithm("floyd_heap_sort_2", lambda numbers: sorting.floyd_heap_sort(numbers, arity=2)),
+        Algorithm("floyd_heap_sort_4", lambda numbers: sorting.floyd_heap_sort(numbers, arity=4)),
+        Algorithm("floyd_heap_sort_8", lambda numbers: sorting.floyd_heap_sort(numbers, arity=8)),
+        Algorithm("radix_sort", sorting.radix_sort, countable=False),
+        Algorithm("radix_sort_int64", sorting.radix_sort_int64, countable=False),
+        Algorithm("list.sort", list.sort, countable=False),
+    )
+}
+
+
+def make_input(distribution: str, size: int, seed: int = 0) -> list[int]:
+    """
+    Return a list of integers with the given distribution.
+
+    The same distribution, size and seed always give the same list, so runs can be compared.
+
+    Parameters
+    ----------
+    distribution : str
+        One of `DISTRIBUTIONS`
+    size : int
+    seed : int = 0
+
+    Returns
+    -------
+    list[int]
+
+    Raises
+    ------
+    ValueError
+        If the distribution is unknown
+    """
+    generator = random.Random(f"{seed}-{distribution}-{size}")
+    if distribution == "random":
+        return [generator.randint(-size * 10, size * 10) for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(size))
+    if distribution == "reversed":
+        return list(range(size, 0, -1))
+    if distribution == "few_unique":
+        return [generator.randint(0, 9) for _ in range(size)]
+    if distribution == "organ_pipe":
+        return list(range(size // 2)) + list(range(size - size // 2, 0, -1))
+    if distribution == "nearly_sorted":
+        # Swap 1% of the elements with a random partner
+        numbers = list(range(size))
+        for _ in range(size // 100):
+            i = generator.randrange(size)
+            j = generator.randrange(size)
+            numbers[i], numbers[j] = numbers[j], numbers[i]
+        return numbers
+    raise ValueError(f"Unknown distribution {distribution!r}")
+
+
+class CountedValue:
+    """
+    An integer wrapper that counts every comparison made between wrapped values.
+    """
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __lt__(self, other: "CountedValue") -> bool:
+        CountedValue.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "CountedValue") -> bool:
+        CountedValue.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "CountedValue") -> bool:
+        CountedValue.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "CountedValue") -> bool:
+        CountedValue.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: "CountedValue") -> bool:
+        CountedValue.comparisons += 1
+        return self.value == other.value
+
+
+class CountingList(list):
+    """
+    A list that counts element writes, including writes into the slices it hands out as buffers.
+    """
+    writes = 0
+
+    def __setitem__(self, index, value) -> None:
+        CountingList.writes += len(value) if isinstance(index, slice) else 1
+        super().__setitem__(index, value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CountingList(super().__getitem__(index))
+        return super().__getitem__(index)
+
+
+def measure(algorithm: Algorithm, numbers: list[int], repeat: int = 1, count_limit: int = DEFAULT_COUNT_LIMIT) -> dict:
+    """
+    Run one algorithm on one input and return its measurements.
+
+    Wall time is the best of `repeat` plain runs. Peak memory comes from a separate run under
+    `tracemalloc`, and comparisons and swaps from a third run over `CountedValue` elements in
+    a `CountingList`. A swap is counted as two element writes, so a shift counts as half a swap.
+
+    Parameters
+    ----------
+    algorithm : Algorithm
+    numbers : list[int]
+        The input, which is copied for every run and never modified
+    repeat : int = 1
+    count_limit : int = DEFAULT_COUNT_LIMIT
+        Larger inputs skip the counting run
+
+    Returns
+    -------
+    dict
+        The keys "seconds", "peak_memory_bytes", "comparisons", "swaps" and "error". Counts
+        are None when they were not measured, and "error" holds the exception raised, if any.
+    """
+    result = {"seconds": None, "peak_memory_bytes": None, "comparisons": None, "swaps": None, "error": None}
+    try:
+        best = None
+        for _ in range(repeat):
+            data = numbers[:]
+            start = time.perf_counter()
+            algorithm.sort(data)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        if data != sorted(numbers):
+            raise AssertionError("output is not sorted")
+        result["seconds"] = best
+
+        data = numbers[:]
+        tracemalloc.start()
+        try:
+            algorithm.sort(data)
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        if algorithm.countable and len(numbers) <= count_limit:
+            data = CountingList(CountedValue(number) for number in numbers)
+            CountedValue.comparisons = 0
+            CountingList.writes = 0
+            algorithm.sort(data)
+            result["comparisons"] = CountedValue.comparisons
+            result["swaps"] = CountingList.writes / 2
+    except (RecursionError, AssertionError) as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def run_benchmarks(algorithms: list[str] | None = None, distributions: list[str] | None = None,
+                   sizes: list[int] | None = None, repeat: int = 1, count_limit: int = DEFAULT_COUNT_LIMIT,
+                   seed: int = 0) -> dict:
+    """
+    Run every algorithm over every distribution and size.
+
+    Parameters
+    ----------
+    algorithms : list[str] | None = None
+        Names from `ALGORITHMS`, defaults to all of them
+    distributions : list[str] | None = None
+        Names from `DISTRIBUTIONS`, defaults to all of them
+    sizes : list[int] | None = None
+        Defaults to `DEFAULT_SIZES`
+    repeat : int = 1
+    count_limit : int = DEFAULT_COUNT_LIMIT
+    seed : int = 0
+
+    Returns
+    -------
+    dict
+        A JSON-serializable report with "metadata" and a "results" list holding one entry per
+        algorithm, distribution and size
+    """
+    report = {
+        "metadata": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": seed,
+        },
+        "results": [],
+    }
+    for size in sizes or DEFAULT_SIZES:
+        for distribution in distributions or DISTRIBUTIONS:
+            numbers = make_input(distribution, size, seed)
+            for name in algorithms or ALGORITHMS:
+                algorithm = ALGORITHMS[name]
+                if size > algorithm.max_size:
+                    continue
+                entry = {"algorithm": name, "distribution": distribution, "size": size}
+                entry.update(measure(algorithm, numbers, repeat, count_limit))
+                report["results"].append(entry)
+    return report
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float = 0.25) -> list[dict]:
+    """
+    Return the measurements in `report` that regressed against `baseline`.
+
+    Comparisons and swaps are deterministic for a given seed, so any increase is a regression.
+    Wall time and peak memory are noisy, so they only regress when they grow by more than
+    `tolerance`.
+
+    Parameters
+    ----------
+    report : dict
+        The output of `run_benchmarks`
+    baseline : dict
+        A stored output of `run_benchmarks`
+    tolerance : float = 0.25
+        The allowed relative growth of wall time and peak memory
+
+    Returns
+    -------
+    list[dict]
+        One entry per regressed metric, with the keys "algorithm", "distribution", "size",
+        "metric", "baseline" and "current"
+    """
+    baseline_results = {
+        (entry["algorithm"], entry["distribution"], entry["size"]): entry for entry in baseline["results"]
+    }
+    regressions = []
+    for entry in report["results"]:
+        previous = baseline_results.get((entry["algorithm"], entry["distribution"], entry["size"]))
+        if previous is None:
+            continue
+        for metric, allowed in (("seconds", tolerance), ("peak_memory_bytes", tolerance),
+                                ("comparisons", 0), ("swaps", 0)):
+            if entry[metric] is None or previous[metric] is None:
+                continue
+            if entry[metric] > previous[metric] * (1 + allowed):
+                regressions.append({
+                    "algorithm": entry["algorithm"],
+                    "distribution": entry["distribution"],
+                    "size": entry["size"],
+                    "metric": metric,
+                    "baseline": previous[metric],
+                    "current": entry[metric],
+                })
+    return regressions
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Run the benchmark from the command line.
+
+    Parameters
+    ----------
+    arguments : list[str] | None = None
+        Defaults to `sys.argv[1:]`
+
+    Returns
+    -------
+    int
+        The exit status, 1 if any regression against the baseline was found
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS))
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--count-limit", type=int, default=DEFAULT_COUNT_LIMIT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    options = parser.parse_args(arguments)
+
+    report = run_benchmarks(options.algorithms, options.distributions, options.sizes,
+                            options.repeat, options.count_limit, options.seed)
+    for entry in report["results"]:
+        seconds = "error" if entry["error"] else f"{entry['seconds']:.4f}s"
+        print(f"{entry['algorithm']:>20} {entry['distribution']:>14} {entry['size']:>9} {seconds:>10} "
+              f"cmp={entry['comparisons']} swaps={entry['swaps']} peak={entry['peak_memory_bytes']}")
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            regressions = compare_to_baseline(report, json.load(baseline_file), options.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression['algorithm']} {regression['distribution']} {regression['size']} "
+                  f"{regression['metric']}: {regression['baseline']} -> {regression['current']}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
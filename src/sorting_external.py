@@ -0,0 +1,266 @@
+"""
+External merge sort for datasets that do not fit in memory.
+
+Records are fixed-size binary numbers in native byte order, as written by `array.tofile`,
+either signed 64-bit integers (typecode "q") or 64-bit floats (typecode "d").
+"""
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator
+
+from sorting import natural_merge_sort, radix_sort_int64
+from workerpool import map_in_processes
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+# Working memory per record while a run is sorted. Integer runs hold the run plus the radix
+# sort's scatter buffer, float runs are sorted as a list of boxed floats (8-byte pointer plus
+# 24-byte float) plus the merge sort buffer.
+RUN_BYTES_PER_RECORD = {"q": 16, "d": 48}
+# The smallest block, in records, read from each run or written to the output during the merge
+MIN_MERGE_BLOCK = 1024
+# The most runs merged, and so files open, at once. More runs are merged in several passes.
+MAX_MERGE_FAN_IN = 128
+
+
+def read_records(path: str | os.PathLike, typecode: str = "q", block_records: int = 65536) -> Iterator[int | float]:
+    """
+    Yield the records of a binary file, reading `block_records` records at a time.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+    typecode : str = "q"
+        The array typecode of the records, "q" or "d"
+    block_records : int = 65536
+        The number of records read per block
+
+    Returns
+    -------
+    Iterator[int|float]
+    """
+    with open(path, "rb") as record_file:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(record_file, block_records)
+            except EOFError:
+                # fromfile keeps the records it did read before reaching the end of the file
+                pass
+            if not block:
+                return
+            yield from block
+
+
+def write_records(path: str | os.PathLike, records: Iterable[int | float], typecode: str = "q",
+                  block_records: int = 65536) -> int:
+    """
+    Write records to a binary file, `block_records` records at a time.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+    records : Iterable[int|float]
+    typecode : str = "q"
+        The array typecode of the records, "q" or "d"
+    block_records : int = 65536
+        The number of records buffered before each write
+
+    Returns
+    -------
+    int
+        The number of records written
+    """
+    records = iter(records)
+    written = 0
+    with open(path, "wb") as record_file:
+        while True:
+            block = array(typecode, islice(records, block_records))
+            if not block:
+                return written
+            block.tofile(record_file)
+            written += len(block)
+
+
+def sort_run(values: array, run_dir: str) -> str:
+    """
+    Sort one run with the package's sorts and spill it to a file in `run_dir`.
+
+    Integer runs use `radix_sort_int64` directly on the array, float runs use
+    `natural_merge_sort`, which is cheap on the partially ordered feeds this is used for.
+
+    Parameters
+    ----------
+    values : array
+        The records of the run
+    run_dir : str
+        The directory the run file is created in
+
+    Returns
+    -------
+    str
+        The path of the run file
+    """
+    if values.typecode == "q":
+        radix_sort_int64(values)
+    else:
+        numbers = values.tolist()
+        natural_merge_sort(numbers)
+        values = array(values.typecode, numbers)
+    file_descriptor, run_path = tempfile.mkstemp(suffix=".run", dir=run_dir)
+    with os.fdopen(file_descriptor, "wb") as run_file:
+        values.tofile(run_file)
+    return run_path
+
+
+def sort_file_run(path: str | os.PathLike, start: int, count: int, typecode: str, run_dir: str) -> str:
+    """
+    Read `count` records starting at record `start` of `path`, then sort and spill them as a run.
+
+    Reading inside the worker means only the file offsets are sent to worker processes.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+    start : int
+        The index of the first record of the run
+    count : int
+        The number of records in the run
+    typecode : str
+    run_dir : str
+
+    Returns
+    -------
+    str
+        The path of the run file
+    """
+    values = array(typecode)
+    with open(path, "rb") as input_file:
+        input_file.seek(start * values.itemsize)
+        values.fromfile(input_file, count)
+    return sort_run(values, run_dir)
+
+
+def merge_run_files(run_paths: list[str], output_path: str | os.PathLike, typecode: str, block_records: int) -> int:
+    """
+    Stream a k-way heap merge of sorted run files into `output_path`.
+
+    Parameters
+    ----------
+    run_paths : list[str]
+    output_path : str | os.PathLike
+    typecode : str
+    block_records : int
+        The number of records buffered per run and for the output
+
+    Returns
+    -------
+    int
+        The number of records written
+    """
+    runs = [read_records(run_path, typecode, block_records) for run_path in run_paths]
+    return write_records(output_path, heapq.merge(*runs), typecode, block_records)
+
+
+def merge_pass(run_paths: list[str], run_dir: str, typecode: str, block_records: int,
+               fan_in: int = MAX_MERGE_FAN_IN) -> list[str]:
+    """
+    Merge groups of at most `fan_in` runs into longer runs in `run_dir`, deleting the merged runs.
+
+    Parameters
+    ----------
+    run_paths : list[str]
+    run_dir : str
+    typecode : str
+    block_records : int
+        The number of records buffered per run and for the output
+    fan_in : int = MAX_MERGE_FAN_IN
+        The most runs merged at once
+
+    Returns
+    -------
+    list[str]
+        The paths of the merged runs, in the order of their groups
+    """
+    merged_paths = []
+    for start in range(0, len(run_paths), fan_in):
+        group = run_paths[start:start + fan_in]
+        file_descriptor, merged_path = tempfile.mkstemp(suffix=".run", dir=run_dir)
+        os.close(file_descriptor)
+        merge_run_files(group, merged_path, typecode, block_records)
+        for run_path in group:
+            os.remove(run_path)
+        merged_paths.append(merged_path)
+    return merged_paths
+
+
+def external_sort(source: str | os.PathLike | Iterable[int | float], output_path: str | os.PathLike,
+                  memory_limit: int = DEFAULT_MEMORY_LIMIT, temp_dir: str | None = None,
+                  typecode: str = "q", workers: int = 1) -> int:
+    """
+    Sort a binary record file, or an iterable of numbers, that may be larger than memory.
+
+    The input is cut into runs that fit in `memory_limit`, each run is sorted with the
+    package's sorts (see `sort_run`) and spilled to a binary file in `temp_dir`, and the run
+    files are streamed through a k-way heap merge into `output_path`. At most MAX_MERGE_FAN_IN
+    runs are merged at once, so that the open files stay under the usual limit: with more runs,
+    groups of runs are first merged into longer runs, as many passes as needed. With `workers` above one,
+    runs are generated in that many processes, and `memory_limit` is shared between them.
+
+    Parameters
+    ----------
+    source : str | os.PathLike | Iterable[int|float]
+        A path to a file of binary records, or an iterable of numbers
+    output_path : str | os.PathLike
+        The file the sorted binary records are written to
+    memory_limit : int = DEFAULT_MEMORY_LIMIT
+        The approximate number of bytes the sort may use
+    temp_dir : str | None = None
+        The directory run files are spilled to, defaults to the system temporary directory
+    typecode : str = "q"
+        "q" for signed 64-bit integers, "d" for 64-bit floats
+    workers : int = 1
+        The number of processes used to generate runs
+
+    Returns
+    -------
+    int
+        The number of records written
+
+    Raises
+    ------
+    ValueError
+        If the typecode is unsupported, or the memory limit or number of workers is not positive
+    """
+    if typecode not in RUN_BYTES_PER_RECORD:
+        raise ValueError("typecode must be 'q' or 'd'")
+    if memory_limit < 1 or workers < 1:
+        raise ValueError("memory_limit and workers must be positive")
+    run_length = max(1, memory_limit // (RUN_BYTES_PER_RECORD[typecode] * workers))
+
+    with tempfile.TemporaryDirectory(prefix="external-sort-", dir=temp_dir) as run_dir:
+        if isinstance(source, (str, os.PathLike)):
+            record_count = os.path.getsize(source) // array(typecode).itemsize
+            tasks = [(source, start, min(run_length, record_count - start), typecode, run_dir)
+                     for start in range(0, record_count, run_length)]
+            run_paths = map_in_processes(sort_file_run, tasks, workers)
+        else:
+            records = iter(source)
+            run_paths = []
+            while True:
+                tasks = []
+                for _ in range(workers):
+                    values = array(typecode, islice(records, run_length))
+                    if values:
+                        tasks.append((values, run_dir))
+                if not tasks:
+                    break
+                run_paths.extend(map_in_processes(sort_run, tasks, workers))
+
+        fan_in = min(len(run_paths), MAX_MERGE_FAN_IN)
+        block_records = max(MIN_MERGE_BLOCK, memory_limit // (array(typecode).itemsize * (fan_in + 1)))
+        while len(run_paths) > MAX_MERGE_FAN_IN:
+            run_paths = merge_pass(run_paths, run_dir, typecode, block_records)
+        return merge_run_files(run_paths, output_path, typecode, block_records)
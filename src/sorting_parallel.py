@@ -0,0 +1,315 @@
+"""
+Multi-core sample sort built on the algorithms in `sorting`.
+
+The numbers are copied once into a `multiprocessing.shared_memory` buffer, and every worker
+process reads and writes that buffer directly, so no lists are pickled between processes.
+"""
+import random
+import time
+from array import array
+from bisect import bisect_right
+from multiprocessing import shared_memory
+
+from sorting import introsort, radix_sort_int64
+from workerpool import map_in_processes
+
+# Samples taken per bucket when choosing splitters, more samples give more even buckets
+OVERSAMPLING = 32
+# Below this many elements per worker the processes cost more than they save
+MIN_PARALLEL_LENGTH = 10_000
+
+
+def sort_values(values: array) -> array:
+    """
+    Sort an `array('q')` with `radix_sort_int64`, or an `array('d')` with `introsort`.
+
+    Parameters
+    ----------
+    values : array
+
+    Returns
+    -------
+    array
+        The sorted values, `values` itself for integer arrays
+    """
+    if values.typecode == "q":
+        radix_sort_int64(values)
+        return values
+    numbers = values.tolist()
+    introsort(numbers)
+    return array(values.typecode, numbers)
+
+
+def count_buckets(source_name: str, typecode: str, start: int, stop: int, splitters: list) -> list[int]:
+    """
+    Count how many elements of `source[start:stop]` fall into each bucket.
+
+    Parameters
+    ----------
+    source_name : str
+        The name of the shared memory block holding the input
+    typecode : str
+    start : int
+    stop : int
+    splitters : list
+        The sorted bucket boundaries, bucket `b` holds values below `splitters[b]`
+
+    Returns
+    -------
+    list[int]
+        The number of elements in each of the `len(splitters) + 1` buckets
+    """
+    block = shared_memory.SharedMemory(name=source_name)
+    source = block.buf.cast(typecode)
+    try:
+        counts = [0] * (len(splitters) + 1)
+        for value in source[start:stop]:
+            counts[bisect_right(splitters, value)] += 1
+        return counts
+    finally:
+        source.release()
+        block.close()
+
+
+def scatter_buckets(source_name: str, target_name: str, typecode: str, start: int, stop: int,
+                    splitters: list, offsets: list[int]) -> None:
+    """
+    Copy each element of `source[start:stop]` to the next free slot of its bucket in `target`.
+
+    Parameters
+    ----------
+    source_name : str
+        The name of the shared memory block holding the input
+    target_name : str
+        The name of the shared memory block holding the bucketed output
+    typecode : str
+    start : int
+    stop : int
+    splitters : list
+    offsets : list[int]
+        The first slot of `target` reserved for this chunk in each bucket
+
+    Returns
+    -------
+    None
+    """
+    source_block = shared_memory.SharedMemory(name=source_name)
+    target_block = shared_memory.SharedMemory(name=target_name)
+    source = source_block.buf.cast(typecode)
+    target = target_block.buf.cast(typecode)
+    try:
+        offsets = list(offsets)
+        for value in source[start:stop]:
+            bucket = bisect_right(splitters, value)
+            target[offsets[bucket]] = value
+            offsets[bucket] += 1
+    finally:
+        source.release()
+        target.release()
+        source_block.close()
+        target_block.close()
+
+
+def sort_bucket(target_name: str, typecode: str, start: int, stop: int) -> None:
+    """
+    Sort `target[start:stop]` in place with `sort_values`.
+
+    Parameters
+    ----------
+    target_name : str
+        The name of the shared memory block holding the bucketed output
+    typecode : str
+    start : int
+    stop : int
+
+    Returns
+    -------
+    None
+    """
+    block = shared_memory.SharedMemory(name=target_name)
+    target = block.buf.cast(typecode)
+    try:
+        target[start:stop] = sort_values(array(typecode, target[start:stop].tobytes()))
+    finally:
+        target.release()
+        block.close()
+
+
+def choose_splitters(numbers: list[int | float] | array, buckets: int) -> list[int | float]:
+    """
+    Choose `buckets - 1` splitters from a random sample of `numbers`.
+
+    Parameters
+    ----------
+    numbers : list[int|float] | array
+    buckets : int
+
+    Returns
+    -------
+    list[int|float]
+        The sorted splitters
+    """
+    sample = [numbers[i] for i in random.sample(range(len(numbers)), min(len(numbers), buckets * OVERSAMPLING))]
+    introsort(sample)
+    return [sample[b * len(sample) // buckets] for b in range(1, buckets)]
+
+
+def list_typecode(numbers: list[int | float]) -> str | None:
+    """
+    Return the array typecode that holds every element of a list exactly, if there is one.
+
+    Parameters
+    ----------
+    numbers : list[int|float]
+
+    Returns
+    -------
+    str | None
+        "q" if every element is an int that fits in 64 bits, "d" if every element is a float,
+        or None for mixed, oversized or non-numeric elements, and for subclasses such as bool
+    """
+    if all(type(number) is int for number in numbers):
+        if not numbers or -2 ** 63 <= min(numbers) and max(numbers) < 2 ** 63:
+            return "q"
+        return None
+    if all(type(number) is float for number in numbers):
+        return "d"
+    return None
+
+
+def parallel_sort(numbers: list[int | float] | array, workers: int = 4) -> None:
+    """
+    Sort a list of numbers in-place using a parallel sample sort.
+
+    1. `workers - 1` splitters are chosen from a random sample, splitting the value range
+       into one bucket per worker.
+    2. Each worker counts its chunk of the input per bucket, and the counts give every
+       (chunk, bucket) pair its own slice of the output buffer.
+    3. Each worker scatters its chunk into those slices.
+    4. Each worker sorts one bucket with the package's sorts (`sort_values`). Buckets are
+       already in order, so the sorted buffer is the concatenation of the sorted buckets.
+
+    A list of ints is sorted as signed 64-bit values and a list of floats as 64-bit floats.
+    Input and output travel through shared memory, and the process that calls this only
+    copies the numbers in and out. A list that no typed array holds exactly, such as a mix of
+    ints and floats, is sorted with `introsort` in this process instead, so that no element
+    changes value or type.
+
+    Parameters
+    ----------
+    numbers : list[int|float] | array
+        A list or an `array('q')`/`array('d')`, sorted in-place
+    workers : int = 4
+        The number of worker processes, and of buckets
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If `workers` is less than one
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if isinstance(numbers, array):
+        typecode = numbers.typecode
+    else:
+        typecode = list_typecode(numbers)
+        if typecode is None:
+            introsort(numbers)
+            return
+    if workers == 1 or len(numbers) < workers * MIN_PARALLEL_LENGTH:
+        values = sort_values(array(typecode, numbers))
+        numbers[:] = values.tolist() if isinstance(numbers, list) else values
+        return
+
+    length = len(numbers)
+    itemsize = array(typecode).itemsize
+    source_block = shared_memory.SharedMemory(create=True, size=length * itemsize)
+    target_block = shared_memory.SharedMemory(create=True, size=length * itemsize)
+    source = source_block.buf.cast(typecode)
+    target = target_block.buf.cast(typecode)
+    try:
+        source[:] = numbers if isinstance(numbers, array) else array(typecode, numbers)
+        splitters = choose_splitters(numbers, workers)
+        chunks = [(length * w // workers, length * (w + 1) // workers) for w in range(workers)]
+
+        counts = map_in_processes(
+            count_buckets,
+            [(source_block.name, typecode, start, stop, splitters) for start, stop in chunks],
+            workers,
+        )
+        # Bucket b starts after all smaller buckets, and chunk c's slice of it after chunks 0..c-1
+        offsets = [[0] * workers for _ in chunks]
+        bucket_bounds = []
+        position = 0
+        for bucket in range(workers):
+            bucket_start = position
+            for chunk in range(len(chunks)):
+                offsets[chunk][bucket] = position
+                position += counts[chunk][bucket]
+            bucket_bounds.append((bucket_start, position))
+
+        map_in_processes(
+            scatter_buckets,
+            [(source_block.name, target_block.name, typecode, start, stop, splitters, offsets[chunk])
+             for chunk, (start, stop) in enumerate(chunks)],
+            workers,
+        )
+        map_in_processes(
+            sort_bucket,
+            [(target_block.name, typecode, start, stop) for start, stop in bucket_bounds],
+            workers,
+        )
+        numbers[:] = target.tolist() if isinstance(numbers, list) else array(typecode, target.tobytes())
+    finally:
+        source.release()
+        target.release()
+        source_block.close()
+        source_block.unlink()
+        target_block.close()
+        target_block.unlink()
+
+
+def scaling_report(length: int = 1_000_000, worker_counts: tuple[int, ...] = (1, 2, 4, 8, 16, 32),
+                   typecode: str = "q") -> list[dict]:
+    """
+    Time `parallel_sort` on the same random input for each worker count.
+
+    Parameters
+    ----------
+    length : int = 1_000_000
+        The number of elements to sort
+    worker_counts : tuple[int, ...] = (1, 2, 4, 8, 16, 32)
+    typecode : str = "q"
+        "q" to sort random integers, "d" to sort random floats
+
+    Returns
+    -------
+    list[dict]
+        One entry per worker count with the keys "workers", "seconds" and "speedup",
+        where the speedup is relative to the first worker count
+    """
+    if typecode == "q":
+        data = [random.randint(-2**63, 2**63 - 1) for _ in range(length)]
+    else:
+        data = [random.random() for _ in range(length)]
+    report = []
+    for workers in worker_counts:
+        numbers = data[:]
+        start = time.perf_counter()
+        parallel_sort(numbers, workers)
+        seconds = time.perf_counter() - start
+        report.append({
+            "workers": workers,
+            "seconds": seconds,
+            "speedup": report[0]["seconds"] / seconds if report else 1.0,
+        })
+    return report
+
+
+if __name__ == "__main__":
+    for row in scaling_report():
+        print(f"{row['workers']:>3} workers: {row['seconds']:8.3f} s  speedup {row['speedup']:5.2f}x")
@@ -1,7 +1,11 @@
 """
 Implementation of the Stack abstract data type (ADT).
 """
-from typing import Any
+from array import array
+from typing import Any, Iterable
+
+# The capacity an unbounded NumericStack starts with
+MIN_CAPACITY = 16
 
 class Stack:
     """
@@ -134,3 +138,246 @@ class Stack:
         bool
         """
         return not self.stack_list
+
+
+class NumericStack:
+    """
+    A stack of numbers kept unboxed in a typed array, `array('q')` or `array('d')`.
+
+    Each item costs 8 bytes in the array, against an 8-byte list slot plus a boxed int or float
+    for `Stack`. The array is allocated up front, to max_length for a bounded stack, and `length`
+    counts the slots in use, so a push checks a single bound: the capacity of the array. An
+    unbounded stack doubles its capacity when it runs out and never shrinks, since a stack that
+    grew once is likely to grow again. `push_many` and `pop_many` move a whole slice at a time.
+
+    Methods
+    -------
+    __init__(typecode="q", max_length=-1)
+        Initialize a stack, optionally with a maximum length to create a bounded stack.
+    push(item)
+        Push an item onto the top of the stack, provided it doesn't exceed the given bound.
+    push_many(items)
+        Push items onto the stack in order, so the last one ends up on top.
+    pop()
+        Remove and return the item at the top of the stack.
+    pop_many(count)
+        Remove and return the top count items, top first.
+    peek()
+        Returns the value of the item on top of the stack, but does not remove it.
+    get_length()
+        Return the number of items in the stack.
+    is_empty()
+        Check if the stack is empty.
+    reserve(length)
+        Make room for at least length items.
+
+    Attributes
+    ----------
+    stack_array : array
+        The preallocated items, of which the first `length` are in the stack
+    length : int
+    max_length : int
+        The maximum number of items, or -1 for an unbounded stack
+    """
+    __slots__ = ("stack_array", "length", "max_length")
+
+    def __init__(self, typecode: str = "q", max_length: int = -1) -> None:
+        """
+        Initialize a stack, optionally with a maximum length to create a bounded stack.
+
+        Parameters
+        ----------
+        typecode : str = "q"
+            "q" for signed 64-bit integers, "d" for floats
+        max_length : int = -1
+            The optional maximum length of the stack
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the typecode is not "q" or "d", or the provided max_length is less than -1
+        """
+        if typecode not in ("q", "d"):
+            raise ValueError("typecode must be 'q' or 'd'")
+        if max_length < -1:
+            raise ValueError("max_length must be -1 (for unbounded) or a non-negative integer")
+        self.max_length = max_length
+        capacity = MIN_CAPACITY if max_length < 0 else max_length
+        self.stack_array = array(typecode, bytes(capacity * array(typecode).itemsize))
+        self.length = 0
+
+    def reserve(self, length: int) -> None:
+        """
+        Make room for at least length items, doubling the capacity of an unbounded stack.
+
+        Parameters
+        ----------
+        length : int
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        OverflowError
+            If length exceeds the maximum length of a bounded stack
+        """
+        capacity = len(self.stack_array)
+        if length <= capacity:
+            return
+        if self.max_length >= 0:
+            raise OverflowError("Stack is full")
+        while capacity < length:
+            capacity *= 2
+        self.stack_array.frombytes(bytes((capacity - len(self.stack_array)) * self.stack_array.itemsize))
+
+    def push(self, item: int | float) -> None:
+        """
+        Push an item onto the top of the stack, provided it doesn't exceed the given bound.
+
+        Parameters
+        ----------
+        item : int | float
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        OverflowError
+            If the stack is full, or an integer item does not fit in 64 bits
+        """
+        length = self.length
+        if length == len(self.stack_array):
+            self.reserve(length + 1)
+        self.stack_array[length] = item
+        self.length = length + 1
+
+    def push_many(self, items: Iterable[int | float]) -> None:
+        """
+        Push items onto the stack in order, so the last one ends up on top.
+
+        The items are written with one slice assignment. If they do not all fit in a bounded
+        stack, none of them are pushed.
+
+        Parameters
+        ----------
+        items : Iterable[int | float]
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        OverflowError
+            If the items would exceed the maximum length, or an integer item does not fit in 64 bits
+        """
+        if not isinstance(items, array) or items.typecode != self.stack_array.typecode:
+            items = array(self.stack_array.typecode, items)
+        length = self.length
+        self.reserve(length + len(items))
+        self.stack_array[length:length + len(items)] = items
+        self.length = length + len(items)
+
+    def pop(self) -> int | float:
+        """
+        Remove and return the item at the top of the stack.
+
+        Returns
+        -------
+        int | float
+
+        Raises
+        ------
+        IndexError
+            If the stack is empty
+        """
+        length = self.length - 1
+        if length < 0:
+            raise IndexError("Cannot pop from an empty stack")
+        self.length = length
+        return self.stack_array[length]
+
+    def pop_many(self, count: int) -> array:
+        """
+        Remove and return the top count items, in the order pop would return them.
+
+        Parameters
+        ----------
+        count : int
+
+        Returns
+        -------
+        array
+            The items, top first, in an array of the stack's typecode
+
+        Raises
+        ------
+        ValueError
+            If count is negative
+        IndexError
+            If the stack holds fewer than count items
+        """
+        if count < 0:
+            raise ValueError("count must be a non-negative integer")
+        if count > self.length:
+            raise IndexError("Cannot pop more items than the stack holds")
+        length = self.length - count
+        items = self.stack_array[length:self.length]
+        items.reverse()
+        self.length = length
+        return items
+
+    def peek(self) -> int | float:
+        """
+        Returns the value of the item on top of the stack, but does not remove it.
+
+        Returns
+        -------
+        int | float
+
+        Raises
+        ------
+        IndexError
+            If the stack is empty
+        """
+        if self.length == 0:
+            raise IndexError("Cannot peek from an empty stack")
+        return self.stack_array[self.length - 1]
+
+    def get_length(self) -> int:
+        """
+        Return the number of items in the stack.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def __len__(self) -> int:
+        """
+        Override __len__ method to allow users to call `len(stack)`.
+
+        Returns
+        -------
+        int
+        """
+        return self.length
+
+    def is_empty(self) -> bool:
+        """
+        Check if the stack is empty.
+
+        Returns
+        -------
+        bool
+        """
+        return self.length == 0
@@ -10,11 +10,26 @@ class Stack:
     """
     Implementation of the Stack abstract data type.
 
+    With a node pool, popped nodes are kept on a free list, linked through their `next`
+    attributes, and push takes a node from the free list before allocating a new one. A stack
+    that is repeatedly pushed and popped then reuses the same nodes instead of churning the
+    allocator. A node pushed directly is pooled as well once popped, so callers must not keep
+    using it.
+
     Methods
     -------
-
+    push(new_item)
+        Add a new item to the front of the stack.
+    pop()
+        Remove the node from the front of the stack and return its data.
+    peek()
+        Return the value of the node at the front of the stack.
+    get_length()
+        Return the number of nodes in the stack.
+    is_empty()
+        Check if the stack is empty.
     """
-    def __init__(self, max_length: int = -1):
+    def __init__(self, max_length: int = -1, pool_size: int = 0):
         """
         Initialize a stack, optionally with a maximum length to create a bounded stack.
 
@@ -25,6 +40,8 @@ class Stack:
         ----------
         max_length : int = -1
             The optional maximum length of the stack
+        pool_size : int = 0
+            The most popped nodes to keep for reuse, 0 for no pool or -1 for no limit
 
         Returns
         -------
@@ -33,13 +50,19 @@ class Stack:
         Raises
         ------
         ValueError
-            If the provided max_length is less than -1
+            If the provided max_length or pool_size is less than -1
         """
         if max_length < -1:
             raise ValueError("max_length must be -1 (for unbounded) or a non-negative integer")
+        if pool_size < -1:
+            raise ValueError("pool_size must be -1 (for unbounded) or a non-negative integer")
         self._max_length = max_length
         self._list = LinkedList()
         self._size = 0
+        self._pool_size = pool_size
+        # The free list of popped nodes, linked through `next`
+        self._pool = None
+        self._pool_length = 0
 
     def is_empty(self) -> bool:
         """
@@ -72,12 +95,19 @@ class Stack:
         """
         if self._max_length != -1 and len(self) >= self._max_length:
             raise OverflowError("Stack has reached its maximum capacity")
-        if not isinstance(new_item, Node):
-            self._list.prepend(Node(new_item))
-            self._size += 1
+        if isinstance(new_item, Node):
+            node = new_item
+        elif self._pool is not None:
+            node = self._pool
+            self._pool = node.next
+            self._pool_length -= 1
+            node.data = new_item
+            # prepend only sets `next` on a non-empty list
+            node.next = None
         else:
-            self._list.prepend(new_item)
-            self._size += 1
+            node = Node(new_item)
+        self._list.prepend(node)
+        self._size += 1
 
     def pop(self) -> Any:
         """
@@ -94,9 +124,16 @@ class Stack:
         """
         if self.is_empty():
             raise ValueError("Stack is empty")
-        popped_item = self._list.head.data
+        node = self._list.head
+        popped_item = node.data
         self._list.remove_after()
         self._size -= 1
+        if self._pool_length != self._pool_size:
+            # Drop the reference to the item so the pool does not keep it alive
+            node.data = None
+            node.next = self._pool
+            self._pool = node
+            self._pool_length += 1
         return popped_item
 
     def peek(self) -> Any:
@@ -147,4 +184,14 @@ if __name__ == "__main__":
     stack.push(3)
     assert len(stack) == 3
     stack.pop()
-    assert len(stack) == 2
\ No newline at end of file
+    assert len(stack) == 2
+
+    pooled_stack = Stack(pool_size=2)
+    for item in range(4):
+        pooled_stack.push(item)
+    for item in reversed(range(4)):
+        assert pooled_stack.pop() == item
+    assert pooled_stack.is_empty()
+    pooled_stack.push(5)
+    pooled_stack.push(6)
+    assert pooled_stack.pop() == 6 and pooled_stack.peek() == 5
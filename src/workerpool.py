@@ -0,0 +1,90 @@
+"""
+Run a function over a list of tasks in worker processes.
+
+`concurrent.futures.ProcessPoolExecutor` and `multiprocessing.Pool` both import the standard
+library `queue` module, which `queue.py` in this directory shadows whenever these modules are
+run from here. This helper only relies on `multiprocessing.Process` and pipes, which do not.
+"""
+from multiprocessing import Pipe, Process
+from typing import Any, Callable
+
+
+def run_tasks(function: Callable, tasks: list[tuple], connection) -> None:
+    """
+    Call `function(*task)` for every task and send the results back through `connection`.
+
+    Parameters
+    ----------
+    function : Callable
+    tasks : list[tuple]
+        The argument tuples for each call
+    connection : multiprocessing.connection.Connection
+        The sending end of the pipe back to the parent process
+
+    Returns
+    -------
+    None
+    """
+    try:
+        connection.send((True, [function(*task) for task in tasks]))
+    except Exception as error:
+        connection.send((False, error))
+    finally:
+        connection.close()
+
+
+def map_in_processes(function: Callable, tasks: list[tuple], workers: int) -> list[Any]:
+    """
+    Call `function(*task)` for every task, spread over up to `workers` processes.
+
+    Tasks are split into contiguous chunks, one chunk per process, and the results are
+    returned in task order. With one worker, or a single task, everything runs in the
+    current process.
+
+    Parameters
+    ----------
+    function : Callable
+        A module-level function, so it can be sent to the worker processes
+    tasks : list[tuple]
+        The argument tuples for each call
+    workers : int
+        The maximum number of processes to start
+
+    Returns
+    -------
+    list[Any]
+        The return value of each call, in the order of `tasks`
+
+    Raises
+    ------
+    Exception
+        The first exception raised by a task is re-raised once every worker has finished
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [function(*task) for task in tasks]
+
+    chunk_size = -(-len(tasks) // min(workers, len(tasks)))
+    processes = []
+    receivers = []
+    for start in range(0, len(tasks), chunk_size):
+        receiver, sender = Pipe(duplex=False)
+        process = Process(target=run_tasks, args=(function, tasks[start:start + chunk_size], sender))
+        process.start()
+        sender.close()
+        processes.append(process)
+        receivers.append(receiver)
+
+    results = []
+    error = None
+    for receiver in receivers:
+        succeeded, payload = receiver.recv()
+        receiver.close()
+        if succeeded:
+            results.extend(payload)
+        elif error is None:
+            error = payload
+    for process in processes:
+        process.join()
+    if error is not None:
+        raise error
+    return results